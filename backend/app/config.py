@@ -42,6 +42,31 @@ class Settings:
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-5-mini")
     CONTEXT_MAX_LENGTH: int = int(os.getenv("CONTEXT_MAX_LENGTH", "500"))
 
+    # Twitter 스크래핑 결과 캐시 (초)
+    TWITTER_CACHE_TTL: int = int(os.getenv("TWITTER_CACHE_TTL", "900"))
+    TWITTER_NEGATIVE_CACHE_TTL: int = int(os.getenv("TWITTER_NEGATIVE_CACHE_TTL", "30"))
+
+    # 트윗 ID가 없는 Twitter/X URL(프로필, 검색 등)은 브라우저를 띄우지 않고 바로 실패 처리
+    TWITTER_STRICT_TWEET_ONLY: bool = os.getenv("TWITTER_STRICT_TWEET_ONLY", "false").lower() == "true"
+
+    # URL 콘텐츠 가져오기 결과 캐시 (초, 실패 결과는 짧게)
+    URL_CACHE_TTL: int = int(os.getenv("URL_CACHE_TTL", "3600"))
+    URL_NEGATIVE_CACHE_TTL: int = int(os.getenv("URL_NEGATIVE_CACHE_TTL", "300"))
+
+    # Twitter 동시 요청 제한 (리소스별 bulkhead)
+    TWITTER_SYNDICATION_CONCURRENCY: int = int(os.getenv("TWITTER_SYNDICATION_CONCURRENCY", "20"))
+    TWITTER_PLAYWRIGHT_CONCURRENCY: int = int(os.getenv("TWITTER_PLAYWRIGHT_CONCURRENCY", "2"))
+
+    # 공유 HTTP 클라이언트 기본 타임아웃 (초, 단계별)
+    # pool: 커넥션 풀이 가득 찼을 때 대기 시간 (짧게 두어 적체 대신 빠르게 실패)
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "2.0"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "8.0"))
+    HTTP_WRITE_TIMEOUT: float = float(os.getenv("HTTP_WRITE_TIMEOUT", "2.0"))
+    HTTP_POOL_TIMEOUT: float = float(os.getenv("HTTP_POOL_TIMEOUT", "1.0"))
+
+    # 서버 시작 시 Playwright 워커(브라우저) 미리 실행
+    PLAYWRIGHT_PREWARM: bool = os.getenv("PLAYWRIGHT_PREWARM", "false").lower() == "true"
+
 
 @lru_cache
 def get_settings() -> Settings:
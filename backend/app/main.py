@@ -15,6 +15,10 @@ from fastapi.staticfiles import StaticFiles
 from app.api import auth_router, memo_comments_router, permanent_notes_router, temp_memos_router
 from app.config import settings
 from app.database import init_db
+from app.services.browser_pool import close_browser_pool, prewarm_browser_pool
+from app.services.http_client import close_http_client
+from app.services.twitter_playwright import worker_pool
+from app.services.url_fetcher import shutdown_process_pool
 
 # 프론트엔드 정적 파일 경로 (프로덕션)
 STATIC_DIR = Path(__file__).parent.parent.parent / "static"
@@ -85,8 +89,19 @@ async def lifespan(app: FastAPI):
     init_db()
     logger.info("Database initialized")
 
+    # Playwright 워커 / JS 렌더링용 브라우저 예열 (브라우저 콜드 스타트 제거)
+    if settings.PLAYWRIGHT_PREWARM:
+        worker_pool.prewarm()
+        await prewarm_browser_pool()
+        logger.info("Playwright workers prewarmed")
+
     yield
 
+    # 공유 HTTP 클라이언트 / 브라우저 풀 / 상주 Playwright 워커 / 본문 추출 프로세스 풀 종료
+    await close_http_client()
+    await close_browser_pool()
+    worker_pool.shutdown()
+    shutdown_process_pool()
     logger.info("MyRottenApple 서버 종료")
 
 
@@ -0,0 +1,226 @@
+"""
+공유 Chromium 브라우저 풀
+
+Unix Philosophy: Modularity - 브라우저 수명 관리만 담당
+- 요청마다 Playwright 드라이버/Chromium을 새로 띄우지 않고 브라우저를 재사용
+- 요청마다 새 BrowserContext를 발급하고 반납 시 닫음 (쿠키/스토리지 격리)
+- Playwright 객체는 생성한 이벤트 루프에 묶이므로 루프별로 풀을 보관
+  (BackgroundTasks는 작업마다 새 이벤트 루프를 사용)
+- 일정 횟수 사용한 브라우저는 교체하여 메모리 증가를 제한
+- 루프 종료 전 close_browser_pool()로 정리
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Playwright 미설치 환경에서도 모듈 import는 가능하도록 처리 (모듈 로드 시 한 번만 확인)
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PlaywrightTimeoutError = None
+    async_playwright = None
+    PLAYWRIGHT_AVAILABLE = False
+
+# 브라우저 하나당 컨텍스트 발급 횟수 상한 (넘으면 새 브라우저로 교체)
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+# 루프당 동시에 열어 둘 수 있는 컨텍스트 수
+BROWSER_POOL_MAX_CONTEXTS = 4
+
+# 브라우저 종류별 실행 옵션
+# - default: JS 렌더링용 (컨테이너의 작은 /dev/shm, root 실행 환경 대응)
+# - stealth: Cloudflare 우회용 (자동화 흔적 제거)
+BROWSER_LAUNCH_OPTIONS: dict[str, dict[str, Any]] = {
+    "default": {
+        "headless": True,
+        "args": ["--no-sandbox", "--disable-dev-shm-usage"],
+    },
+    "stealth": {
+        "headless": True,
+        "args": [
+            "--disable-blink-features=AutomationControlled",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+            "--disable-web-security",
+            "--disable-features=IsolateOrigins,site-per-process",
+        ],
+        "chromium_sandbox": False,
+    },
+}
+
+
+@dataclass
+class _PooledBrowser:
+    """풀에 보관된 브라우저와 사용 현황"""
+
+    browser: Any
+    issued: int = 0  # 발급한 컨텍스트 수
+    active: int = 0  # 아직 반납되지 않은 컨텍스트 수
+
+    @property
+    def retired(self) -> bool:
+        """교체 대상 여부 (발급 상한 도달 또는 연결 끊김)"""
+        return self.issued >= BROWSER_POOL_RECYCLE_AFTER or not self.browser.is_connected()
+
+
+@dataclass
+class _BrowserPool:
+    """이벤트 루프 하나에 묶인 브라우저 풀"""
+
+    playwright: Any = None
+    browsers: dict[str, _PooledBrowser] = field(default_factory=dict)
+    owners: dict[Any, _PooledBrowser] = field(default_factory=dict)
+    semaphore: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(BROWSER_POOL_MAX_CONTEXTS)
+    )
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def _browser(self, kind: str) -> _PooledBrowser:
+        """종류별 브라우저 반환 (없거나 교체 대상이면 새로 실행)"""
+        async with self.lock:
+            pooled = self.browsers.get(kind)
+            if pooled is not None and not pooled.retired:
+                return pooled
+
+            if pooled is not None:
+                self.browsers.pop(kind)
+                if pooled.active == 0:
+                    await _close_quietly(pooled.browser)
+
+            if self.playwright is None:
+                if not PLAYWRIGHT_AVAILABLE:
+                    raise ImportError("playwright 패키지가 설치되지 않았습니다")
+                self.playwright = await async_playwright().start()
+
+            browser = await self.playwright.chromium.launch(**BROWSER_LAUNCH_OPTIONS[kind])
+            logger.info(f"[BrowserPool] Chromium 실행: kind={kind}")
+            pooled = _PooledBrowser(browser)
+            self.browsers[kind] = pooled
+            return pooled
+
+    async def acquire(self, kind: str = "default", **context_options):
+        """
+        새 BrowserContext 발급
+
+        Args:
+            kind: BROWSER_LAUNCH_OPTIONS의 브라우저 종류
+            **context_options: browser.new_context에 전달할 옵션
+
+        Returns:
+            BrowserContext (사용 후 release로 반납)
+        """
+        await self.semaphore.acquire()
+        try:
+            pooled = await self._browser(kind)
+            context = await pooled.browser.new_context(**context_options)
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+        pooled.issued += 1
+        pooled.active += 1
+        self.owners[context] = pooled
+        return context
+
+    async def release(self, context) -> None:
+        """컨텍스트 닫고 반납 (교체 대상 브라우저는 마지막 컨텍스트 반납 시 종료)"""
+        pooled = self.owners.pop(context, None)
+        try:
+            with contextlib.suppress(Exception):
+                await context.close()
+            if pooled is None:
+                return
+            pooled.active -= 1
+            if pooled.active == 0 and pooled not in self.browsers.values():
+                await _close_quietly(pooled.browser)
+        finally:
+            self.semaphore.release()
+
+    async def close(self) -> None:
+        """모든 브라우저와 Playwright 드라이버 종료"""
+        # 교체되어 풀에서 빠졌지만 아직 컨텍스트가 남은 브라우저도 함께 종료
+        browsers = {id(p.browser): p.browser for p in self.browsers.values()}
+        browsers.update((id(p.browser), p.browser) for p in self.owners.values())
+        for browser in browsers.values():
+            await _close_quietly(browser)
+        self.browsers.clear()
+        self.owners.clear()
+        if self.playwright is not None:
+            with contextlib.suppress(Exception):
+                await self.playwright.stop()
+            self.playwright = None
+
+
+async def _close_quietly(browser) -> None:
+    """브라우저 종료 (이미 닫혔으면 무시)"""
+    with contextlib.suppress(Exception):
+        await browser.close()
+
+
+# 이벤트 루프별 풀
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _BrowserPool] = (
+    weakref.WeakKeyDictionary()
+)
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool() -> _BrowserPool:
+    """
+    현재 이벤트 루프의 브라우저 풀 반환 (없으면 생성)
+
+    브라우저는 첫 acquire 시점에 실행됨
+    """
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pool = _pools.get(loop)
+        if pool is None:
+            pool = _BrowserPool()
+            _pools[loop] = pool
+        return pool
+
+
+@contextlib.asynccontextmanager
+async def browser_context(kind: str = "default", **context_options):
+    """
+    async with로 쓰는 컨텍스트 발급/반납
+
+    Example:
+        async with browser_context(user_agent=...) as context:
+            page = await context.new_page()
+    """
+    pool = get_browser_pool()
+    context = await pool.acquire(kind, **context_options)
+    try:
+        yield context
+    finally:
+        await pool.release(context)
+
+
+async def prewarm_browser_pool(kind: str = "default") -> None:
+    """현재 이벤트 루프의 브라우저를 미리 실행 (첫 요청의 콜드 스타트 제거)"""
+    try:
+        await get_browser_pool()._browser(kind)
+    except Exception as e:
+        logger.warning(f"[BrowserPool] 브라우저 예열 실패: {e}")
+
+
+async def close_browser_pool() -> None:
+    """현재 이벤트 루프의 브라우저 풀 종료"""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pool = _pools.pop(loop, None)
+    if pool is not None:
+        await pool.close()
+        logger.debug("[BrowserPool] 브라우저 풀 종료")
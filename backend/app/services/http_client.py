@@ -0,0 +1,155 @@
+"""
+공유 HTTP 클라이언트
+
+Unix Philosophy: Modularity - 커넥션 풀 관리만 담당
+- httpx.AsyncClient를 재사용하여 TLS 핸드셰이크/커넥션 풀 생성 비용 절감
+- BackgroundTasks는 작업마다 새 이벤트 루프를 사용하므로 루프별로 클라이언트를 보관
+- 루프 종료 전 close_http_client()로 정리
+- 일시적 실패(타임아웃/연결 끊김 등 전송 오류, 5xx, 429)는 지수 백오프로 재시도
+- 404/403 등 종료성 응답은 재시도하지 않고 바로 반환
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+
+from app.config import settings
+from app.utils import DEFAULT_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2는 h2 패키지가 있을 때만 사용
+try:
+    import h2  # noqa: F401
+
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+# 커넥션 풀 크기 (여러 사이트를 동시에 가져오므로 유휴 커넥션도 넉넉히 유지)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# 기본 타임아웃 (초, 단계별로 환경 변수에서 조정 가능)
+# 요청마다 다른 값이 필요하면 client.get(..., timeout=...)으로 지정
+HTTP_TIMEOUT = httpx.Timeout(
+    connect=settings.HTTP_CONNECT_TIMEOUT,
+    read=settings.HTTP_READ_TIMEOUT,
+    write=settings.HTTP_WRITE_TIMEOUT,
+    pool=settings.HTTP_POOL_TIMEOUT,
+)
+
+# 재시도 대상 상태 코드
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 재시도 대기 최대 시간 (초)
+MAX_RETRY_DELAY = 3.0
+
+# 이벤트 루프별 클라이언트
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프의 공유 클라이언트 반환 (없으면 생성)
+
+    Returns:
+        httpx.AsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT,
+                follow_redirects=True,
+                http2=HTTP2_ENABLED,
+                limits=HTTP_LIMITS,
+                headers={"User-Agent": DEFAULT_USER_AGENT},
+            )
+            _clients[loop] = client
+        return client
+
+
+async def close_http_client() -> None:
+    """현재 이벤트 루프의 공유 클라이언트 종료"""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.debug("[HTTP] 공유 클라이언트 종료")
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+    """
+    재시도 전 대기 시간 (초)
+
+    Retry-After 헤더가 있으면 따르고, 최대 대기 시간을 넘으면 재시도하지 않음(None)
+    없으면 지수 백오프 + 지터
+    """
+    if response is not None:
+        retry_after = response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= MAX_RETRY_DELAY else None
+        if response.status_code == 429:
+            return None
+    return backoff_delay(attempt)
+
+
+def backoff_delay(attempt: int) -> float:
+    """지수 백오프 + 지터 (초, 최대 MAX_RETRY_DELAY)"""
+    return min(2**attempt * 0.2 + random.random() * 0.1, MAX_RETRY_DELAY)
+
+
+async def get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: Optional[dict[str, str]] = None,
+    max_attempts: int = 3,
+    **kwargs,
+) -> httpx.Response:
+    """
+    GET 요청 (일시적 실패 시 재시도)
+
+    Args:
+        client: httpx.AsyncClient
+        url: 요청 URL
+        headers: 요청 헤더
+        max_attempts: 최대 시도 횟수
+        **kwargs: client.get에 전달할 추가 인자
+
+    Returns:
+        마지막 응답 (재시도 대상 상태 코드일 수 있음)
+
+    Raises:
+        httpx.TransportError: 마지막 시도까지 실패한 경우
+    """
+    for attempt in range(max_attempts - 1):
+        try:
+            response = await client.get(url, headers=headers, **kwargs)
+        except httpx.TransportError as e:
+            delay = _retry_delay(attempt)
+            logger.info(f"[HTTP] 재시도 {attempt + 1}/{max_attempts - 1} ({type(e).__name__}): {url}")
+        else:
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            delay = _retry_delay(attempt, response)
+            if delay is None:
+                return response
+            logger.info(f"[HTTP] 재시도 {attempt + 1}/{max_attempts - 1} (status={response.status_code}): {url}")
+
+        await asyncio.sleep(delay)
+
+    return await client.get(url, headers=headers, **kwargs)
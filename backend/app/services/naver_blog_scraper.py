@@ -14,10 +14,17 @@ import logging
 import random
 from dataclasses import dataclass
 from typing import Optional
-from urllib.parse import urlparse
+
+from app.utils import url_netloc
 
 logger = logging.getLogger(__name__)
 
+# Playwright 미설치 환경에서도 모듈 import는 가능하도록 처리 (모듈 로드 시 한 번만 확인)
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
 # 네이버 블로그 도메인
 NAVER_BLOG_DOMAINS: frozenset[str] = frozenset([
     "blog.naver.com",
@@ -34,11 +41,24 @@ CONTENT_SELECTORS = [
     "#viewTypeSelector",  # 대체 선택자
 ]
 
+# 텍스트/OG 메타 추출에 필요 없는 리소스 (OG 메타는 <head>에 있으므로 이미지 불필요)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
 # OG 메타데이터 선택자
 OG_TITLE_SELECTOR = 'meta[property="og:title"]'
 OG_IMAGE_SELECTOR = 'meta[property="og:image"]'
 OG_DESCRIPTION_SELECTOR = 'meta[property="og:description"]'
 
+# 선택자별 첫 요소의 innerText + body innerText를 한 번에 조회
+# (선택자마다 query_selector + inner_text 두 번씩 왕복하던 것을 한 번으로)
+_CONTENT_TEXTS_JS = """
+(selectors) => {
+    const texts = selectors.map(sel => document.querySelector(sel)?.innerText ?? null);
+    texts.push(document.body?.innerText ?? null);
+    return texts;
+}
+"""
+
 
 @dataclass
 class NaverBlogScrapingResult:
@@ -54,12 +74,7 @@ class NaverBlogScrapingResult:
 
 def is_naver_blog_url(url: str) -> bool:
     """네이버 블로그 URL인지 확인"""
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        return domain in NAVER_BLOG_DOMAINS
-    except Exception:
-        return False
+    return url_netloc(url) in NAVER_BLOG_DOMAINS
 
 
 async def human_like_delay(min_sec: float = 0.5, max_sec: float = 2.0) -> None:
@@ -68,6 +83,14 @@ async def human_like_delay(min_sec: float = 0.5, max_sec: float = 2.0) -> None:
     await asyncio.sleep(delay)
 
 
+async def _block_heavy_resources(route) -> None:
+    """본문 추출에 필요 없는 리소스 요청 차단"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 class NaverBlogScraper:
     """
     네이버 블로그 스크래핑 서비스
@@ -104,9 +127,7 @@ class NaverBlogScraper:
 
         logger.info(f"[NaverBlog] 스크래핑 시작: {url}")
 
-        try:
-            from playwright.async_api import async_playwright
-        except ImportError:
+        if async_playwright is None:
             logger.error("[NaverBlog] Playwright가 설치되지 않음")
             return NaverBlogScrapingResult(
                 success=False,
@@ -118,6 +139,7 @@ class NaverBlogScraper:
                 # Firefox 사용 (Railway 배포 환경 호환)
                 browser = await p.firefox.launch(
                     headless=self.headless,
+                    firefox_user_prefs={"permissions.default.image": 2},
                 )
 
                 # 실제 사용자처럼 보이는 컨텍스트
@@ -146,6 +168,9 @@ class NaverBlogScraper:
                     window.chrome = { runtime: {} };
                 """)
 
+                # 이미지/미디어/폰트 요청 차단
+                await context.route("**/*", _block_heavy_resources)
+
                 page = await context.new_page()
 
                 # 랜덤 딜레이 후 페이지 로드
@@ -231,30 +256,23 @@ class NaverBlogScraper:
         return None
 
     async def _extract_content(self, page) -> Optional[str]:
-        """본문 추출 (여러 선택자 시도)"""
-        for selector in CONTENT_SELECTORS:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    # 텍스트 추출
-                    text = await element.inner_text()
-                    if text and len(text.strip()) > 100:
-                        logger.info(f"[NaverBlog] 콘텐츠 추출 성공: selector={selector}")
-                        return text.strip()
-            except Exception as e:
-                logger.debug(f"[NaverBlog] 선택자 시도 실패: {selector}, error={e}")
-                continue
-
-        # 모든 선택자 실패 시 body 전체 텍스트 추출
+        """본문 추출 (선택자 후보 + body 텍스트를 evaluate 한 번으로 조회 후 우선순위대로 선택)"""
         try:
-            body = await page.query_selector("body")
-            if body:
-                text = await body.inner_text()
-                if text and len(text.strip()) > 100:
-                    logger.info("[NaverBlog] body 전체 텍스트 추출")
-                    return text.strip()
+            texts = await page.evaluate(_CONTENT_TEXTS_JS, CONTENT_SELECTORS)
         except Exception as e:
-            logger.error(f"[NaverBlog] body 추출 실패: {e}")
+            logger.error(f"[NaverBlog] 본문 추출 실패: {e}")
+            return None
+
+        for selector, text in zip(CONTENT_SELECTORS, texts):
+            if text and len(text.strip()) > 100:
+                logger.info(f"[NaverBlog] 콘텐츠 추출 성공: selector={selector}")
+                return text.strip()
+
+        # 모든 선택자 실패 시 body 전체 텍스트 사용
+        body_text = texts[-1] if len(texts) > len(CONTENT_SELECTORS) else None
+        if body_text and len(body_text.strip()) > 100:
+            logger.info("[NaverBlog] body 전체 텍스트 추출")
+            return body_text.strip()
 
         return None
 
@@ -16,6 +16,30 @@ from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+# <title> 태그 패턴
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+
+
+def _compile_meta_patterns(property_name: str) -> tuple[re.Pattern[str], ...]:
+    """property → content 순서와 content → property 순서의 메타 태그 패턴"""
+    escaped = re.escape(property_name)
+    return (
+        re.compile(
+            rf'<meta[^>]+property=["\']?{escaped}["\']?[^>]+content=["\']([^"\']+)["\']',
+            re.IGNORECASE,
+        ),
+        re.compile(
+            rf'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']?{escaped}["\']?',
+            re.IGNORECASE,
+        ),
+    )
+
+
+# 자주 쓰는 OG 속성 패턴 (모듈 로드 시 한 번만 컴파일)
+_META_PATTERNS = {
+    name: _compile_meta_patterns(name) for name in ("og:title", "og:image", "og:description")
+}
+
 
 @dataclass
 class OGMetadata:
@@ -46,7 +70,7 @@ def extract_og_metadata(html: str, base_url: str) -> Optional[OGMetadata]:
 
         # og:title이 없으면 <title> 태그에서 추출
         if not og_title:
-            title_match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
+            title_match = _TITLE_RE.search(html)
             if title_match:
                 og_title = title_match.group(1).strip()
 
@@ -68,6 +92,53 @@ def extract_og_metadata(html: str, base_url: str) -> Optional[OGMetadata]:
         return None
 
 
+def extract_og_metadata_from_tree(tree, base_url: str) -> Optional[OGMetadata]:
+    """
+    이미 파싱된 lxml 트리에서 OG 메타데이터 추출
+
+    본문 추출과 같은 트리를 공유하여 HTML을 한 번만 파싱할 때 사용
+    (extract_og_metadata와 같은 규칙: 각 속성의 첫 값, og:title 없으면 <title>)
+
+    Args:
+        tree: lxml.html 루트 요소
+        base_url: 기본 URL (상대 경로 해석용)
+
+    Returns:
+        OGMetadata 또는 None
+    """
+    try:
+        values: dict[str, str] = {}
+        for meta in tree.iterfind(".//meta[@property]"):
+            name = meta.get("property", "").strip().lower()
+            content = (meta.get("content") or "").strip()
+            if name in _META_PATTERNS and content and name not in values:
+                values[name] = content
+
+        og_title = values.get("og:title")
+        og_image = values.get("og:image")
+
+        if not og_title:
+            title = tree.findtext(".//title")
+            if title and title.strip():
+                og_title = title.strip()
+
+        if og_image and not og_image.startswith(("http://", "https://")):
+            og_image = urljoin(base_url, og_image)
+
+        if og_title or og_image:
+            return OGMetadata(
+                title=og_title,
+                image=og_image,
+                description=values.get("og:description"),
+            )
+
+        return None
+
+    except Exception as e:
+        logger.error(f"OG 메타데이터 추출 실패: {e}")
+        return None
+
+
 def _extract_meta_content(html: str, property_name: str) -> Optional[str]:
     """
     메타 태그에서 content 추출
@@ -79,13 +150,10 @@ def _extract_meta_content(html: str, property_name: str) -> Optional[str]:
     Returns:
         content 값 또는 None
     """
-    patterns = [
-        rf'<meta[^>]+property=["\']?{re.escape(property_name)}["\']?[^>]+content=["\']([^"\']+)["\']',
-        rf'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']?{re.escape(property_name)}["\']?',
-    ]
+    patterns = _META_PATTERNS.get(property_name) or _compile_meta_patterns(property_name)
 
     for pattern in patterns:
-        match = re.search(pattern, html, re.IGNORECASE)
+        match = pattern.search(html)
         if match:
             return match.group(1).strip()
 
@@ -7,102 +7,414 @@ Playwright 워커 스크립트 (동기 API)
 
 Usage:
     python playwright_worker.py <url> [timeout_ms]
+    python playwright_worker.py --serve [session_path] [state_path]
+
+--serve 모드는 브라우저/컨텍스트를 한 번만 띄워 두고 stdin으로 받은
+요청(JSON 한 줄)을 순서대로 처리하며, 결과를 JSON 한 줄씩 stdout에 출력합니다.
+세션 파일이 주어지면 컨텍스트 생성 시 한 번만 로드합니다.
+(storage_state JSON이면 쿠키 + localStorage, 쿠키 목록 JSON이면 쿠키만)
+로드한 세션에 auth_token 쿠키가 없고 TWITTER_USERNAME/TWITTER_PASSWORD가
+설정돼 있으면 요청을 받기 전에 한 번 로그인하고, 세션을 state_path에
+storage_state(쿠키 + localStorage)로 저장합니다.
 """
 
-import json
+import os
+import re
 import sys
-import time
+from typing import Optional
 
+import orjson
 
-def scrape_twitter(url: str, timeout: int = 90000) -> dict:
-    """Twitter URL 스크래핑 (동기 API)"""
-    result = {
+# Playwright 미설치 환경에서도 모듈 import는 가능하도록 처리
+try:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PlaywrightTimeoutError = None
+    sync_playwright = None
+    PLAYWRIGHT_AVAILABLE = False
+
+# 본문/OG 메타 추출에 필요 없는 리소스 (네트워크 요청 단계에서 차단)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Firefox 이미지 로딩 비활성화 (라우팅 차단과 함께 이중으로 적용)
+FIREFOX_USER_PREFS = {"permissions.default.image": 2}
+
+# 본문이 렌더링됐다고 볼 수 있는 셀렉터 (고정 sleep 대신 대기)
+CONTENT_SELECTOR = '[data-testid="tweetText"], [data-testid="TextFlowRoot"], article'
+
+# 아티클 링크 (고객센터 링크 제외)
+ARTICLE_LINK_SELECTOR = 'a[href*="/article/"]:not([href*="support.x.com"])'
+
+# 아티클 페이지 본문 셀렉터
+ARTICLE_SELECTOR = '[data-testid="twitterArticleRichTextView"], main article'
+
+# 앞뒤 공백을 뺀 길이가 10자를 넘는 줄 (공백 제거된 내용을 캡처)
+MEANINGFUL_LINE_RE = re.compile(r"^[^\S\n]*(\S[^\n]{9,}\S)[^\S\n]*$", re.MULTILINE)
+
+# 브라우저에서 넘겨받을 최대 텍스트 길이 (CDP 전송량 절감)
+# 아티클 원문은 짧은 줄을 걸러내므로 여유 있게 받음
+MAX_TEXT_LENGTH = 10000
+ARTICLE_TEXT_LIMIT = 20000
+
+# 셀렉터 대기 최대 시간 (ms)
+SELECTOR_TIMEOUT = 5000
+
+# 로그인 세션 쿠키 (있으면 로그인된 것으로 보고 홈 확인/로그인 생략)
+SESSION_COOKIE_NAME = "auth_token"
+
+# 로그인 페이지
+LOGIN_URL = "https://x.com/i/flow/login"
+
+# 로그인 완료 후 이동하는 홈 URL
+HOME_URL_RE = re.compile(r"x\.com/home")
+
+# 로그인 단계별 대기 최대 시간 (ms)
+LOGIN_TIMEOUT = 15000
+
+# 페이지에서 필요한 값을 한 번의 evaluate로 조회
+# - og:title / og:description / og:image
+# - 아티클 링크 href
+# - 트윗 텍스트 (최대 5개), 없으면 main 영역 텍스트
+PAGE_INFO_JS = """
+({linkSelector, limit}) => {
+    const get = p => document.querySelector(`meta[property="${p}"]`)?.content || null;
+    const link = document.querySelector(linkSelector);
+    const tweets = Array.from(document.querySelectorAll('[data-testid="tweetText"]'))
+        .slice(0, 5)
+        .map(el => el.innerText || '')
+        .filter(Boolean)
+        .map(text => text.trim());
+
+    let mainText = null;
+    if (!tweets.length) {
+        const main = document.querySelector('main') || document.body;
+        const clone = main.cloneNode(true);
+        ['script', 'style', 'noscript', 'nav', 'header', 'footer']
+            .forEach(sel => clone.querySelectorAll(sel).forEach(el => el.remove()));
+        mainText = (clone.innerText || '').trim().slice(0, limit);
+    }
+
+    return {
+        title: get('og:title'),
+        description: get('og:description'),
+        image: get('og:image'),
+        article_href: link ? link.getAttribute('href') : null,
+        tweets: tweets,
+        main_text: mainText,
+    };
+}
+"""
+
+# 컨텍스트 생성 시 한 번만 주입하는 추출 함수 (매 요청마다 스크립트 원문 전송/파싱 생략)
+PAGE_INFO_INIT_SCRIPT = f"window.__zentelPageInfo = {PAGE_INFO_JS.strip()};"
+
+# 주입된 추출 함수 호출 (없으면 null → PAGE_INFO_JS로 재시도)
+PAGE_INFO_CALL_JS = "(args) => window.__zentelPageInfo ? window.__zentelPageInfo(args) : null"
+
+
+def _empty_result() -> dict:
+    """기본 결과 딕셔너리"""
+    return {
         "content": "",
         "og_title": None,
         "og_image": None,
         "og_description": None,
         "success": False,
         "error": None,
+        "status": None,
     }
 
+
+def scrape_twitter(url: str, timeout: int = 90000) -> dict:
+    """Twitter URL 스크래핑 (동기 API, 1회성 브라우저)"""
     try:
-        from playwright.sync_api import sync_playwright
+        _require_playwright()
 
         with sync_playwright() as p:
             # Firefox 사용 (Chromium은 X.com에서 봇 감지로 차단됨)
-            browser = p.firefox.launch(headless=True)
-            page = browser.new_page()
+            browser = p.firefox.launch(headless=True, firefox_user_prefs=FIREFOX_USER_PREFS)
+            context = browser.new_context()
+            _prepare_context(context)
+            page = context.new_page()
+            result = scrape_page(page, url, timeout)
+            browser.close()
+            return result
+
+    except Exception as e:
+        result = _empty_result()
+        result["error"] = str(e)
+        return result
+
+
+def _require_playwright() -> None:
+    """Playwright 미설치 시 ImportError"""
+    if not PLAYWRIGHT_AVAILABLE:
+        raise ImportError("playwright 패키지가 설치되지 않았습니다")
+
+
+def _prepare_context(context) -> None:
+    """컨텍스트 공통 설정 (리소스 차단 + 추출 함수 주입)"""
+    _block_heavy_resources(context)
+    context.add_init_script(script=PAGE_INFO_INIT_SCRIPT)
+
+
+def _evaluate_page_info(page) -> dict:
+    """주입된 추출 함수로 페이지 정보 조회 (주입되지 않은 페이지면 스크립트 원문으로 재시도)"""
+    args = {"linkSelector": ARTICLE_LINK_SELECTOR, "limit": MAX_TEXT_LENGTH}
+    info = page.evaluate(PAGE_INFO_CALL_JS, args)
+    if info is None:
+        info = page.evaluate(PAGE_INFO_JS, args)
+    return info
+
+
+def _block_heavy_resources(context) -> None:
+    """이미지/미디어/폰트/스타일시트 요청 차단"""
+    context.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+        else route.continue_(),
+    )
+
+
+def _wait_for_content(page, selector: str, timeout: int = SELECTOR_TIMEOUT) -> None:
+    """셀렉터가 붙을 때까지 대기 (타임아웃이면 그대로 진행)"""
+    try:
+        page.wait_for_selector(selector, timeout=timeout, state="attached")
+    except PlaywrightTimeoutError:
+        pass
+
+
+def _load_session(session_path: Optional[str]):
+    """
+    세션 파일 로드 (실패 시 None)
+
+    Returns:
+        storage_state 딕셔너리 또는 (이전 형식) 쿠키 목록
+    """
+    if not session_path or not os.path.exists(session_path):
+        return None
+
+    try:
+        with open(session_path, "rb") as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        print(f"세션 로드 실패: {e}", file=sys.stderr)
+        return None
 
-            # 대상 URL로 이동
-            page.goto(url, timeout=timeout, wait_until="load")
-            page.wait_for_timeout(3000)
 
-            # OG 메타데이터 추출
-            og_tags = {"title": "og:title", "description": "og:description", "image": "og:image"}
-            for key, prop in og_tags.items():
+def _launch(p, session_path: Optional[str]):
+    """브라우저/컨텍스트/페이지 생성 (세션은 컨텍스트 생성 시 한 번만 로드)"""
+    browser = p.firefox.launch(headless=True, firefox_user_prefs=FIREFOX_USER_PREFS)
+    session = _load_session(session_path)
+    if isinstance(session, dict):
+        context = browser.new_context(storage_state=session)
+    else:
+        context = browser.new_context()
+        if session:
+            context.add_cookies(session)
+    _prepare_context(context)
+    return browser, context, context.new_page()
+
+
+def _has_session_cookie(context) -> bool:
+    """컨텍스트에 auth_token 쿠키가 있는지 확인 (네비게이션 없음)"""
+    try:
+        cookies = context.cookies()
+    except Exception:
+        return False
+    return any(cookie.get("name") == SESSION_COOKIE_NAME for cookie in cookies)
+
+
+def _find_button(page, texts: list[str], data_testid: Optional[str] = None):
+    """
+    버튼 찾기
+
+    data-testid → 텍스트 순서(각각 button → div[role=button])로 하나씩 조회
+    (쉼표 셀렉터 리스트로 합치면 DOM 순서상 첫 요소가 반환되어
+    우선순위가 무시되고 바깥 래퍼 div가 잡힐 수 있음)
+    """
+    selectors = [f'button[data-testid="{data_testid}"]'] if data_testid else []
+    for text in texts:
+        selectors.append(f'button:has-text("{text}")')
+        selectors.append(f'div[role="button"]:has-text("{text}")')
+
+    for selector in selectors:
+        button = page.query_selector(selector)
+        if button:
+            return button
+    return None
+
+
+def _login(page, username: str, password: str) -> bool:
+    """X 로그인 (고정 sleep 없이 입력 필드/홈 URL을 기다림)"""
+    try:
+        page.goto(LOGIN_URL, timeout=LOGIN_TIMEOUT * 2)
+
+        username_input = page.wait_for_selector('input[autocomplete="username"]', timeout=LOGIN_TIMEOUT)
+        username_input.fill(username)
+        next_button = _find_button(page, ["Next", "다음"])
+        if next_button:
+            next_button.click()
+        else:
+            username_input.press("Enter")
+
+        password_input = page.wait_for_selector('input[type="password"]', timeout=LOGIN_TIMEOUT)
+        password_input.fill(password)
+        login_button = _find_button(page, ["Log in", "로그인"], data_testid="LoginForm_Login_Button")
+        if login_button:
+            login_button.click()
+        else:
+            password_input.press("Enter")
+
+        # 로그인 성공 시 홈으로 이동 (타임아웃이면 세션 쿠키로 판단)
+        try:
+            page.wait_for_url(HOME_URL_RE, timeout=LOGIN_TIMEOUT)
+        except PlaywrightTimeoutError:
+            pass
+        return _has_session_cookie(page.context)
+
+    except Exception as e:
+        print(f"로그인 실패: {e}", file=sys.stderr)
+        return False
+
+
+def _save_session(context, state_path: str) -> None:
+    """세션 저장 (storage_state: 쿠키 + localStorage, 임시 파일 후 교체로 원자적 쓰기)"""
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    try:
+        context.storage_state(path=tmp_path)
+        os.replace(tmp_path, state_path)
+    except Exception as e:
+        print(f"세션 저장 실패: {e}", file=sys.stderr)
+
+
+def _ensure_logged_in(context, page, state_path: Optional[str] = None) -> bool:
+    """
+    세션 쿠키가 없으면 로그인 (계정 정보가 없으면 공개 콘텐츠만 추출)
+
+    로그인에 성공하면 state_path에 세션을 저장해 다음 워커가 로그인 없이 재사용
+
+    Returns:
+        새로 로그인했으면 True
+    """
+    if _has_session_cookie(context):
+        return False
+
+    username = os.getenv("TWITTER_USERNAME")
+    password = os.getenv("TWITTER_PASSWORD")
+    if not (username and password):
+        return False
+
+    print("세션 쿠키 없음, 로그인 시도", file=sys.stderr)
+    logged_in = _login(page, username, password)
+    print("로그인 성공" if logged_in else "로그인 실패, 공개 콘텐츠만 추출", file=sys.stderr)
+    if logged_in and state_path:
+        _save_session(context, state_path)
+    return logged_in
+
+
+def serve(session_path: Optional[str] = None, state_path: Optional[str] = None) -> None:
+    """
+    상주 워커 모드
+
+    브라우저와 컨텍스트를 재사용하면서 stdin의 요청을 한 줄씩 처리
+    브라우저 연결이 끊기면 다음 요청 전에 다시 띄움
+    요청 형식: {"url": "...", "timeout": 90000}
+    """
+    _require_playwright()
+
+    with sync_playwright() as p:
+        browser, context, page = _launch(p, session_path)
+        _ensure_logged_in(context, page, state_path)
+
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+
+            if not browser.is_connected():
+                print("브라우저 연결 끊김, 재실행", file=sys.stderr)
+                browser, context, page = _launch(p, session_path)
+                _ensure_logged_in(context, page, state_path)
+
+            try:
+                request = orjson.loads(line)
+                result = scrape_page(page, request["url"], int(request.get("timeout", 90000)))
+            except Exception as e:
+                result = _empty_result()
+                result["error"] = str(e)
+
+            # 페이지가 닫혔거나 크래시난 경우 새 페이지로 교체
+            if page.is_closed() or result["error"]:
                 try:
-                    elem = page.query_selector(f'meta[property="{prop}"]')
-                    if elem:
-                        content = elem.get_attribute("content")
-                        if content:
-                            result[f"og_{key}"] = content
+                    page.close()
                 except Exception:
                     pass
+                if browser.is_connected():
+                    page = context.new_page()
 
-            # 아티클 본문 추출 시도
-            article_content = ""
-            try:
-                links = page.query_selector_all('a[href*="/article/"]')
-                article_url = None
-                for link in links:
-                    href = link.get_attribute("href")
-                    if href and "/article/" in href and "support.x.com" not in href:
-                        article_url = f"https://x.com{href}" if href.startswith("/") else href
-                        break
-
-                if article_url:
-                    page.goto(article_url, wait_until="domcontentloaded", timeout=20000)
-                    time.sleep(5)
-
-                    main = page.query_selector("main")
-                    if main:
-                        text = main.inner_text()
-                        if text:
-                            lines = [line.strip() for line in text.strip().split("\n") if line.strip() and len(line.strip()) > 10]
-                            if lines:
-                                article_content = "\n\n".join(lines)
-            except Exception:
-                pass
-
-            if article_content and len(article_content) > 200:
-                result["content"] = article_content
-            else:
-                # 일반 트윗 텍스트 추출
-                tweet_elements = page.query_selector_all('[data-testid="tweetText"]')
-                if tweet_elements:
-                    texts = []
-                    for elem in tweet_elements[:5]:
-                        text = elem.inner_text()
-                        if text:
-                            texts.append(text.strip())
-                    if texts:
-                        result["content"] = "\n\n".join(texts)
-
-                # Fallback: main 영역 텍스트
-                if not result["content"]:
-                    text = page.evaluate("""
-                        () => {
-                            const main = document.querySelector('main') || document.body;
-                            const clone = main.cloneNode(true);
-                            ['script', 'style', 'noscript', 'nav', 'header', 'footer']
-                                .forEach(sel => clone.querySelectorAll(sel).forEach(el => el.remove()));
-                            return (clone.innerText || '').trim();
-                        }
-                    """)
-                    result["content"] = text[:10000] if text else ""
+            print(orjson.dumps(result).decode(), flush=True)
 
-            browser.close()
-            result["success"] = True
+        browser.close()
+
+
+def scrape_page(page, url: str, timeout: int = 90000) -> dict:
+    """열려 있는 페이지에서 Twitter URL 스크래핑"""
+    result = _empty_result()
+
+    try:
+        # 대상 URL로 이동 (하위 리소스는 차단되므로 DOM 로드까지만 대기)
+        response = page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+        if response is not None:
+            result["status"] = response.status
+            # 서버 장애/요청 제한은 빈 페이지를 추출하지 않고 바로 실패
+            if response.status == 429 or response.status >= 500:
+                result["error"] = f"HTTP {response.status}"
+                return result
+        _wait_for_content(page, CONTENT_SELECTOR)
+
+        # OG 메타데이터 + 아티클 링크 + 트윗 텍스트 추출 (evaluate 한 번으로 조회)
+        info = _evaluate_page_info(page)
+        for key in ("title", "description", "image"):
+            if info.get(key):
+                result[f"og_{key}"] = info[key]
+        href = info.get("article_href")
+
+        # 아티클 본문 추출 시도
+        article_content = ""
+        try:
+            article_url = None
+            if href:
+                article_url = f"https://x.com{href}" if href.startswith("/") else href
+
+            if article_url:
+                page.goto(article_url, wait_until="domcontentloaded", timeout=20000)
+                _wait_for_content(page, ARTICLE_SELECTOR)
+
+                main = page.query_selector("main")
+                if main:
+                    text = main.evaluate("(el, limit) => el.innerText.slice(0, limit)", ARTICLE_TEXT_LIMIT)
+                    if text:
+                        lines = MEANINGFUL_LINE_RE.findall(text)
+                        if lines:
+                            article_content = "\n\n".join(lines)
+        except Exception:
+            pass
+
+        if article_content and len(article_content) > 200:
+            result["content"] = article_content
+        elif info.get("tweets"):
+            # 일반 트윗 텍스트
+            result["content"] = "\n\n".join(info["tweets"])
+        else:
+            # Fallback: main 영역 텍스트
+            result["content"] = info.get("main_text") or ""
+
+        result["success"] = True
 
     except Exception as e:
         result["error"] = str(e)
@@ -112,11 +424,18 @@ def scrape_twitter(url: str, timeout: int = 90000) -> dict:
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print(json.dumps({"error": "URL required", "success": False}))
+        print(orjson.dumps({"error": "URL required", "success": False}).decode())
         sys.exit(1)
 
+    if sys.argv[1] == "--serve":
+        serve(
+            sys.argv[2] if len(sys.argv) > 2 else None,
+            sys.argv[3] if len(sys.argv) > 3 else None,
+        )
+        sys.exit(0)
+
     url = sys.argv[1]
     timeout = int(sys.argv[2]) if len(sys.argv) > 2 else 90000
 
     result = scrape_twitter(url, timeout)
-    print(json.dumps(result, ensure_ascii=False))
+    print(orjson.dumps(result).decode())
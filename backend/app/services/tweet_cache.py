@@ -0,0 +1,85 @@
+"""
+트윗 스크래핑 결과 디스크 캐시 (SQLite)
+
+Unix Philosophy: Modularity - 트윗 결과 저장/조회만 담당
+- TwitterScraper 결과 캐시(_result_cache)의 디스크 계층
+  (메모리 계층과 같은 TTL로 함께 저장, 실패 결과도 동일)
+- 서버 재시작 후에도 Syndication/Playwright 호출 없이 결과 재사용
+- 동기 함수이므로 이벤트 루프에서는 asyncio.to_thread로 호출
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# 캐시 DB 경로 (쿠키와 같은 런타임 디렉토리)
+CACHE_DB_PATH = Path(__file__).parent.parent.parent / "cookies" / "tweet_cache.db"
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """SQLite 연결 (Lazy initialization, 호출 측에서 _conn_lock 보유)"""
+    global _conn
+    if _conn is None:
+        CACHE_DB_PATH.parent.mkdir(exist_ok=True)
+        _conn = sqlite3.connect(CACHE_DB_PATH, isolation_level=None, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS tweet_results "
+            "(tweet_id TEXT PRIMARY KEY, payload BLOB, expires_at REAL)"
+        )
+        # 만료된 항목은 연결 시 한 번 정리
+        _conn.execute("DELETE FROM tweet_results WHERE expires_at <= ?", (time.time(),))
+    return _conn
+
+
+def load(tweet_id: str) -> Optional[tuple[float, dict[str, Any]]]:
+    """
+    캐시된 트윗 결과 조회
+
+    Args:
+        tweet_id: 트윗 ID
+
+    Returns:
+        (만료 시각(time.time), 결과 딕셔너리) 튜플 (없거나 만료/오류 시 None)
+    """
+    try:
+        with _conn_lock:
+            row = _get_conn().execute(
+                "SELECT payload, expires_at FROM tweet_results WHERE tweet_id = ? AND expires_at > ?",
+                (tweet_id, time.time()),
+            ).fetchone()
+        return (row[1], orjson.loads(row[0])) if row else None
+    except Exception as e:
+        logger.warning(f"[TweetCache] 조회 실패: {e}")
+        return None
+
+
+def store(tweet_id: str, payload: dict[str, Any], ttl: float) -> None:
+    """
+    트윗 결과 저장 (같은 tweet_id는 덮어씀)
+
+    Args:
+        tweet_id: 트윗 ID
+        payload: 결과 딕셔너리 (dataclasses.asdict)
+        ttl: 유효 기간 (초)
+    """
+    try:
+        data = orjson.dumps(payload)
+        with _conn_lock:
+            _get_conn().execute(
+                "INSERT OR REPLACE INTO tweet_results (tweet_id, payload, expires_at) VALUES (?, ?, ?)",
+                (tweet_id, data, time.time() + ttl),
+            )
+    except Exception as e:
+        logger.warning(f"[TweetCache] 저장 실패: {e}")
@@ -3,26 +3,43 @@ Twitter Playwright 스크래퍼
 
 Unix Philosophy: Separation - 정책과 메커니즘 분리
 - 브라우저 기반 스크래핑만 담당
-- 쿠키/세션 관리
-- 로그인 처리
+- 상주 워커 프로세스 풀 관리 (로그인/세션 로드는 playwright_worker.py)
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
 import logging
 import os
+import queue
+import re
+import select
+import subprocess
+import sys
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from app.utils import DEFAULT_USER_AGENT
 
+# Playwright 미설치 환경에서도 모듈 import는 가능하도록 처리
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PlaywrightTimeoutError = None
+    PLAYWRIGHT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaywrightResult:
     """Playwright 스크래핑 결과"""
 
@@ -33,6 +50,216 @@ class PlaywrightResult:
     success: bool = False
     error: Optional[str] = None
     elapsed_time: float = 0.0
+    # 대상 페이지 HTTP 상태 코드 (응답을 받기 전에 실패했으면 None)
+    status: Optional[int] = None
+
+
+# 아티클 링크 (고객센터 링크 제외)
+_ARTICLE_LINK_SELECTOR = 'a[href*="/article/"]:not([href*="support.x.com"])'
+
+# 아티클 페이지 본문 셀렉터
+_ARTICLE_SELECTOR = '[data-testid="twitterArticleRichTextView"], main article'
+
+# 앞뒤 공백을 뺀 길이가 10자를 넘는 줄 (공백 제거된 내용을 캡처)
+_MEANINGFUL_LINE_RE = re.compile(r"^[^\S\n]*(\S[^\n]{9,}\S)[^\S\n]*$", re.MULTILINE)
+
+# 아티클 원문 최대 길이 (브라우저에서 잘라서 전송, 짧은 줄은 이후 걸러짐)
+_ARTICLE_TEXT_LIMIT = 20000
+
+# 셀렉터 대기 최대 시간 (ms)
+_SELECTOR_TIMEOUT = 5000
+
+# OG 메타데이터 조회 스크립트 (og:title 없으면 document.title)
+_OG_METADATA_JS = """
+() => {
+    const get = p => document.querySelector(`meta[property="${p}"]`)?.content || null;
+    return {
+        title: get('og:title') || document.title || null,
+        description: get('og:description'),
+        image: get('og:image'),
+    };
+}
+"""
+
+# 트윗 본문 조회 스크립트 (첫 번째로 내용이 있는 후보를 반환)
+_TWEET_CONTENT_JS = """
+() => {
+    const texts = (selector, limit, minLength) =>
+        Array.from(document.querySelectorAll(selector))
+            .slice(0, limit)
+            .map(el => el.innerText || '')
+            .filter(text => text.length > minLength)
+            .map(text => text.trim());
+
+    // X Notes 본문
+    for (const selector of [
+        '[data-testid="TextFlowRoot"]',
+        '[data-testid="noteComponent"]',
+        'article [data-testid="richTextComponent"]',
+    ]) {
+        const found = texts(selector, 30, 0).filter(text => text.length > 5);
+        if (found.length && found.join('\\n').length > 100) return found.join('\\n\\n');
+    }
+
+    // 일반 트윗
+    const tweets = texts('[data-testid="tweetText"]', 5, 0);
+    if (tweets.length) return tweets.join('\\n\\n');
+
+    // 아티클 셀렉터
+    for (const selector of [
+        '[data-testid="article"] [dir="auto"]',
+        '[role="article"] p',
+        'article p',
+    ]) {
+        const found = texts(selector, 20, 10);
+        if (found.length) return found.join('\\n\\n');
+    }
+
+    // Fallback: main 영역 텍스트
+    const main = document.querySelector('main') ||
+                 document.querySelector('[role="main"]') ||
+                 document.body;
+    const clone = main.cloneNode(true);
+    ['script', 'style', 'noscript', 'nav', 'header', 'footer']
+        .forEach(sel => clone.querySelectorAll(sel).forEach(el => el.remove()));
+    return (clone.innerText || '').trim().slice(0, 5000);
+}
+"""
+
+# 상주 워커 프로세스 수 (동시에 열리는 브라우저 수)
+WORKER_POOL_SIZE = 2
+
+# 워커 1건 처리 타임아웃 (초)
+WORKER_TIMEOUT = 120
+
+# 워커 스크립트 경로
+WORKER_PATH = Path(__file__).parent / "playwright_worker.py"
+
+# 세션 파일 이름 (TwitterPlaywrightScraper.cookies_dir 아래)
+# - storage_state: 쿠키 + localStorage (우선 사용)
+# - 쿠키 목록: 이전 버전 호환용
+STATE_FILENAME = "twitter_state.json"
+COOKIES_FILENAME = "twitter_cookies.json"
+
+# 워커 컨텍스트에 미리 로드할 세션 파일 (TwitterPlaywrightScraper 기본 경로와 동일)
+# 워커가 로그인하면 STATE_PATH에 storage_state를 저장
+COOKIES_DIR = Path(__file__).parent.parent.parent / "cookies"
+STATE_PATH = COOKIES_DIR / STATE_FILENAME
+COOKIES_PATH = COOKIES_DIR / COOKIES_FILENAME
+
+
+def _session_path() -> Path:
+    """워커에 넘길 세션 파일 (storage_state가 있으면 우선)"""
+    return STATE_PATH if STATE_PATH.exists() else COOKIES_PATH
+
+
+class _PlaywrightWorker:
+    """
+    상주 Playwright 워커 프로세스 핸들
+
+    브라우저/페이지를 띄워 둔 워커에 stdin으로 요청을 보내고 stdout에서 결과 한 줄을 읽는다.
+    """
+
+    def __init__(self, session_path: Optional[Path] = None) -> None:
+        session_path = session_path or _session_path()
+        cmd = [sys.executable, str(WORKER_PATH), "--serve", str(session_path), str(STATE_PATH)]
+        logger.info(f"[Playwright] 워커 프로세스 실행: {' '.join(cmd)}")
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+
+    def is_alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, url: str, timeout: int) -> dict:
+        """요청 1건 처리 (블로킹, 스레드에서 호출)"""
+        self.proc.stdin.write(orjson.dumps({"url": url, "timeout": timeout}).decode() + "\n")
+        self.proc.stdin.flush()
+
+        ready, _, _ = select.select([self.proc.stdout], [], [], WORKER_TIMEOUT)
+        if not ready:
+            self.close()
+            raise subprocess.TimeoutExpired(WORKER_PATH.name, WORKER_TIMEOUT)
+
+        output = self.proc.stdout.readline().strip()
+        if not output:
+            self.close()
+            raise RuntimeError(f"워커 출력 없음 (returncode={self.proc.poll()})")
+        return orjson.loads(output)
+
+    def close(self) -> None:
+        if self.is_alive():
+            self.proc.kill()
+        self.proc.wait()
+
+
+class PlaywrightWorkerPool:
+    """
+    상주 워커 프로세스 풀
+
+    요청은 스레드 안전한 큐에서 워커를 빌려 처리하고 반납한다.
+    (BackgroundTasks마다 이벤트 루프가 달라 asyncio 객체 대신 스레드 큐 사용)
+    워커는 처음 필요할 때 띄우고, 죽은 워커는 다음 요청에서 새로 띄운다.
+    세션(storage_state 또는 쿠키)은 워커가 뜰 때 컨텍스트에 한 번만 로드된다.
+    """
+
+    def __init__(self, size: int = WORKER_POOL_SIZE) -> None:
+        self._slots: queue.Queue[Optional[_PlaywrightWorker]] = queue.Queue()
+        self._workers: list[_PlaywrightWorker] = []
+        self._lock = threading.Lock()
+        self.size = size
+        for _ in range(size):
+            self._slots.put(None)
+
+    def prewarm(self) -> None:
+        """
+        모든 슬롯의 워커를 미리 실행
+
+        워커는 뜨자마자 브라우저를 띄우고 쿠키를 로드하므로 첫 요청의 콜드 스타트가 사라진다.
+        """
+        for _ in range(self.size):
+            worker = self._slots.get()
+            try:
+                if worker is None or not worker.is_alive():
+                    worker = self._spawn()
+            except Exception as e:
+                logger.warning(f"[Playwright] 워커 예열 실패: {e}")
+            finally:
+                self._slots.put(worker if worker is not None and worker.is_alive() else None)
+
+    def run(self, url: str, timeout: int) -> dict:
+        """빈 워커를 기다렸다가 요청 처리 (블로킹)"""
+        worker = self._slots.get()
+        try:
+            if worker is None or not worker.is_alive():
+                worker = self._spawn()
+            return worker.request(url, timeout)
+        finally:
+            self._slots.put(worker if worker is not None and worker.is_alive() else None)
+
+    def _spawn(self) -> _PlaywrightWorker:
+        worker = _PlaywrightWorker()
+        with self._lock:
+            self._workers = [w for w in self._workers if w.is_alive()]
+            self._workers.append(worker)
+        return worker
+
+    def shutdown(self) -> None:
+        """모든 워커 프로세스 종료"""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+
+# 프로세스 전역 워커 풀 (FastAPI lifespan 종료 시에도 shutdown 호출)
+worker_pool = PlaywrightWorkerPool()
+atexit.register(worker_pool.shutdown)
 
 
 class TwitterPlaywrightScraper:
@@ -54,10 +281,6 @@ class TwitterPlaywrightScraper:
         self.cookies_dir = Path(cookies_dir)
         self.cookies_dir.mkdir(exist_ok=True)
 
-        # 로그인 정보
-        self.twitter_username = os.getenv("TWITTER_USERNAME")
-        self.twitter_password = os.getenv("TWITTER_PASSWORD")
-
     async def scrape(self, url: str) -> PlaywrightResult:
         """
         Playwright로 Twitter 콘텐츠 스크래핑
@@ -68,9 +291,7 @@ class TwitterPlaywrightScraper:
         Returns:
             PlaywrightResult
         """
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # 별도 프로세스에서 실행 (BackgroundTasks 환경에서 브라우저 종료 문제 회피)
         try:
@@ -79,294 +300,80 @@ class TwitterPlaywrightScraper:
             logger.error(f"[Playwright] 프로세스 실행 실패: {e}", exc_info=True)
             result = PlaywrightResult(error=str(e))
 
-        result.elapsed_time = time.time() - start_time
+        result.elapsed_time = time.perf_counter() - start_time
         return result
 
     async def _scrape_in_process(self, url: str) -> PlaywrightResult:
-        """별도 subprocess에서 Playwright 워커 스크립트 실행 (동기 방식)"""
-        import concurrent.futures
-        import subprocess
-        import sys
-
+        """상주 워커 프로세스에서 Playwright 스크래핑 (스레드에서 블로킹 대기)"""
         result = PlaywrightResult()
 
-        # 워커 스크립트 경로
-        worker_path = Path(__file__).parent / "playwright_worker.py"
-
-        def run_worker():
-            """스레드에서 동기 subprocess 실행"""
-            cmd = [sys.executable, str(worker_path), url, str(self.timeout)]
-            logger.info(f"[Playwright] 워커 프로세스 실행: {' '.join(cmd)}")
+        try:
+            logger.info(f"[Playwright] 워커 요청: {url}")
+            data = await asyncio.to_thread(worker_pool.run, url, self.timeout)
 
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=120,  # 2분 타임아웃
-            )
+            result.content = data.get("content", "")
+            result.og_title = data.get("og_title")
+            result.og_image = data.get("og_image")
+            result.og_description = data.get("og_description")
+            result.success = data.get("success", False)
+            result.error = data.get("error")
+            result.status = data.get("status")
 
-            return proc.returncode, proc.stdout, proc.stderr
+            if result.error:
+                logger.warning(f"[Playwright] 워커 내부 에러: {result.error}")
 
-        try:
-            logger.info(f"[Playwright] 워커 프로세스 시작: {url}")
-
-            # ThreadPoolExecutor에서 동기 subprocess 실행
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                returncode, stdout, stderr = await loop.run_in_executor(executor, run_worker)
-
-            stderr_msg = stderr.decode("utf-8", errors="replace").strip()
-            if stderr_msg:
-                logger.warning(f"[Playwright] 워커 stderr: {stderr_msg[:500]}")
-
-            if returncode != 0:
-                logger.error(f"[Playwright] 워커 프로세스 에러 (returncode={returncode}): {stderr_msg}")
-                result.error = stderr_msg or f"returncode={returncode}"
-                return result
-
-            # JSON 결과 파싱
-            output = stdout.decode("utf-8", errors="replace").strip()
-            logger.debug(f"[Playwright] 워커 stdout: {output[:500] if output else 'empty'}")
-
-            if output:
-                try:
-                    data = json.loads(output)
-                    result.content = data.get("content", "")
-                    result.og_title = data.get("og_title")
-                    result.og_image = data.get("og_image")
-                    result.og_description = data.get("og_description")
-                    result.success = data.get("success", False)
-                    result.error = data.get("error")
-
-                    if result.error:
-                        logger.warning(f"[Playwright] 워커 내부 에러: {result.error}")
-
-                    logger.info(f"[Playwright] 워커 완료: success={result.success}, content_length={len(result.content)}")
-                except json.JSONDecodeError as e:
-                    logger.error(f"[Playwright] 워커 JSON 파싱 실패: {e}, output={output[:200]}")
-                    result.error = f"JSON 파싱 실패: {e}"
-            else:
-                result.error = "워커 출력 없음"
+            logger.info(f"[Playwright] 워커 완료: success={result.success}, content_length={len(result.content)}")
 
         except subprocess.TimeoutExpired:
             logger.error("[Playwright] 워커 프로세스 타임아웃")
             result.error = "타임아웃"
+        except orjson.JSONDecodeError as e:
+            logger.error(f"[Playwright] 워커 JSON 파싱 실패: {e}")
+            result.error = f"JSON 파싱 실패: {e}"
         except Exception as e:
             logger.error(f"[Playwright] 워커 프로세스 실패: {e}", exc_info=True)
             result.error = str(e)
 
         return result
 
-    async def _ensure_logged_in(self, page, context) -> None:
-        """로그인 상태 확인 및 필요시 로그인"""
-        logger.info("[Playwright] X.com 홈페이지로 이동 중...")
-        await page.goto("https://x.com/home", timeout=self.timeout, wait_until="load")
-        await page.wait_for_timeout(2000)
-
-        # 현재 URL 로깅
-        current_url = page.url
-        logger.info(f"[Playwright] 현재 URL: {current_url}")
-
-        is_logged_in = await self._check_login_status(page)
-        if is_logged_in:
-            logger.info("[Playwright] 이미 로그인됨")
-            return
-
-        # 환경변수 설정 여부 확인
-        has_credentials = bool(self.twitter_username and self.twitter_password)
-        logger.warning(
-            f"[Playwright] 로그인 필요. "
-            f"TWITTER_USERNAME 설정: {bool(self.twitter_username)}, "
-            f"TWITTER_PASSWORD 설정: {bool(self.twitter_password)}"
-        )
-
-        if not has_credentials:
-            logger.warning("[Playwright] 환경변수 미설정으로 로그인 스킵. 공개 콘텐츠만 추출 시도...")
-            return
-
-        logger.info("[Playwright] 로그인 시도 중...")
-        login_success = await self._login(page)
-        if login_success:
-            logger.info("[Playwright] 로그인 성공!")
-            await self._save_cookies(context)
-        else:
-            logger.warning("[Playwright] 로그인 실패. 공개 콘텐츠만 추출 시도...")
-
-    async def _check_login_status(self, page) -> bool:
-        """로그인 상태 확인"""
-        try:
-            login_button = await page.query_selector('a[href="/login"]')
-            return login_button is None
-        except Exception:
-            return False
-
-    async def _login(self, page) -> bool:
-        """Twitter 로그인"""
-        if not self.twitter_username or not self.twitter_password:
-            logger.error("[Playwright] TWITTER_USERNAME/PASSWORD 환경 변수 미설정")
-            return False
-
+    async def _wait_for_selector(
+        self, page, selector: str, timeout: int = _SELECTOR_TIMEOUT
+    ) -> None:
+        """셀렉터가 붙을 때까지 대기 (고정 sleep 대신, 타임아웃이면 그대로 진행)"""
         try:
-            logger.info("[Playwright] 로그인 페이지로 이동...")
-            await page.goto("https://x.com/i/flow/login", timeout=self.timeout)
-            await page.wait_for_timeout(3000)
-            logger.info(f"[Playwright] 로그인 페이지 URL: {page.url}")
-
-            # 이메일/사용자명 입력
-            logger.info("[Playwright] 사용자명 입력 필드 대기 중...")
-            username_input = await page.wait_for_selector(
-                'input[autocomplete="username"]', timeout=15000
-            )
-            await username_input.fill(self.twitter_username)
-            logger.info(f"[Playwright] 사용자명 입력 완료: {self.twitter_username[:3]}***")
-            await page.wait_for_timeout(500)
-
-            # "다음" 버튼 클릭
-            next_button = await self._find_button(
-                page, ["Next", "다음"]
-            )
-            if next_button:
-                logger.info("[Playwright] '다음' 버튼 클릭")
-                await next_button.click()
-            else:
-                logger.info("[Playwright] '다음' 버튼 없음, Enter 키 입력")
-                await username_input.press("Enter")
-            await page.wait_for_timeout(2000)
-
-            # 비밀번호 입력
-            logger.info("[Playwright] 비밀번호 입력 필드 대기 중...")
-            password_input = await page.wait_for_selector(
-                'input[type="password"]', timeout=15000
-            )
-            await password_input.fill(self.twitter_password)
-            logger.info("[Playwright] 비밀번호 입력 완료")
-            await page.wait_for_timeout(500)
-
-            # "로그인" 버튼 클릭
-            login_button = await self._find_button(
-                page, ["Log in", "로그인"], data_testid="LoginForm_Login_Button"
-            )
-            if login_button:
-                logger.info("[Playwright] '로그인' 버튼 클릭")
-                await login_button.click()
-            else:
-                logger.info("[Playwright] '로그인' 버튼 없음, Enter 키 입력")
-                await password_input.press("Enter")
-            await page.wait_for_timeout(3000)
-
-            # 로그인 결과 확인
-            final_url = page.url
-            logger.info(f"[Playwright] 로그인 후 URL: {final_url}")
-
-            is_logged_in = await self._check_login_status(page)
-            logger.info(f"[Playwright] 로그인 상태 확인: {is_logged_in}")
-            return is_logged_in
-
-        except Exception as e:
-            logger.error(f"[Playwright] 로그인 실패: {e}", exc_info=True)
-            return False
-
-    async def _find_button(
-        self, page, texts: list[str], data_testid: Optional[str] = None
-    ):
-        """버튼 찾기 헬퍼"""
-        if data_testid:
-            btn = await page.query_selector(f'button[data-testid="{data_testid}"]')
-            if btn:
-                return btn
-
-        for text in texts:
-            for selector in [
-                f'button:has-text("{text}")',
-                f'div[role="button"]:has-text("{text}")',
-            ]:
-                btn = await page.query_selector(selector)
-                if btn:
-                    return btn
-        return None
-
-    async def _load_cookies(self, context) -> None:
-        """저장된 쿠키 로드"""
-        cookies_path = self.cookies_dir / "twitter_cookies.json"
-        if not cookies_path.exists():
-            return
-
-        try:
-            with open(cookies_path) as f:
-                cookies = json.load(f)
-            await context.add_cookies(cookies)
-            logger.info(f"[Playwright] 쿠키 로드: {cookies_path}")
-        except Exception as e:
-            logger.warning(f"[Playwright] 쿠키 로드 실패: {e}")
-
-    async def _save_cookies(self, context) -> None:
-        """세션 쿠키 저장"""
-        cookies_path = self.cookies_dir / "twitter_cookies.json"
-        try:
-            cookies = await context.cookies()
-            with open(cookies_path, "w") as f:
-                json.dump(cookies, f, indent=2)
-            logger.info(f"[Playwright] 쿠키 저장: {cookies_path}")
-        except Exception as e:
-            logger.warning(f"[Playwright] 쿠키 저장 실패: {e}")
+            await page.wait_for_selector(selector, timeout=timeout, state="attached")
+        except PlaywrightTimeoutError:
+            pass
 
     async def _extract_og_metadata(self, page) -> dict:
-        """OG 메타데이터 추출"""
-        metadata = {}
-        og_tags = {
-            "title": "og:title",
-            "description": "og:description",
-            "image": "og:image",
-        }
-
-        for key, property_name in og_tags.items():
-            try:
-                element = await page.query_selector(f'meta[property="{property_name}"]')
-                if element:
-                    content = await element.get_attribute("content")
-                    if content:
-                        metadata[key] = content
-            except Exception:
-                pass
-
-        if "title" not in metadata:
-            try:
-                title = await page.title()
-                if title:
-                    metadata["title"] = title
-            except Exception:
-                pass
-
-        return metadata
+        """OG 메타데이터 추출 (evaluate 한 번으로 조회)"""
+        try:
+            metadata = await page.evaluate(_OG_METADATA_JS)
+        except Exception:
+            return {}
+        return {key: value for key, value in metadata.items() if value}
 
     async def _extract_article_content(self, page) -> str:
         """X 아티클 본문 추출"""
         try:
-            links = await page.query_selector_all('a[href*="/article/"]')
-            article_url = None
-
-            for link in links:
-                href = await link.get_attribute("href")
-                if href and "/article/" in href and "support.x.com" not in href:
-                    article_url = f"https://x.com{href}" if href.startswith("/") else href
-                    break
-
-            if not article_url:
+            link = await page.query_selector(_ARTICLE_LINK_SELECTOR)
+            href = await link.get_attribute("href") if link else None
+            if not href:
                 return ""
 
+            article_url = f"https://x.com{href}" if href.startswith("/") else href
+
             logger.info(f"[Playwright] 아티클 페이지: {article_url}")
             await page.goto(article_url, wait_until="domcontentloaded", timeout=20000)
-            await asyncio.sleep(5)
+            await self._wait_for_selector(page, _ARTICLE_SELECTOR)
 
             main = await page.query_selector("main")
             if main:
-                text = await main.inner_text()
+                text = await main.evaluate(
+                    "(el, limit) => el.innerText.slice(0, limit)", _ARTICLE_TEXT_LIMIT
+                )
                 if text:
-                    lines = text.strip().split("\n")
-                    content_lines = [
-                        line.strip()
-                        for line in lines
-                        if line.strip() and len(line.strip()) > 10
-                    ]
+                    content_lines = _MEANINGFUL_LINE_RE.findall(text)
                     if content_lines:
                         return "\n\n".join(content_lines)
 
@@ -377,70 +384,10 @@ class TwitterPlaywrightScraper:
             return ""
 
     async def _extract_tweet_content(self, page) -> str:
-        """트윗 본문 추출"""
+        """트윗 본문 추출 (노트 → 트윗 → 아티클 → main 순서를 evaluate 한 번으로 처리)"""
         try:
-            # X Notes 본문
-            note_selectors = [
-                '[data-testid="TextFlowRoot"]',
-                '[data-testid="noteComponent"]',
-                'article [data-testid="richTextComponent"]',
-            ]
-
-            for selector in note_selectors:
-                elements = await page.query_selector_all(selector)
-                if elements:
-                    texts = []
-                    for elem in elements[:30]:
-                        text = await elem.inner_text()
-                        if text and len(text.strip()) > 5:
-                            texts.append(text.strip())
-                    if texts and len("\n".join(texts)) > 100:
-                        return "\n\n".join(texts)
-
-            # 일반 트윗
-            tweet_elements = await page.query_selector_all('[data-testid="tweetText"]')
-            if tweet_elements:
-                texts = []
-                for elem in tweet_elements[:5]:
-                    text = await elem.inner_text()
-                    if text:
-                        texts.append(text.strip())
-                if texts:
-                    return "\n\n".join(texts)
-
-            # 아티클 셀렉터
-            article_selectors = [
-                '[data-testid="article"] [dir="auto"]',
-                '[role="article"] p',
-                'article p',
-            ]
-
-            for selector in article_selectors:
-                elements = await page.query_selector_all(selector)
-                if elements:
-                    texts = []
-                    for elem in elements[:20]:
-                        text = await elem.inner_text()
-                        if text and len(text) > 10:
-                            texts.append(text.strip())
-                    if texts:
-                        return "\n\n".join(texts)
-
-            # Fallback: main 영역 텍스트
-            text = await page.evaluate(
-                """
-                () => {
-                    const main = document.querySelector('main') ||
-                                 document.querySelector('[role="main"]') ||
-                                 document.body;
-                    const clone = main.cloneNode(true);
-                    ['script', 'style', 'noscript', 'nav', 'header', 'footer']
-                        .forEach(sel => clone.querySelectorAll(sel).forEach(el => el.remove()));
-                    return (clone.innerText || '').trim();
-                }
-            """
-            )
-            return text[:5000] if text else ""
+            text = await page.evaluate(_TWEET_CONTENT_JS)
+            return text or ""
 
         except Exception as e:
             logger.error(f"[Playwright] 텍스트 추출 실패: {e}")
@@ -10,30 +10,73 @@ Unix Philosophy:
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import contextlib
 import logging
-from dataclasses import dataclass
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field, replace
 from typing import Optional
 
-from app.services.twitter_playwright import PlaywrightResult, TwitterPlaywrightScraper
+from app.config import settings
+from app.services import tweet_cache
+from app.services.twitter_playwright import WORKER_POOL_SIZE, PlaywrightResult, TwitterPlaywrightScraper
 from app.services.twitter_syndication import fetch_tweet_metadata
-from app.services.twitter_url_parser import build_tweet_url, is_twitter_url
+from app.services.twitter_url_parser import build_tweet_url, extract_tweet_id, is_twitter_url
 
 logger = logging.getLogger(__name__)
 
-# 동시 요청 제한
-MAX_CONCURRENT_REQUESTS = 2
-_semaphore: Optional[asyncio.Semaphore] = None
+# 동시 요청 제한 (리소스별, 느린 Playwright가 Syndication을 막지 않도록 분리)
+# - Syndication: 가벼운 HTTP 요청
+# - Playwright: 브라우저 워커 수를 넘지 않도록
+MAX_SYNDICATION_REQUESTS = max(1, settings.TWITTER_SYNDICATION_CONCURRENCY)
+MAX_PLAYWRIGHT_REQUESTS = max(1, min(settings.TWITTER_PLAYWRIGHT_CONCURRENCY, WORKER_POOL_SIZE))
 
+# 프로세스 전체에서 공유하는 Semaphore
+# BackgroundTasks는 작업마다 새 이벤트 루프(스레드)를 쓰므로 루프별 asyncio.Semaphore로는
+# 제한이 걸리지 않음 → threading.BoundedSemaphore를 모든 루프가 함께 사용
+_semaphores = {
+    "syndication": threading.BoundedSemaphore(MAX_SYNDICATION_REQUESTS),
+    "playwright": threading.BoundedSemaphore(MAX_PLAYWRIGHT_REQUESTS),
+}
 
-def _get_semaphore() -> asyncio.Semaphore:
-    """Semaphore 인스턴스 (Lazy initialization)"""
-    global _semaphore
-    if _semaphore is None:
-        _semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-    return _semaphore
+# 자리가 없을 때 다시 확인하는 간격 (초)
+SEMAPHORE_POLL_INTERVAL = 0.05
 
 
-@dataclass
+@contextlib.asynccontextmanager
+async def _limit(kind: str):
+    """
+    리소스별 동시 실행 수 제한 (async with로 사용)
+
+    이벤트 루프를 막지 않도록 non-blocking acquire를 짧게 반복
+    (스레드에서 blocking acquire를 기다리면 취소된 뒤에도 획득되어 자리가 새므로 사용하지 않음)
+    """
+    semaphore = _semaphores[kind]
+    while not semaphore.acquire(blocking=False):
+        await asyncio.sleep(SEMAPHORE_POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+
+# X 아티클 미지원 안내 문구 (페이지 앞부분에만 나오므로 앞쪽만 검사)
+_UNSUPPORTED_RE = re.compile(r"이 페이지는 지원되지 않습니다|This page is not supported")
+UNSUPPORTED_SCAN_CHARS = 2000
+
+# 진행 중인 스크래핑 (tweet_id 또는 URL -> 결과 Future)
+# 이벤트 루프가 달라도 기다릴 수 있도록 concurrent.futures.Future 사용
+_inflight: dict[str, concurrent.futures.Future] = {}
+_inflight_lock = threading.Lock()
+
+
+class _OwnerCancelledError(RuntimeError):
+    """공유 Future를 실행하던 요청이 취소됨 (대기자는 직접 다시 실행)"""
+
+
+@dataclass(slots=True)
 class TwitterScrapingResult:
     """Twitter 스크래핑 결과"""
 
@@ -49,12 +92,80 @@ class TwitterScrapingResult:
     tweet_id: Optional[str] = None
 
 
+@dataclass
+class _CircuitBreaker:
+    """
+    연속 실패 시 일정 시간 호출을 막는 서킷 브레이커
+
+    threshold번 연속 실패하면 cooldown초 동안 열림(호출 차단)
+    cooldown이 지나면 요청 하나만 시험 호출(half-open)로 통과시키고,
+    성공하면 닫히고 실패하면 다시 열림 (시험 호출 중 다른 요청은 계속 차단)
+    BackgroundTasks마다 스레드가 다르므로 threading.Lock 사용
+    """
+
+    name: str
+    threshold: int = 5
+    cooldown: float = 30.0
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (cooldown 후에는 시험 호출 하나만 허용)"""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.probing or time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.probing = True
+            return True
+
+    def release_probe(self) -> None:
+        """결과 없이 끝난 시험 호출(취소 등)의 자리 반납"""
+        with self._lock:
+            self.probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info(f"[CircuitBreaker] {self.name} 복구, 닫힘")
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self.probing = False
+            if self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning(
+                        f"[CircuitBreaker] {self.name} {self.failures}회 연속 실패, "
+                        f"{self.cooldown:.0f}초간 차단"
+                    )
+                self.opened_at = time.monotonic()
+
+
+# 스크래핑 결과 캐시 (tweet_id -> (만료 시각, 결과))
+# 트윗 결과의 유일한 캐시 (Syndication/URL 캐시는 트윗을 따로 보관하지 않음)
+# 메모리 + 디스크(tweet_cache) 2단계, 두 계층 모두 같은 TTL로 함께 갱신
+# 실패 결과도 짧게 캐시하여 장애 시 반복 요청을 흡수
+# dict 삽입 순서를 LRU 순서로 사용 (조회/저장 시 맨 뒤로 이동, 맨 앞부터 제거)
+RESULT_CACHE_MAX_SIZE = 2048
+_result_cache: dict[str, tuple[float, TwitterScrapingResult]] = {}
+_result_cache_lock = threading.Lock()
+
+
 class TwitterScraper:
     """
     Twitter/X 스크래핑 서비스
 
     1. Syndication API로 메타데이터 추출
     2. 실패 시 Playwright로 브라우저 스크래핑
+
+    strict_tweet_only=True이면 트윗 ID가 없는 URL(프로필, 검색 등)은
+    브라우저를 띄우지 않고 바로 실패 처리
     """
 
     def __init__(
@@ -62,7 +173,10 @@ class TwitterScraper:
         timeout: int = 90000,
         cookies_dir: Optional[str] = None,
         headless: bool = True,
+        strict_tweet_only: bool = False,
     ):
+        self.strict_tweet_only = strict_tweet_only
+        self._pw_breaker = _CircuitBreaker("Playwright")
         self.playwright_scraper = TwitterPlaywrightScraper(
             timeout=timeout,
             cookies_dir=cookies_dir,
@@ -83,52 +197,114 @@ class TwitterScraper:
         Returns:
             TwitterScrapingResult
         """
+        tweet_id = extract_tweet_id(url)
+        if tweet_id is None and self.strict_tweet_only:
+            logger.info(f"[TwitterScraper] 트윗 URL 아님, 스킵: {url}")
+            return TwitterScrapingResult(error="트윗 URL이 아닙니다")
+
+        if tweet_id:
+            cached = await _load_cached_result(tweet_id)
+            if cached:
+                logger.info(f"[TwitterScraper] 캐시 히트: {tweet_id}")
+                return cached
+
+        # 같은 트윗을 이미 스크래핑 중이면 그 결과를 기다림
+        key = tweet_id or url
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                _inflight[key] = future
+
+        if not is_owner:
+            logger.info(f"[TwitterScraper] 동일 요청 진행 중, 결과 대기: {key}")
+            try:
+                # 대기 측이 취소돼도 공유 Future(=다른 대기자와 실행 측)는 취소되지 않도록 shield
+                return replace(await asyncio.shield(asyncio.wrap_future(future)))
+            except _OwnerCancelledError:
+                # 실행 측만 취소된 것이므로 이 요청은 직접 다시 실행
+                logger.info(f"[TwitterScraper] 진행 중이던 요청 취소됨, 다시 실행: {key}")
+                with _inflight_lock:
+                    if _inflight.get(key) is future:
+                        _inflight.pop(key)
+                return await self.scrape(url)
+
+        try:
+            result = await self._scrape(url, tweet_id)
+        except asyncio.CancelledError:
+            # 취소는 실행 측 요청에만 해당 (대기자까지 CancelledError로 끝내지 않음)
+            future.set_exception(_OwnerCancelledError(key))
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            if tweet_id:
+                await _store_cached_result(tweet_id, result)
+            return result
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    async def _scrape(self, url: str, tweet_id: Optional[str]) -> TwitterScrapingResult:
+        """Syndication → Playwright 순서로 스크래핑 (트윗 ID가 없으면 바로 Playwright)"""
         logger.info(f"[TwitterScraper] 스크래핑 시작: {url}")
-        semaphore = _get_semaphore()
-        async with semaphore:
-            # 1단계: Syndication API 시도
-            logger.info("[TwitterScraper] 1단계: Syndication API 호출")
-            syndication_result = await fetch_tweet_metadata(url)
-            logger.info(
-                f"[TwitterScraper] Syndication 결과: success={syndication_result.success}, "
-                f"content_len={len(syndication_result.content)}, "
-                f"screen_name={syndication_result.screen_name}, "
-                f"tweet_id={syndication_result.tweet_id}, "
-                f"article_url={syndication_result.article_url}, "
-                f"has_note_tweet={syndication_result.has_note_tweet}"
-            )
 
-            if syndication_result.success and syndication_result.content:
-                result = self._convert_syndication_result(syndication_result)
-                logger.info(f"[TwitterScraper] Syndication 성공, content: {result.content[:100]}...")
-
-                # 아티클 URL이 있거나 긴 트윗(note_tweet)인 경우 Playwright로 전체 내용 추출
-                needs_playwright = (
-                    (result.article_url and result.screen_name and result.tweet_id)
-                    or syndication_result.has_note_tweet
-                )
-
-                if needs_playwright and result.screen_name and result.tweet_id:
-                    reason = "아티클 URL" if result.article_url else "긴 트윗(note_tweet)"
-                    logger.info(f"[TwitterScraper] {reason} 감지, Playwright로 전체 내용 추출 시도")
-                    full_content_result = await self._fetch_full_content(result)
-                    if full_content_result:
-                        logger.info(f"[TwitterScraper] 전체 내용 추출 성공: {len(full_content_result.content)}자")
-                        return full_content_result
-                    else:
-                        logger.warning("[TwitterScraper] 전체 내용 추출 실패, Syndication 결과 사용")
-
-                logger.info(f"[TwitterScraper] 최종 반환: {len(result.content)}자")
-                return result
-
-            # 2단계: Playwright 폴백
-            logger.info("[TwitterScraper] 2단계: Syndication 실패, Playwright로 재시도...")
-            playwright_result = await self.playwright_scraper.scrape(url)
-            logger.info(
-                f"[TwitterScraper] Playwright 결과: success={playwright_result.success}, "
-                f"content_len={len(playwright_result.content)}, error={playwright_result.error}"
+        # 트윗 ID가 없는 URL(아티클, 프로필 등)은 Syndication으로 처리할 수 없음
+        if tweet_id is None:
+            logger.info("[TwitterScraper] 트윗 ID 없음, Playwright로 바로 진행")
+            return await self._scrape_playwright_fallback(url)
+
+        # 1단계: Syndication API 시도
+        logger.info("[TwitterScraper] 1단계: Syndication API 호출")
+        async with _limit("syndication"):
+            syndication_result = await fetch_tweet_metadata(url, tweet_id)
+        logger.info(
+            f"[TwitterScraper] Syndication 결과: success={syndication_result.success}, "
+            f"content_len={len(syndication_result.content)}, "
+            f"screen_name={syndication_result.screen_name}, "
+            f"tweet_id={syndication_result.tweet_id}, "
+            f"article_url={syndication_result.article_url}, "
+            f"has_note_tweet={syndication_result.has_note_tweet}"
+        )
+
+        if syndication_result.success and syndication_result.content:
+            result = self._convert_syndication_result(syndication_result)
+            logger.info(f"[TwitterScraper] Syndication 성공, content: {result.content[:100]}...")
+
+            # 아티클 URL이 있거나 긴 트윗(note_tweet)인 경우 Playwright로 전체 내용 추출
+            needs_playwright = (
+                (result.article_url and result.screen_name and result.tweet_id)
+                or syndication_result.has_note_tweet
             )
-            return self._convert_playwright_result(playwright_result)
+
+            if needs_playwright and result.screen_name and result.tweet_id:
+                reason = "아티클 URL" if result.article_url else "긴 트윗(note_tweet)"
+                logger.info(f"[TwitterScraper] {reason} 감지, Playwright로 전체 내용 추출 시도")
+                full_content_result = await self._fetch_full_content(result)
+                if full_content_result:
+                    logger.info(f"[TwitterScraper] 전체 내용 추출 성공: {len(full_content_result.content)}자")
+                    return full_content_result
+                else:
+                    logger.warning("[TwitterScraper] 전체 내용 추출 실패, Syndication 결과 사용")
+
+            logger.info(f"[TwitterScraper] 최종 반환: {len(result.content)}자")
+            return result
+
+        # 2단계: Playwright 폴백
+        logger.info("[TwitterScraper] 2단계: Syndication 실패, Playwright로 재시도...")
+        return await self._scrape_playwright_fallback(url)
+
+    async def _scrape_playwright_fallback(self, url: str) -> TwitterScrapingResult:
+        """Playwright로 원본 URL 스크래핑"""
+        playwright_result = await self._scrape_with_playwright(url)
+        logger.info(
+            f"[TwitterScraper] Playwright 결과: success={playwright_result.success}, "
+            f"content_len={len(playwright_result.content)}, error={playwright_result.error}"
+        )
+        return self._convert_playwright_result(playwright_result)
 
     async def _fetch_full_content(
         self, result: TwitterScrapingResult
@@ -137,14 +313,13 @@ class TwitterScraper:
         web_url = build_tweet_url(result.screen_name, result.tweet_id)
         logger.info(f"[TwitterScraper] 정규 URL로 전체 내용 추출: {web_url}")
 
-        playwright_result = await self.playwright_scraper.scrape(web_url)
+        playwright_result = await self._scrape_with_playwright(web_url)
 
         if not playwright_result.success or not playwright_result.content:
             return None
 
         # 지원되지 않는 콘텐츠 체크
-        unsupported_texts = ["이 페이지는 지원되지 않습니다", "This page is not supported"]
-        if any(t in playwright_result.content for t in unsupported_texts):
+        if _UNSUPPORTED_RE.search(playwright_result.content, 0, UNSUPPORTED_SCAN_CHARS):
             result.og_description = f"X 아티클: {result.article_url}"
             logger.info("[TwitterScraper] X 아티클은 앱에서만 지원됩니다")
             return None
@@ -155,6 +330,30 @@ class TwitterScraper:
         new_result.og_description = f"아티클: {result.article_url}"
         return new_result
 
+    async def _scrape_with_playwright(self, url: str) -> PlaywrightResult:
+        """
+        Playwright 스크래핑 (Playwright 전용 Semaphore 안에서 실행)
+
+        연속 실패로 서킷 브레이커가 열려 있으면 브라우저를 띄우지 않고 바로 실패 반환
+        삭제/비공개 트윗 등 콘텐츠 문제는 장애로 세지 않음 (전송 실패, 5xx, 429만)
+        """
+        if not self._pw_breaker.allow_request():
+            logger.warning(f"[TwitterScraper] Playwright 차단 중 (연속 실패), 스킵: {url}")
+            return PlaywrightResult(error="Playwright 일시 중단 (연속 실패)")
+
+        try:
+            async with _limit("playwright"):
+                result = await self.playwright_scraper.scrape(url)
+        except BaseException:
+            self._pw_breaker.release_probe()
+            raise
+
+        if _is_outage(result):
+            self._pw_breaker.record_failure()
+        else:
+            self._pw_breaker.record_success()
+        return result
+
     def _convert_syndication_result(self, syn_result) -> TwitterScrapingResult:
         """Syndication 결과를 공통 결과로 변환"""
         return TwitterScrapingResult(
@@ -182,5 +381,66 @@ class TwitterScraper:
         )
 
 
+def _is_outage(result: PlaywrightResult) -> bool:
+    """
+    서킷 브레이커가 셀 장애인지 판단
+
+    응답 상태가 있으면 5xx/429만 장애, 응답 없이 실패했으면(연결 실패, 타임아웃,
+    워커 프로세스 오류) 장애, 그 외 4xx나 내용 추출 실패는 콘텐츠 문제로 봄
+    """
+    if result.success:
+        return False
+    if result.status is not None:
+        return result.status == 429 or result.status >= 500
+    return bool(result.error)
+
+
+def _get_cached_result(tweet_id: str) -> Optional[TwitterScrapingResult]:
+    """메모리 캐시된 결과 사본 조회 (만료 시 None, 히트하면 가장 최근 사용으로 이동)"""
+    with _result_cache_lock:
+        entry = _result_cache.pop(tweet_id, None)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            return None
+        _result_cache[tweet_id] = entry
+        return replace(result)
+
+
+def _set_cached_result(tweet_id: str, result: TwitterScrapingResult, ttl: float) -> None:
+    """메모리 캐시에 결과 저장 (최대 크기 초과 시 가장 오래 안 쓴 항목부터 제거)"""
+    with _result_cache_lock:
+        _result_cache.pop(tweet_id, None)
+        _result_cache[tweet_id] = (time.monotonic() + ttl, replace(result))
+        while len(_result_cache) > RESULT_CACHE_MAX_SIZE:
+            del _result_cache[next(iter(_result_cache))]
+
+
+async def _load_cached_result(tweet_id: str) -> Optional[TwitterScrapingResult]:
+    """메모리 → 디스크 순서로 결과 조회 (디스크 히트는 남은 TTL로 메모리에 다시 올림)"""
+    cached = _get_cached_result(tweet_id)
+    if cached is not None:
+        return cached
+
+    entry = await asyncio.to_thread(tweet_cache.load, tweet_id)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    result = TwitterScrapingResult(**payload)
+    _set_cached_result(tweet_id, result, expires_at - time.time())
+    return replace(result)
+
+
+async def _store_cached_result(tweet_id: str, result: TwitterScrapingResult) -> None:
+    """메모리 + 디스크에 결과 저장 (성공/실패에 따라 TTL 다름)"""
+    ttl = settings.TWITTER_CACHE_TTL if result.success else settings.TWITTER_NEGATIVE_CACHE_TTL
+    if ttl <= 0:
+        return
+
+    _set_cached_result(tweet_id, result, ttl)
+    await asyncio.to_thread(tweet_cache.store, tweet_id, asdict(result), ttl)
+
+
 # 싱글톤 인스턴스
-twitter_scraper = TwitterScraper()
+twitter_scraper = TwitterScraper(strict_tweet_only=settings.TWITTER_STRICT_TWEET_ONLY)
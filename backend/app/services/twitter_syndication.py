@@ -7,21 +7,34 @@ Unix Philosophy: Separation - 정책과 메커니즘 분리
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
+import threading
 import time
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from typing import Optional
+from urllib.parse import urljoin
 
 import httpx
+import orjson
 
+from app.services.http_client import get_http_client, get_with_retry
 from app.services.twitter_url_parser import extract_tweet_id
-from app.utils import DEFAULT_USER_AGENT
 
 logger = logging.getLogger(__name__)
 
+# Syndication API 요청 헤더 (User-Agent는 공유 클라이언트 기본값 사용)
+_SYNDICATION_HEADERS = {"Accept": "application/json"}
 
-@dataclass
+# Syndication 호출 전체 제한 시간 (재시도 포함, 초)
+SYNDICATION_DEADLINE_SECONDS = 8.0
+
+# t.co 단축 링크 접두어 (뒤에 영숫자/밑줄 코드가 붙음)
+_TCO_PREFIX = "https://t.co/"
+
+
+@dataclass(slots=True)
 class SyndicationResult:
     """Syndication API 결과"""
 
@@ -37,21 +50,40 @@ class SyndicationResult:
     has_note_tweet: bool = False  # 긴 트윗(Note) 여부
 
 
-async def fetch_tweet_metadata(url: str) -> SyndicationResult:
+# Rate limit 백오프 (time.monotonic 기준, 이 시각 전에는 API 호출 생략)
+DEFAULT_RATE_LIMIT_BACKOFF_SECONDS = 60
+MAX_RATE_LIMIT_BACKOFF_SECONDS = 300
+_rate_limited_until = 0.0
+_rate_limit_lock = threading.Lock()
+
+# t.co 단축 링크 캐시 (t.co URL -> (만료 시각, 최종 URL))
+# t.co 매핑은 사실상 바뀌지 않으므로 길게 보관
+TCO_CACHE_TTL_SECONDS = 86400
+TCO_CACHE_MAX_SIZE = 4096
+TCO_MAX_HOPS = 5
+
+# t.co 리다이렉트 1회 요청 타임아웃 (본문 없이 Location만 받으므로 짧게)
+TCO_TIMEOUT = httpx.Timeout(connect=1.0, read=3.0, write=1.0, pool=1.0)
+_tco_cache: dict[str, tuple[float, str]] = {}
+_tco_cache_lock = threading.Lock()
+
+
+async def fetch_tweet_metadata(url: str, tweet_id: Optional[str] = None) -> SyndicationResult:
     """
     Syndication API를 통해 트윗 메타데이터 추출
 
     Args:
         url: Twitter URL
+        tweet_id: 호출 측에서 이미 추출한 트윗 ID (없으면 URL에서 추출)
 
     Returns:
         SyndicationResult
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     result = SyndicationResult()
     logger.info(f"[Syndication] 시작: {url}")
 
-    tweet_id = extract_tweet_id(url)
+    tweet_id = tweet_id or extract_tweet_id(url)
     if not tweet_id:
         logger.warning(f"[Syndication] 트윗 ID 추출 실패: {url}")
         return result
@@ -59,77 +91,218 @@ async def fetch_tweet_metadata(url: str) -> SyndicationResult:
     result.tweet_id = tweet_id
     logger.info(f"[Syndication] 트윗 ID: {tweet_id}")
 
+    # Rate limit 백오프 중이면 API 호출 생략 (Playwright 폴백으로 넘어감)
+    backoff = _rate_limit_remaining()
+    if backoff > 0:
+        logger.warning(f"[Syndication] Rate limit 대기 중 ({backoff:.0f}초 남음), API 호출 생략")
+        return result
+
     try:
         api_url = f"https://cdn.syndication.twimg.com/tweet-result?id={tweet_id}&token=x"
-        headers = {
-            "User-Agent": DEFAULT_USER_AGENT,
-            "Accept": "application/json",
-        }
         logger.info(f"[Syndication] API 호출: {api_url}")
 
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            response = await client.get(api_url, headers=headers)
-            logger.info(f"[Syndication] API 응답: status={response.status_code}")
-
-            if response.status_code != 200:
-                logger.warning(f"[Syndication] API 실패: status={response.status_code}, body={response.text[:200]}")
-                result.elapsed_time = time.time() - start_time
-                return result
-
-            data = response.json()
-            logger.info(f"[Syndication] JSON 파싱 성공, keys={list(data.keys())}")
-
-            # 트윗 텍스트
-            result.content = data.get("text", "")
-
-            # 사용자 정보
-            user = data.get("user", {})
-            result.og_title = user.get("name", "")
-            result.screen_name = user.get("screen_name", "")
-
-            # 미디어 정보
-            media = data.get("mediaDetails", [])
-            if media:
-                result.og_image = media[0].get("media_url_https", "")
-
-            # note_tweet 체크 (긴 트윗)
-            if data.get("note_tweet"):
-                result.has_note_tweet = True
-                logger.info("[Syndication] note_tweet 감지 - 긴 트윗, Playwright 필요")
-
-            # t.co 링크 리다이렉트 확인
-            if result.content and "t.co/" in result.content:
-                article_url = await _resolve_tco_link(client, result.content)
-                if article_url:
-                    result.og_description = f"링크: {article_url}"
-                    if "/i/article/" in article_url:
-                        result.article_url = article_url
-
-            result.success = bool(result.content)
-            logger.info(
-                f"[Syndication] 성공: content_length={len(result.content)}, "
-                f"has_note_tweet={result.has_note_tweet}"
+        client = get_http_client()
+        # 일시적 실패는 재시도하되, 전체 시간은 제한하여 폴백이 늦어지지 않도록 함
+        response = await asyncio.wait_for(
+            get_with_retry(client, api_url, headers=_SYNDICATION_HEADERS),
+            timeout=SYNDICATION_DEADLINE_SECONDS,
+        )
+        logger.info(f"[Syndication] API 응답: status={response.status_code}")
+        logger.debug(f"[Syndication] 프로토콜: {response.http_version}")
+
+        delay = _rate_limit_delay(response)
+        if delay:
+            logger.warning(f"[Syndication] Rate limit 감지, {delay:.0f}초 동안 호출 중단")
+            _set_rate_limited(delay)
+
+        body = response.content
+        if response.status_code != 200:
+            logger.warning(
+                f"[Syndication] API 실패: status={response.status_code}, "
+                f"body={body[:200].decode('utf-8', errors='replace')}"
             )
+            result.elapsed_time = time.perf_counter() - start_time
+            return result
+
+        # 점검/캡차 HTML 등 JSON 객체가 아닌 응답은 디코딩 없이 바로 거부
+        if body[:1] != b"{" and body.lstrip()[:1] != b"{":
+            logger.warning(f"[Syndication] JSON이 아닌 응답: {body[:50]!r}")
+            result.elapsed_time = time.perf_counter() - start_time
+            return result
+
+        data = orjson.loads(body)
+        logger.info(f"[Syndication] JSON 파싱 성공, keys={list(data.keys())}")
+
+        # 트윗 텍스트
+        result.content = data.get("text", "")
+
+        # 사용자 정보
+        user = data.get("user", {})
+        result.og_title = user.get("name", "")
+        result.screen_name = user.get("screen_name", "")
+
+        # 미디어 정보
+        media = data.get("mediaDetails", [])
+        if media:
+            result.og_image = media[0].get("media_url_https", "")
+
+        # note_tweet 체크 (긴 트윗)
+        if data.get("note_tweet"):
+            result.has_note_tweet = True
+            logger.info("[Syndication] note_tweet 감지 - 긴 트윗, Playwright 필요")
+
+        # t.co 링크 리다이렉트 확인
+        if result.content and "t.co/" in result.content:
+            linked_urls = await _resolve_tco_links(client, result.content)
+            if linked_urls:
+                result.og_description = f"링크: {linked_urls[0]}"
+                result.article_url = next((u for u in linked_urls if "/i/article/" in u), None)
+
+        result.success = bool(result.content)
+        logger.info(
+            f"[Syndication] 성공: content_length={len(result.content)}, "
+            f"has_note_tweet={result.has_note_tweet}"
+        )
 
     except Exception as e:
         logger.warning(f"[Syndication] 실패: {e}")
 
-    result.elapsed_time = time.time() - start_time
+    result.elapsed_time = time.perf_counter() - start_time
     return result
 
 
-async def _resolve_tco_link(client: httpx.AsyncClient, text: str) -> Optional[str]:
-    """t.co 링크를 실제 URL로 리다이렉트"""
-    tco_match = re.search(r"https://t\.co/\w+", text)
-    if not tco_match:
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 파싱 (초 또는 HTTP 날짜)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_delay(response: httpx.Response) -> Optional[float]:
+    """
+    응답에서 다음 호출까지 기다려야 할 시간(초) 계산
+
+    - 429: Retry-After 헤더 (없으면 기본값)
+    - x-rate-limit-remaining이 0이면 x-rate-limit-reset(epoch)까지
+    """
+    headers = response.headers
+    delay = None
+    if response.status_code == 429:
+        delay = _parse_retry_after(headers.get("retry-after")) or DEFAULT_RATE_LIMIT_BACKOFF_SECONDS
+    elif headers.get("x-rate-limit-remaining") == "0":
+        reset = headers.get("x-rate-limit-reset", "")
+        if reset.isdigit():
+            delay = max(0.0, int(reset) - time.time())
+
+    if not delay:
         return None
+    return min(delay, MAX_RATE_LIMIT_BACKOFF_SECONDS)
 
-    tco_url = tco_match.group(0)
+
+def _rate_limit_remaining() -> float:
+    """Rate limit 백오프 남은 시간(초)"""
+    with _rate_limit_lock:
+        return max(0.0, _rate_limited_until - time.monotonic())
+
+
+def _set_rate_limited(delay: float) -> None:
+    """지금부터 delay초 동안 API 호출 중단"""
+    global _rate_limited_until
+    with _rate_limit_lock:
+        _rate_limited_until = max(_rate_limited_until, time.monotonic() + delay)
+
+
+def _find_tco_urls(text: str) -> list[str]:
+    """
+    텍스트의 t.co 링크 목록 (등장 순서, 정규식 r"https://t\\.co/\\w+"와 같은 결과)
+
+    대부분의 트윗에는 t.co 링크가 없으므로 str.find로 바로 끝남
+    """
+    urls = []
+    start = text.find(_TCO_PREFIX)
+    while start >= 0:
+        end = start + len(_TCO_PREFIX)
+        while end < len(text) and (text[end].isalnum() or text[end] == "_"):
+            end += 1
+        if end > start + len(_TCO_PREFIX):
+            urls.append(text[start:end])
+        start = text.find(_TCO_PREFIX, end)
+    return urls
+
+
+async def _resolve_tco_links(client: httpx.AsyncClient, text: str) -> list[str]:
+    """
+    텍스트의 모든 t.co 링크를 실제 URL로 변환
+
+    캐시에 없는 링크만 병렬로 리다이렉트를 따라가며, 결과는 등장 순서대로 반환
+    """
+    tco_urls = list(dict.fromkeys(_find_tco_urls(text)))
+    if not tco_urls:
+        return []
+
+    resolved = {u: final for u in tco_urls if (final := _get_tco_cached(u))}
+    pending = [u for u in tco_urls if u not in resolved]
+
+    if pending:
+        results = await asyncio.gather(*(_resolve_tco_link(client, u) for u in pending))
+        for tco_url, final_url in zip(pending, results):
+            if final_url:
+                resolved[tco_url] = final_url
+                _set_tco_cached(tco_url, final_url)
+
+    return [resolved[u] for u in tco_urls if u in resolved]
+
+
+async def _resolve_tco_link(client: httpx.AsyncClient, tco_url: str) -> Optional[str]:
+    """
+    t.co 링크 1개를 실제 URL로 리다이렉트
+
+    HEAD를 거부하는 단축 서비스가 있어 GET으로 요청하되, 본문은 읽지 않고
+    상태 코드와 Location 헤더만 보고 직접 리다이렉트를 따라감
+    TCO_MAX_HOPS 안에 리다이렉트가 끝나지 않으면 None (중간 URL을 캐시하지 않도록)
+    """
+    url = tco_url
     try:
-        response = await client.head(tco_url, follow_redirects=True, timeout=5.0)
-        final_url = str(response.url)
-        logger.info(f"[Syndication] t.co 리다이렉트: {tco_url} -> {final_url}")
-        return final_url
+        for _ in range(TCO_MAX_HOPS):
+            async with client.stream("GET", url, follow_redirects=False, timeout=TCO_TIMEOUT) as response:
+                location = response.headers.get("location")
+                if not response.is_redirect or not location:
+                    break
+                url = urljoin(url, location)
+        else:
+            logger.warning(f"[Syndication] t.co 리다이렉트 횟수 초과 ({TCO_MAX_HOPS}회): {tco_url}")
+            return None
+
+        logger.info(f"[Syndication] t.co 리다이렉트: {tco_url} -> {url}")
+        return url
     except Exception as e:
         logger.warning(f"[Syndication] t.co 리다이렉트 실패: {e}")
         return None
+
+
+def _get_tco_cached(tco_url: str) -> Optional[str]:
+    """캐시된 t.co 최종 URL 조회 (만료 시 None)"""
+    with _tco_cache_lock:
+        entry = _tco_cache.get(tco_url)
+        if entry is None:
+            return None
+        expires_at, final_url = entry
+        if time.monotonic() >= expires_at:
+            del _tco_cache[tco_url]
+            return None
+        return final_url
+
+
+def _set_tco_cached(tco_url: str, final_url: str) -> None:
+    """t.co 최종 URL 저장 (최대 크기 초과 시 오래된 항목부터 제거)"""
+    with _tco_cache_lock:
+        _tco_cache.pop(tco_url, None)
+        _tco_cache[tco_url] = (time.monotonic() + TCO_CACHE_TTL_SECONDS, final_url)
+        while len(_tco_cache) > TCO_CACHE_MAX_SIZE:
+            del _tco_cache[next(iter(_tco_cache))]
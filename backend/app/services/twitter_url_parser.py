@@ -10,7 +10,7 @@ Unix Philosophy: Modularity - 단순한 부분들을 깔끔한 인터페이스
 from __future__ import annotations
 
 import re
-from urllib.parse import urlparse
+from functools import lru_cache
 
 # Twitter/X 도메인 목록
 TWITTER_DOMAINS = frozenset([
@@ -22,10 +22,25 @@ TWITTER_DOMAINS = frozenset([
     "mobile.x.com",
 ])
 
+# http(s) URL의 호스트가 Twitter/X 도메인인지 한 번의 정규식 매칭으로 확인
+# (호스트는 대소문자 무시, 명시적 포트 허용, 뒤에 경로/쿼리/프래그먼트가 오거나 문자열 끝)
+TWITTER_HOST_PATTERN = (
+    r"(?:" + "|".join(re.escape(d) for d in sorted(TWITTER_DOMAINS)) + r")(?::\d+)?(?=[/?#]|$)"
+)
+_TWITTER_URL_RE = re.compile(r"^https?://" + TWITTER_HOST_PATTERN, re.IGNORECASE)
 
+# URL 판별/파싱 결과 캐시 크기 (같은 URL이 중복 제거/재시도/여러 단계에서 반복 확인됨)
+URL_CHECK_CACHE_SIZE = 8192
+
+# 트윗 ID 패턴 (/status/{id})
+_STATUS_MARKER = "/status/"
+_TWEET_ID_RE = re.compile(r"/status/(\d+)")
+
+
+@lru_cache(maxsize=URL_CHECK_CACHE_SIZE)
 def is_twitter_url(url: str) -> bool:
     """
-    Twitter/X URL인지 확인
+    Twitter/X URL인지 확인 (결과는 LRU 캐시)
 
     Args:
         url: 확인할 URL
@@ -33,16 +48,13 @@ def is_twitter_url(url: str) -> bool:
     Returns:
         Twitter URL이면 True
     """
-    try:
-        parsed = urlparse(url)
-        return parsed.netloc.lower() in TWITTER_DOMAINS
-    except Exception:
-        return False
+    return _TWITTER_URL_RE.match(url) is not None
 
 
+@lru_cache(maxsize=URL_CHECK_CACHE_SIZE)
 def extract_tweet_id(url: str) -> str | None:
     """
-    URL에서 트윗 ID 추출
+    URL에서 트윗 ID 추출 (결과는 LRU 캐시)
 
     Args:
         url: Twitter URL
@@ -50,7 +62,20 @@ def extract_tweet_id(url: str) -> str | None:
     Returns:
         트윗 ID 또는 None
     """
-    match = re.search(r"/status/(\d+)", url)
+    # 빠른 경로: 첫 번째 /status/ 뒤의 숫자를 직접 스캔
+    start = url.find(_STATUS_MARKER)
+    if start < 0:
+        return None
+
+    start += len(_STATUS_MARKER)
+    end = start
+    while end < len(url) and url[end].isdecimal():
+        end += 1
+    if end > start:
+        return url[start:end]
+
+    # 첫 /status/ 뒤에 숫자가 없으면 정규식으로 나머지 탐색
+    match = _TWEET_ID_RE.search(url, start)
     return match.group(1) if match else None
 
 
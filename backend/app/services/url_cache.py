@@ -0,0 +1,189 @@
+"""
+URL 콘텐츠 캐시 (메모리 LRU + 디스크 SQLite)
+
+Unix Philosophy: Modularity - URL 가져오기 결과 저장/조회만 담당
+- 같은 링크를 반복해서 붙여넣어도 HTTP 요청/렌더링/Cloudflare 우회를 다시 하지 않음
+- 1단계: 프로세스 메모리 LRU (가장 빠름, 재시작 시 소실)
+- 2단계: 디스크 SQLite (재시작 후에도 유지)
+- 추적용 쿼리(utm_*, fbclid 등)를 제거하고 정렬한 URL을 키로 사용
+- 디스크 함수는 동기 함수이므로 이벤트 루프에서는 asyncio.to_thread로 호출
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# 캐시 DB 경로 (쿠키와 같은 런타임 디렉토리)
+CACHE_DB_PATH = Path(__file__).parent.parent.parent / "cookies" / "url_cache.db"
+
+# 메모리 캐시 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 제거)
+MEMORY_CACHE_MAX_SIZE = 1024
+
+# 캐시 키에서 제외할 추적용 쿼리 파라미터
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref_src"})
+
+# 캐시 항목: (만료 시각(time.time), 콘텐츠, OG 메타데이터 딕셔너리)
+CacheEntry = tuple[float, Optional[str], Optional[dict[str, Any]]]
+
+_memory: OrderedDict[str, CacheEntry] = OrderedDict()
+_memory_lock = threading.Lock()
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
+
+def normalize_url(url: str) -> str:
+    """
+    캐시 키용 URL 정규화
+
+    - scheme/host 소문자
+    - fragment 제거 (서버로 전송되지 않음)
+    - utm_* 등 추적용 쿼리 제거 후 정렬
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL (파싱 실패 시 원본 그대로)
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in TRACKING_PARAMS
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+
+
+def cache_key(url: str, max_length: int) -> str:
+    """정규화된 URL + 최대 길이로 캐시 키 생성 (길이가 다르면 잘린 결과가 다름)"""
+    raw = f"{normalize_url(url)}\n{max_length}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _remember(key: str, entry: CacheEntry) -> None:
+    """메모리 캐시에 저장 (최근 사용 위치로 이동, 크기 초과분 제거)"""
+    with _memory_lock:
+        _memory[key] = entry
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_CACHE_MAX_SIZE:
+            _memory.popitem(last=False)
+
+
+def load_memory(key: str) -> Optional[CacheEntry]:
+    """
+    메모리 캐시 조회
+
+    Returns:
+        캐시 항목 (없거나 만료 시 None)
+    """
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del _memory[key]
+            return None
+        _memory.move_to_end(key)
+        return entry
+
+
+def _get_conn() -> sqlite3.Connection:
+    """SQLite 연결 (Lazy initialization, 호출 측에서 _conn_lock 보유)"""
+    global _conn
+    if _conn is None:
+        CACHE_DB_PATH.parent.mkdir(exist_ok=True)
+        _conn = sqlite3.connect(CACHE_DB_PATH, isolation_level=None, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_cache "
+            "(key TEXT PRIMARY KEY, payload BLOB, expires_at REAL)"
+        )
+        # 만료된 항목은 연결 시 한 번 정리
+        _conn.execute("DELETE FROM url_cache WHERE expires_at <= ?", (time.time(),))
+    return _conn
+
+
+def load_disk(key: str) -> Optional[CacheEntry]:
+    """
+    디스크 캐시 조회 (적중 시 메모리 캐시에도 올림)
+
+    Returns:
+        캐시 항목 (없거나 만료/오류 시 None)
+    """
+    try:
+        with _conn_lock:
+            row = _get_conn().execute(
+                "SELECT payload, expires_at FROM url_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if not row:
+            return None
+        payload = orjson.loads(row[0])
+        entry = (row[1], payload["content"], payload["og"])
+    except Exception as e:
+        logger.warning(f"[URLCache] 조회 실패: {e}")
+        return None
+
+    _remember(key, entry)
+    return entry
+
+
+def store(
+    key: str,
+    content: Optional[str],
+    og: Optional[dict[str, Any]],
+    ttl: float,
+) -> None:
+    """
+    결과 저장 (메모리 + 디스크, 같은 키는 덮어씀)
+
+    Args:
+        key: cache_key()로 만든 키
+        content: 추출된 콘텐츠
+        og: OG 메타데이터 딕셔너리 (dataclasses.asdict)
+        ttl: 유효 기간 (초)
+    """
+    expires_at = time.time() + ttl
+    _remember(key, (expires_at, content, og))
+
+    try:
+        data = orjson.dumps({"content": content, "og": og})
+        with _conn_lock:
+            _get_conn().execute(
+                "INSERT OR REPLACE INTO url_cache (key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, data, expires_at),
+            )
+    except Exception as e:
+        logger.warning(f"[URLCache] 저장 실패: {e}")
+
+
+def clear() -> None:
+    """메모리/디스크 캐시 전체 삭제 (관리용)"""
+    with _memory_lock:
+        _memory.clear()
+
+    try:
+        with _conn_lock:
+            _get_conn().execute("DELETE FROM url_cache")
+    except Exception as e:
+        logger.warning(f"[URLCache] 삭제 실패: {e}")
+    else:
+        logger.info("[URLCache] 캐시 전체 삭제")
@@ -10,30 +10,130 @@ Unix Philosophy:
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import logging
+import multiprocessing
 import os
 import random
 import re
-from typing import Awaitable, Callable, Optional
-from urllib.parse import quote, urlparse
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Awaitable, Callable, Literal, Optional
+from urllib.parse import quote
 
 import httpx
 import trafilatura
-
-from app.services.naver_blog_scraper import is_naver_blog_url, naver_blog_scraper
-from app.services.og_metadata import OGMetadata, extract_og_metadata
+from lxml import etree
+from lxml import html as lxml_html
+
+from app.config import settings
+from app.services import url_cache
+from app.services.browser_pool import PLAYWRIGHT_AVAILABLE, PlaywrightTimeoutError, browser_context
+from app.services.http_client import backoff_delay, get_http_client
+from app.services.naver_blog_scraper import NAVER_BLOG_DOMAINS, naver_blog_scraper
+from app.services.og_metadata import OGMetadata, extract_og_metadata, extract_og_metadata_from_tree
 from app.services.twitter_scraper import twitter_scraper
+from app.services.twitter_url_parser import TWITTER_HOST_PATTERN
+from app.utils import url_netloc
 
 logger = logging.getLogger(__name__)
 
 # ScraperAPI 설정 (Railway 등 클라우드 환경에서 IP 차단 우회용)
 SCRAPER_API_KEY = os.getenv("SCRAPER_API_KEY")
 SCRAPER_API_URL = "http://api.scraperapi.com"
+SCRAPER_API_TIMEOUT = 60.0
+
+# ScraperAPI 요청 타임아웃 (렌더링 대기로 읽기만 길게, 연결/풀 대기는 공유 클라이언트 설정 유지)
+SCRAPER_API_HTTP_TIMEOUT = httpx.Timeout(
+    SCRAPER_API_TIMEOUT,
+    connect=settings.HTTP_CONNECT_TIMEOUT,
+    pool=settings.HTTP_POOL_TIMEOUT,
+)
 
 # Progress 콜백 타입 정의
 ProgressCallback = Optional[Callable[[str, str, Optional[str]], Awaitable[None]]]
 
+# 일반 페이지/raw 텍스트 요청 타임아웃 (초, 공유 클라이언트에 요청 단위로 지정)
+# 읽기/쓰기만 FETCH_TIMEOUT, 연결/풀 대기는 공유 클라이언트의 짧은 설정 유지
+# (연결되지 않는 호스트는 빨리 포기하고 대체 경로로 넘어가도록)
+FETCH_TIMEOUT = 15.0
+FETCH_HTTP_TIMEOUT = httpx.Timeout(
+    FETCH_TIMEOUT,
+    connect=settings.HTTP_CONNECT_TIMEOUT,
+    pool=settings.HTTP_POOL_TIMEOUT,
+)
+
+# 일반 페이지/raw 텍스트 요청 최대 시도 횟수와 재시도 대상 오류
+# 타임아웃은 재시도하지 않고 바로 ScraperAPI 등 대체 경로로 넘김
+# - 읽기 타임아웃: 이미 FETCH_TIMEOUT만큼 기다린 뒤
+# - 연결 타임아웃: 응답하지 않는 호스트는 다시 시도해도 대부분 같은 결과
+FETCH_MAX_ATTEMPTS = 3
+RETRYABLE_FETCH_ERRORS = (
+    httpx.ConnectError,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+# HTML 수신 상한 (bytes) - max_length 대비 배수, 단 스크립트가 많은 페이지를 위해 최소 1MB
+HTML_BYTES_PER_CHAR = 10
+MIN_HTML_BYTES = 1_000_000
+HTML_CHUNK_SIZE = 16384
+
+# raw 텍스트 수신 상한 계산용 (UTF-8 한 글자 최대 bytes)
+RAW_BYTES_PER_CHAR = 4
+
+# 이 크기(문자)를 넘는 HTML만 프로세스 풀에서 본문 추출
+# (작은 문서는 HTML 전달/피클링 비용이 파싱보다 커서 그대로 처리)
+PROCESS_POOL_THRESHOLD = 50_000
+PROCESS_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+# 워커 프로세스 시작 방식
+# 서버 프로세스는 HTTP 클라이언트/브라우저 풀/백그라운드 루프 스레드가 돌고 있어
+# fork하면 다른 스레드가 잡고 있던 락이 자식에 복사되어 교착될 수 있음
+# → 깨끗한 서버 프로세스에서 워커를 만드는 forkserver 사용 (미지원 플랫폼은 spawn)
+PROCESS_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+# 텍스트 fallback에서 제거할 태그 (본문과 무관한 영역)
+FALLBACK_STRIP_TAGS = ("script", "style", "nav", "footer", "header", "aside")
+
+# JS 렌더링 시 페이지 로드 / 본문 셀렉터 대기 최대 시간 (ms)
+RENDER_GOTO_TIMEOUT = 15000
+RENDER_SELECTOR_TIMEOUT = 5000
+
+# 본문이 렌더링됐다고 볼 수 있는 셀렉터
+RENDER_CONTENT_SELECTOR = "article, main, [role=main], #content"
+
+# JS 렌더링 시 차단할 리소스 (본문 텍스트/OG 메타데이터와 무관)
+RENDER_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# 텍스트로 취급하는 Content-Type 접미사 (RSS/Atom/JSON-LD 등 text/* 외 텍스트 문서)
+TEXT_MEDIA_SUFFIXES = ("+xml", "+json")
+
+# 본문 추출을 건너뛰는 바이너리 Content-Type (그 외는 모두 텍스트로 시도)
+BINARY_MEDIA_PREFIXES = ("image/", "audio/", "video/", "font/", "model/", "application/vnd.openxmlformats-")
+BINARY_MEDIA_TYPES = frozenset({
+    "application/pdf",
+    "application/octet-stream",
+    "application/zip",
+    "application/gzip",
+    "application/x-tar",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/msword",
+    "application/vnd.ms-excel",
+    "application/vnd.ms-powerpoint",
+    "application/wasm",
+})
+
 # 최소 유효 콘텐츠 길이 (이보다 짧으면 JS 렌더링 필요로 판단)
 MIN_CONTENT_LENGTH = 200
 
@@ -47,21 +147,43 @@ INACCESSIBLE_DOMAINS: frozenset[str] = frozenset([
     "www.youtu.be",
 ])
 
-# Twitter/X 도메인 (Playwright 필수)
-TWITTER_DOMAINS: frozenset[str] = frozenset([
-    "twitter.com",
-    "x.com",
-    "www.twitter.com",
-    "www.x.com",
-    "mobile.twitter.com",
-    "mobile.x.com",
-])
+# URL 판별/변환 결과 캐시 크기 (순수 함수, 같은 URL이 여러 단계에서 반복 확인됨)
+URL_CHECK_CACHE_SIZE = 4096
 
 # GitHub blob URL 패턴 (JS 렌더링이라 raw URL 변환 필요)
 GITHUB_BLOB_PATTERN = re.compile(
     r"^https?://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.+)$"
 )
 
+# fetch_url_content 처리 경로 분류 결과
+UrlKind = Literal["youtube", "twitter", "naver_blog", "github_blob", "generic"]
+
+
+def _domain_alternation(domains: frozenset[str]) -> str:
+    """도메인 목록을 정규식 대안(|)으로 변환"""
+    return "|".join(re.escape(d) for d in sorted(domains))
+
+
+# URL 분류 정규식 (분기 순서대로 대안을 나열, 첫 번째로 매칭된 그룹 이름이 분류 결과)
+# 각 대안이 매칭하는 범위:
+# - youtube: 호스트가 INACCESSIBLE_DOMAINS (임의 스킴, 별도 스크래퍼 필요)
+# - twitter: is_twitter_url (http/https, 포트 허용)
+# - naver_blog: is_naver_blog_url (url_netloc과 같은 호스트 범위)
+# - github_blob: GITHUB_BLOB_PATTERN (대소문자 구분)
+_URL_KIND_RE = re.compile(
+    r"(?P<youtube>[\x00-\x20]*(?:[a-z][a-z0-9+.-]*:)?//(?:"
+    + _domain_alternation(INACCESSIBLE_DOMAINS)
+    + r")(?=[/?#]|$))"
+    + r"|(?P<twitter>https?://"
+    + TWITTER_HOST_PATTERN
+    + r")"
+    + r"|(?P<naver_blog>[\x00-\x20]*(?:[a-z][a-z0-9+.-]*:)?//(?:"
+    + _domain_alternation(NAVER_BLOG_DOMAINS)
+    + r")(?=[/?#]|\Z))"
+    + r"|(?P<github_blob>(?-i:https?://github\.com/[^/]+/[^/]+/blob/[^/]+/.+)$)",
+    re.IGNORECASE | re.ASCII,
+)
+
 # Cloudflare 차단 감지 패턴
 CLOUDFLARE_PATTERNS = [
     "cloudflare",
@@ -75,13 +197,75 @@ CLOUDFLARE_PATTERNS = [
     "just a moment",
 ]
 
+# 검증 대기 화면 제목에 포함되는 문구 (소문자)
+CLOUDFLARE_TITLE_MARKERS = ("just a moment", "cloudflare")
+
+# 차단 패턴을 찾는 범위 (문자, 챌린지 표식은 <title>/상단 인라인 스크립트에 있음)
+CLOUDFLARE_SCAN_CHARS = 16384
+
+# 위 패턴 중 하나라도 포함되는지 한 번에 검사 (HTML 소문자 복사본 생성 없이 한 번만 스캔)
+_CLOUDFLARE_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in CLOUDFLARE_PATTERNS),
+    re.IGNORECASE,
+)
+
+
+# Cloudflare 통과 직후 HTML이 이보다 짧으면 본문이 아직 로드 중이라고 보고 한 번 더 조회
+CLOUDFLARE_SETTLED_HTML_LENGTH = 5000
+
+
+# Cloudflare 우회용 봇 감지 스크립트 우회 (컨텍스트 생성 시 한 번 주입)
+STEALTH_INIT_SCRIPT = """
+// webdriver 플래그 숨기기
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+
+// plugins 배열 채우기
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5]
+});
+
+// languages 설정
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['ko-KR', 'ko', 'en-US', 'en']
+});
+
+// Chrome 객체 추가
+window.chrome = {
+    runtime: {}
+};
+"""
+
 
 def is_cloudflare_blocked(html: str, status_code: int) -> bool:
-    """Cloudflare Bot Fight Mode 차단 여부 확인"""
-    if status_code == 403:
-        html_lower = html.lower()
-        return any(pattern in html_lower for pattern in CLOUDFLARE_PATTERNS)
-    return False
+    """Cloudflare Bot Fight Mode 차단 여부 확인 (문서 앞부분만 검사)"""
+    return status_code == 403 and _CLOUDFLARE_RE.search(html, 0, CLOUDFLARE_SCAN_CHARS) is not None
+
+
+def _cloudflare_state(html: str, title: Optional[str]) -> Literal["challenge", "blocked", "passed"]:
+    """
+    브라우저로 연 페이지의 Cloudflare 상태 분류
+
+    Returns:
+        challenge: 제목이 검증 대기 화면 ("Just a moment..." 등)
+        blocked: 문서 앞부분에 차단 표식이 있음
+        passed: 통과
+    """
+    title_lower = title.lower() if title else ""
+    if any(marker in title_lower for marker in CLOUDFLARE_TITLE_MARKERS):
+        return "challenge"
+    if is_cloudflare_blocked(html, 403):
+        return "blocked"
+    return "passed"
+
+
+async def _block_render_resources(route) -> None:
+    """JS 렌더링에 필요 없는 리소스 요청 차단"""
+    if route.request.resource_type in RENDER_BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 async def human_like_delay(min_sec: float = 0.5, max_sec: float = 2.0) -> None:
@@ -90,26 +274,100 @@ async def human_like_delay(min_sec: float = 0.5, max_sec: float = 2.0) -> None:
     await asyncio.sleep(delay)
 
 
-def is_inaccessible_url(url: str) -> bool:
-    """YouTube 등 별도 스크래퍼 필요한 URL"""
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        return domain in INACCESSIBLE_DOMAINS
-    except Exception:
-        return False
+@lru_cache(maxsize=URL_CHECK_CACHE_SIZE)
+def classify_url(url: str) -> UrlKind:
+    """
+    fetch_url_content 처리 경로 분류 (정규식 한 번으로 판별, 결과는 LRU 캐시)
 
+    Args:
+        url: 대상 URL
 
-def is_twitter_url(url: str) -> bool:
-    """Twitter/X URL인지 확인 (Playwright 필수)"""
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        return domain in TWITTER_DOMAINS
-    except Exception:
-        return False
+    Returns:
+        "youtube" | "twitter" | "naver_blog" | "github_blob" | "generic"
+    """
+    match = _URL_KIND_RE.match(url)
+    return match.lastgroup if match else "generic"
+
+
+def _html_byte_limit(max_length: int) -> int:
+    """추출할 콘텐츠 길이에 맞춘 HTML 수신 상한 (bytes)"""
+    return max(max_length * HTML_BYTES_PER_CHAR, MIN_HTML_BYTES)
+
+
+async def _read_text_capped(response: httpx.Response, limit: int) -> str:
+    """
+    스트리밍 응답 본문을 최대 limit bytes까지만 읽어 디코딩
+
+    상한에 도달하면 나머지는 받지 않음 (잘린 멀티바이트 문자는 대체 문자로)
+    """
+    buf = bytearray()
+    async for chunk in response.aiter_bytes(HTML_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) >= limit:
+            logger.info(f"HTML 수신 상한 도달, 나머지 생략: {response.url} ({len(buf):,} bytes)")
+            del buf[limit:]
+            break
+    return buf.decode(response.encoding or "utf-8", errors="replace")
+
+
+def _is_text_response(response: httpx.Response) -> bool:
+    """
+    Content-Type이 텍스트 문서인지 확인
+
+    text/*, +xml/+json 접미사는 텍스트, PDF/이미지 등 알려진 바이너리 타입만 제외
+    (헤더가 없거나 모르는 타입은 텍스트로 간주)
+    """
+    media_type = response.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if not media_type or media_type.startswith("text/") or media_type.endswith(TEXT_MEDIA_SUFFIXES):
+        return True
+    return not (media_type.startswith(BINARY_MEDIA_PREFIXES) or media_type in BINARY_MEDIA_TYPES)
+
+
+async def _get_text_capped(
+    client: httpx.AsyncClient,
+    url: str,
+    limit: int,
+    *,
+    text_only: bool = False,
+    max_attempts: int = FETCH_MAX_ATTEMPTS,
+    **kwargs,
+) -> tuple[httpx.Response, str]:
+    """
+    GET 요청 본문을 최대 limit bytes까지만 받아 텍스트로 반환
+
+    연결 실패/연결 끊김 같은 일시적 오류는 지수 백오프로 재시도
+
+    Args:
+        client: httpx.AsyncClient
+        url: 요청 URL
+        limit: 수신 상한 (bytes)
+        text_only: True면 텍스트 문서가 아닌 응답(PDF/이미지 등)은 본문을 받지 않고 빈 문자열 반환
+        max_attempts: 최대 시도 횟수
+        **kwargs: client.stream에 전달할 추가 인자
+
+    Returns:
+        (응답, 본문 텍스트) 튜플 (응답 본문은 이미 닫힘, 상태/헤더/URL만 사용)
 
+    Raises:
+        httpx.HTTPError: 재시도 대상이 아닌 오류이거나 마지막 시도까지 실패한 경우
+    """
+    async def fetch_once() -> tuple[httpx.Response, str]:
+        async with client.stream("GET", url, **kwargs) as response:
+            if text_only and not _is_text_response(response):
+                return response, ""
+            return response, await _read_text_capped(response, limit)
 
+    for attempt in range(max_attempts - 1):
+        try:
+            return await fetch_once()
+        except RETRYABLE_FETCH_ERRORS as e:
+            logger.info(f"[HTTP] 재시도 {attempt + 1}/{max_attempts - 1} ({type(e).__name__}): {url}")
+            await asyncio.sleep(backoff_delay(attempt))
+
+    return await fetch_once()
+
+
+@lru_cache(maxsize=URL_CHECK_CACHE_SIZE)
 def convert_github_blob_to_raw(url: str) -> Optional[str]:
     """
     GitHub blob URL을 raw URL로 변환
@@ -118,6 +376,9 @@ def convert_github_blob_to_raw(url: str) -> Optional[str]:
     github.com/user/repo/blob/branch/path
     → raw.githubusercontent.com/user/repo/branch/path
     """
+    # 대부분의 URL은 정규식까지 가지 않고 부분 문자열 확인으로 걸러냄
+    if "github.com/" not in url or "/blob/" not in url:
+        return None
     match = GITHUB_BLOB_PATTERN.match(url)
     if match:
         owner, repo, branch, path = match.groups()
@@ -125,30 +386,37 @@ def convert_github_blob_to_raw(url: str) -> Optional[str]:
     return None
 
 
-def extract_text_from_html(html: str) -> Optional[str]:
+def extract_text_from_html(html: str, tree=None) -> Optional[str]:
     """
     HTML에서 본문 텍스트 추출
-    1차: trafilatura
-    2차: BeautifulSoup fallback
+    1차: trafilatura 빠른 모드 (파싱된 lxml 트리가 있으면 재사용)
+    2차: trafilatura 전체 모드 (readability/justext 비교 포함)
+    3차: lxml 텍스트 fallback
     """
-    # trafilatura 시도
+    # 대부분의 페이지는 빠른 모드로 충분 (외부 추출기 비교 생략)
     content = trafilatura.extract(
-        html,
+        tree if tree is not None else html,
         include_comments=False,
         include_tables=True,
-        no_fallback=False,
+        fast=True,
     )
 
     if content and len(content) >= MIN_CONTENT_LENGTH:
         return content
 
-    # BeautifulSoup fallback
+    # 본문이 부실할 때만 외부 추출기까지 비교 (트리는 1차에서 정리되었으므로 원문 사용)
+    content = trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=True,
+    ) or content
+
+    if content and len(content) >= MIN_CONTENT_LENGTH:
+        return content
+
+    # lxml fallback (태그 제거 후 전체 텍스트)
     try:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
-            tag.decompose()
-        fallback = soup.get_text(separator="\n", strip=True)
+        fallback = _plain_text(html)
         if fallback and len(fallback) >= MIN_CONTENT_LENGTH:
             return fallback
     except Exception:
@@ -157,35 +425,121 @@ def extract_text_from_html(html: str) -> Optional[str]:
     return content  # 짧더라도 반환
 
 
+def _plain_text(html: str) -> str:
+    """
+    본문과 무관한 태그/주석을 제거한 페이지 텍스트 (공백만 있는 줄 제외, 줄 단위로 연결)
+
+    트리는 trafilatura가 정리하며 변경했을 수 있으므로 원문을 새로 파싱
+    """
+    tree = lxml_html.fromstring(html)
+    etree.strip_elements(tree, *FALLBACK_STRIP_TAGS, etree.Comment, etree.ProcessingInstruction, with_tail=False)
+    return "\n".join(text for text in (t.strip() for t in tree.itertext()) if text)
+
+
+def extract_page(html: str, base_url: str) -> tuple[Optional[str], Optional[OGMetadata]]:
+    """
+    HTML을 lxml로 한 번만 파싱해 OG 메타데이터와 본문을 함께 추출
+
+    trafilatura가 트리를 정리하며 변경하므로 OG 메타데이터를 먼저 읽음
+    lxml 파싱에 실패하면 문자열 기반 추출로 처리
+
+    Returns:
+        (본문, OG 메타데이터) 튜플
+    """
+    start_time = time.perf_counter()
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.debug(f"lxml 파싱 실패, 문자열 기반 추출: {e}")
+        return extract_text_from_html(html), extract_og_metadata(html, base_url)
+
+    og_metadata = extract_og_metadata_from_tree(tree, base_url)
+    content = extract_text_from_html(html, tree)
+    logger.debug(
+        f"페이지 추출 완료: {len(html):,}자, {(time.perf_counter() - start_time) * 1000:.1f}ms"
+    )
+    return content, og_metadata
+
+
+def _get_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """본문 추출용 프로세스 풀 (Lazy initialization)"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=PROCESS_POOL_WORKERS,
+                mp_context=multiprocessing.get_context(PROCESS_POOL_START_METHOD),
+            )
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """본문 추출용 프로세스 풀 종료"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _extract_page(html: str, base_url: str) -> tuple[Optional[str], Optional[OGMetadata]]:
+    """
+    extract_page의 비동기 버전
+
+    큰 HTML은 프로세스 풀에서 파싱하여 이벤트 루프(GIL)를 막지 않음
+    풀이 깨졌으면 다시 만들고 이번 요청은 현재 프로세스에서 처리
+    """
+    if len(html) <= PROCESS_POOL_THRESHOLD:
+        return extract_page(html, base_url)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_process_pool(), extract_page, html, base_url)
+    except BrokenProcessPool:
+        logger.warning("본문 추출 프로세스 풀 손상, 재생성 후 현재 프로세스에서 처리")
+        shutdown_process_pool()
+        return extract_page(html, base_url)
+
+
 async def fetch_with_playwright(
     url: str,
-    wait_until: str = "networkidle",
+    wait_until: str = "domcontentloaded",
     wait_time: float = 1.0,
 ) -> Optional[str]:
     """
     Playwright로 JS 렌더링 후 HTML 가져오기
 
+    광고/트래킹 요청이 계속되는 페이지는 networkidle에 도달하지 못하므로
+    기본은 DOM 로드 후 본문 영역 셀렉터가 붙을 때까지만 대기
+
     Args:
         url: 대상 URL
-        wait_until: 페이지 로드 대기 조건 (networkidle, domcontentloaded, load)
+        wait_until: 페이지 로드 대기 조건 (domcontentloaded, load, networkidle)
         wait_time: 추가 대기 시간 (초)
     """
     try:
-        from playwright.async_api import async_playwright
-
         logger.info(f"[Playwright] JS 렌더링 시작: {url} (wait_until={wait_until})")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
+        # 공유 브라우저에서 컨텍스트만 새로 발급 (Chromium 재실행 없음)
+        async with browser_context(
+            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                       "AppleWebKit/537.36 (KHTML, like Gecko) "
+                       "Chrome/120.0.0.0 Safari/537.36"
+        ) as context:
+            # 이미지/미디어/폰트/스타일시트는 받지 않음 (대역폭/로드 시간 절감)
+            await context.route("**/*", _block_render_resources)
             page = await context.new_page()
 
-            # 페이지 로드 (최대 30초)
-            await page.goto(url, wait_until=wait_until, timeout=30000)
+            # 페이지 로드
+            await page.goto(url, wait_until=wait_until, timeout=RENDER_GOTO_TIMEOUT)
+
+            # 본문 영역이 렌더링될 때까지 대기 (타임아웃이면 그대로 진행)
+            try:
+                await page.wait_for_selector(
+                    RENDER_CONTENT_SELECTOR, timeout=RENDER_SELECTOR_TIMEOUT, state="attached"
+                )
+            except PlaywrightTimeoutError:
+                pass
 
             # 동적 콘텐츠 로드 대기
             await asyncio.sleep(wait_time)
@@ -193,8 +547,6 @@ async def fetch_with_playwright(
             # HTML 가져오기
             html = await page.content()
 
-            await browser.close()
-
             logger.info(f"[Playwright] 렌더링 완료: {len(html):,} bytes")
             return html
 
@@ -236,10 +588,10 @@ async def fetch_with_scraper_api(
 
         logger.info(f"[ScraperAPI] 요청 시작: {url}")
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(proxy_url)
-            response.raise_for_status()
-            html = response.text
+        # 프록시 경유라 느리므로 요청 단위로 긴 타임아웃 지정 (공유 클라이언트 재사용)
+        response = await get_http_client().get(proxy_url, timeout=SCRAPER_API_HTTP_TIMEOUT)
+        response.raise_for_status()
+        html = response.text
 
         logger.info(f"[ScraperAPI] 성공: {url}, length={len(html)}")
         await notify(
@@ -257,6 +609,129 @@ async def fetch_with_scraper_api(
         return None, False
 
 
+async def _attempt_cloudflare_bypass(
+    page,
+    url: str,
+    notify: Callable[[str, str, Optional[str]], Awaitable[None]],
+) -> tuple[Optional[str], bool]:
+    """
+    Cloudflare 우회 1회 시도 (페이지 로드 후 사람처럼 행동하며 챌린지 통과 대기)
+
+    Returns:
+        (HTML 콘텐츠, 성공 여부) 튜플
+    """
+    # 랜덤 딜레이 후 페이지 로드
+    await human_like_delay(0.5, 1.5)
+
+    await notify(
+        "cloudflare_loading",
+        "페이지 로딩 중...",
+        url
+    )
+
+    # 페이지 로드 (domcontentloaded로 빠르게)
+    try:
+        response = await page.goto(
+            url,
+            wait_until="domcontentloaded",
+            timeout=30000
+        )
+        status_code = response.status if response else 0
+    except Exception as goto_error:
+        logger.warning(f"[Cloudflare] goto 에러 (무시): {goto_error}")
+        status_code = 0
+
+    logger.info(f"[Cloudflare] 초기 응답: status={status_code}")
+
+    # Cloudflare challenge 대기 (최대 15초)
+    await notify(
+        "cloudflare_waiting",
+        "Cloudflare 검증 대기 중...",
+        "브라우저가 사람인지 확인하고 있습니다"
+    )
+
+    # 사람처럼 행동하면서 대기
+    last_html = ""
+
+    for wait_round in range(5):
+        try:
+            # 랜덤 딜레이
+            await human_like_delay(1.5, 3.0)
+
+            # 랜덤 마우스 움직임
+            try:
+                x = random.randint(100, 800)
+                y = random.randint(100, 600)
+                await page.mouse.move(x, y)
+            except Exception:
+                pass
+
+            # 가끔 스크롤
+            if random.random() > 0.5:
+                try:
+                    scroll_amount = random.randint(100, 300)
+                    await page.mouse.wheel(0, scroll_amount)
+                except Exception:
+                    pass
+
+            # 현재 HTML 확인
+            try:
+                html = await page.content()
+                title = await page.title()
+                last_html = html
+            except Exception as content_error:
+                logger.warning(
+                    f"[Cloudflare] content 조회 에러: {content_error}"
+                )
+                break
+
+            # Cloudflare 통과 여부 확인 (제목 + 문서 앞부분 한 번만 검사)
+            state = _cloudflare_state(html, title)
+            if state == "passed":
+                logger.info(
+                    f"[Cloudflare] 우회 성공! "
+                    f"round={wait_round + 1}, title={title}"
+                )
+                await notify(
+                    "cloudflare_success",
+                    "Cloudflare 우회 성공!",
+                    f"페이지 로드 완료 ({len(html):,} bytes)"
+                )
+
+                # 방금 받은 HTML이 빈약할 때만 추가 로드를 기다려 다시 조회
+                # (DOM 전체 직렬화는 큰 페이지에서 비쌈)
+                if len(html) < CLOUDFLARE_SETTLED_HTML_LENGTH:
+                    await human_like_delay(1.0, 2.0)
+                    with contextlib.suppress(Exception):
+                        html = await page.content()
+
+                return html, True
+
+            logger.debug(
+                f"[Cloudflare] 아직 대기 중... "
+                f"round={wait_round + 1}, state={state}, title={title}"
+            )
+
+        except Exception as round_error:
+            logger.warning(
+                f"[Cloudflare] round {wait_round + 1} 에러: {round_error}"
+            )
+            break
+
+    # 5라운드 후에도 통과 못함
+    try:
+        html = await page.content()
+    except Exception:
+        html = last_html
+
+    # 마지막 시도에서 콘텐츠가 있으면 반환
+    if html and len(html) > 1000 and not is_cloudflare_blocked(html, 403):
+        logger.info(f"[Cloudflare] 부분 성공: {len(html):,} bytes")
+        return html, True
+
+    return None, False
+
+
 async def fetch_with_cloudflare_bypass(
     url: str,
     progress_callback: ProgressCallback = None,
@@ -279,9 +754,7 @@ async def fetch_with_cloudflare_bypass(
     Returns:
         (HTML 콘텐츠, 성공 여부) 튜플
     """
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not PLAYWRIGHT_AVAILABLE:
         logger.error("[Cloudflare] Playwright가 설치되지 않음")
         return None, False
 
@@ -289,196 +762,63 @@ async def fetch_with_cloudflare_bypass(
         if progress_callback:
             await progress_callback(step, message, detail)
 
-    for attempt in range(max_retries):
-        try:
-            await notify(
-                "cloudflare_bypass",
-                f"Cloudflare 우회 시도 중 ({attempt + 1}/{max_retries})",
-                "사람처럼 행동하는 브라우저로 접속 중..."
-            )
-
-            logger.info(
-                f"[Cloudflare] 우회 시도 {attempt + 1}/{max_retries}: {url}"
-            )
-
-            async with async_playwright() as p:
-                # 실제 브라우저처럼 설정 (새로운 headless 모드 사용)
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-dev-shm-usage",
-                        "--no-sandbox",
-                        "--disable-web-security",
-                        "--disable-features=IsolateOrigins,site-per-process",
-                    ],
-                    chromium_sandbox=False,
-                )
-
-                # 실제 사용자처럼 보이는 컨텍스트
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    ),
-                    viewport={"width": 1920, "height": 1080},
-                    locale="ko-KR",
-                    timezone_id="Asia/Seoul",
-                )
-
-                # 봇 감지 스크립트 우회
-                await context.add_init_script("""
-                    // webdriver 플래그 숨기기
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-
-                    // plugins 배열 채우기
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-
-                    // languages 설정
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['ko-KR', 'ko', 'en-US', 'en']
-                    });
-
-                    // Chrome 객체 추가
-                    window.chrome = {
-                        runtime: {}
-                    };
-                """)
-
-                page = await context.new_page()
-
-                # 랜덤 딜레이 후 페이지 로드
-                await human_like_delay(0.5, 1.5)
-
-                await notify(
-                    "cloudflare_loading",
-                    "페이지 로딩 중...",
-                    url
-                )
-
-                # 페이지 로드 (domcontentloaded로 빠르게)
+    try:
+        # 자동화 흔적을 지운 공유 브라우저에서 실제 사용자처럼 보이는 컨텍스트 발급
+        # 재시도 간 재사용 (컨텍스트/스크립트 준비 비용 절감, 챌린지 쿠키도 유지)
+        async with browser_context(
+            "stealth",
+            user_agent=(
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            viewport={"width": 1920, "height": 1080},
+            locale="ko-KR",
+            timezone_id="Asia/Seoul",
+        ) as context:
+            # 봇 감지 스크립트 우회
+            await context.add_init_script(STEALTH_INIT_SCRIPT)
+
+            for attempt in range(max_retries):
                 try:
-                    response = await page.goto(
-                        url,
-                        wait_until="domcontentloaded",
-                        timeout=30000
+                    await notify(
+                        "cloudflare_bypass",
+                        f"Cloudflare 우회 시도 중 ({attempt + 1}/{max_retries})",
+                        "사람처럼 행동하는 브라우저로 접속 중..."
                     )
-                    status_code = response.status if response else 0
-                except Exception as goto_error:
-                    logger.warning(f"[Cloudflare] goto 에러 (무시): {goto_error}")
-                    status_code = 0
 
-                logger.info(f"[Cloudflare] 초기 응답: status={status_code}")
-
-                # Cloudflare challenge 대기 (최대 15초)
-                await notify(
-                    "cloudflare_waiting",
-                    "Cloudflare 검증 대기 중...",
-                    "브라우저가 사람인지 확인하고 있습니다"
-                )
-
-                # 사람처럼 행동하면서 대기
-                last_html = ""
+                    logger.info(
+                        f"[Cloudflare] 우회 시도 {attempt + 1}/{max_retries}: {url}"
+                    )
 
-                for wait_round in range(5):
+                    # 시도마다 새 페이지만 열고 닫음
+                    page = await context.new_page()
                     try:
-                        # 랜덤 딜레이
-                        await human_like_delay(1.5, 3.0)
-
-                        # 랜덤 마우스 움직임
-                        try:
-                            x = random.randint(100, 800)
-                            y = random.randint(100, 600)
-                            await page.mouse.move(x, y)
-                        except Exception:
-                            pass
-
-                        # 가끔 스크롤
-                        if random.random() > 0.5:
-                            try:
-                                scroll_amount = random.randint(100, 300)
-                                await page.mouse.wheel(0, scroll_amount)
-                            except Exception:
-                                pass
-
-                        # 현재 HTML 확인
-                        try:
-                            html = await page.content()
-                            title = await page.title()
-                            last_html = html
-                        except Exception as content_error:
-                            logger.warning(
-                                f"[Cloudflare] content 조회 에러: {content_error}"
-                            )
-                            break
-
-                        # Cloudflare 통과 여부 확인
-                        if not is_cloudflare_blocked(html, 403):
-                            # 제목에 cloudflare 관련 내용이 없으면 성공
-                            title_lower = title.lower() if title else ""
-                            if "just a moment" not in title_lower and "cloudflare" not in title_lower:
-                                logger.info(
-                                    f"[Cloudflare] 우회 성공! "
-                                    f"round={wait_round + 1}, title={title}"
-                                )
-                                await notify(
-                                    "cloudflare_success",
-                                    "Cloudflare 우회 성공!",
-                                    f"페이지 로드 완료 ({len(html):,} bytes)"
-                                )
-
-                                # 최종 콘텐츠 로드 대기
-                                await human_like_delay(1.0, 2.0)
-                                with contextlib.suppress(Exception):
-                                    html = await page.content()
-
-                                await browser.close()
-                                return html, True
-
-                        logger.debug(
-                            f"[Cloudflare] 아직 대기 중... "
-                            f"round={wait_round + 1}, title={title}"
-                        )
+                        html, success = await _attempt_cloudflare_bypass(page, url, notify)
+                    finally:
+                        with contextlib.suppress(Exception):
+                            await page.close()
 
-                    except Exception as round_error:
-                        logger.warning(
-                            f"[Cloudflare] round {wait_round + 1} 에러: {round_error}"
-                        )
-                        break
-
-                # 5라운드 후에도 통과 못함
-                try:
-                    html = await page.content()
-                except Exception:
-                    html = last_html
+                    if success:
+                        return html, True
 
-                with contextlib.suppress(Exception):
-                    await browser.close()
+                    logger.warning(f"[Cloudflare] 시도 {attempt + 1} 실패, 재시도...")
 
-                # 마지막 시도에서 콘텐츠가 있으면 반환
-                if html and len(html) > 1000 and not is_cloudflare_blocked(html, 403):
-                    logger.info(f"[Cloudflare] 부분 성공: {len(html):,} bytes")
-                    return html, True
+                except Exception as e:
+                    logger.error(f"[Cloudflare] 시도 {attempt + 1} 에러: {e}")
 
-                logger.warning(f"[Cloudflare] 시도 {attempt + 1} 실패, 재시도...")
-
-        except Exception as e:
-            logger.error(f"[Cloudflare] 시도 {attempt + 1} 에러: {e}")
+                # 재시도 전 랜덤 대기
+                if attempt < max_retries - 1:
+                    wait_time = random.uniform(2.0, 5.0)
+                    await notify(
+                        "cloudflare_retry",
+                        f"재시도 대기 중... ({wait_time:.1f}초)",
+                        f"시도 {attempt + 1}/{max_retries} 실패"
+                    )
+                    await asyncio.sleep(wait_time)
 
-        # 재시도 전 랜덤 대기
-        if attempt < max_retries - 1:
-            wait_time = random.uniform(2.0, 5.0)
-            await notify(
-                "cloudflare_retry",
-                f"재시도 대기 중... ({wait_time:.1f}초)",
-                f"시도 {attempt + 1}/{max_retries} 실패"
-            )
-            await asyncio.sleep(wait_time)
+    except Exception as e:
+        logger.error(f"[Cloudflare] 브라우저 준비 실패: {e}")
 
     # 모든 시도 실패
     await notify(
@@ -494,9 +834,60 @@ async def fetch_url_content(
     url: str,
     max_length: int = 10000,
     progress_callback: ProgressCallback = None,
+    use_cache: bool = True,
 ) -> tuple[Optional[str], Optional[OGMetadata]]:
     """
-    URL에서 콘텐츠와 OG 메타데이터 가져오기
+    URL에서 콘텐츠와 OG 메타데이터 가져오기 (결과 캐시 사용)
+
+    같은 URL(추적용 쿼리 제외)과 max_length 조합은 캐시된 결과를 반환
+    성공 결과는 URL_CACHE_TTL, 실패 결과는 URL_NEGATIVE_CACHE_TTL 동안 유지
+    (Twitter/X URL은 TwitterScraper가 캐시하므로 여기서는 캐시하지 않음)
+
+    Args:
+        url: 대상 URL
+        max_length: 최대 콘텐츠 길이
+        progress_callback: 진행 상황 콜백 (step, message, detail)
+        use_cache: False면 캐시를 건너뛰고 새로 가져옴 (결과는 캐시에 저장)
+
+    Returns:
+        (추출된 텍스트 콘텐츠, OG 메타데이터) 튜플
+    """
+    # 트윗은 TwitterScraper 결과 캐시가 유일한 캐시 계층 (아티클 보강/실패 TTL을 거기서 관리)
+    if classify_url(url) == "twitter":
+        return await _fetch_url_content(url, max_length, progress_callback)
+
+    key = url_cache.cache_key(url, max_length)
+    if use_cache:
+        entry = url_cache.load_memory(key) or await asyncio.to_thread(url_cache.load_disk, key)
+        if entry is not None:
+            _, content, og = entry
+            logger.info(f"[URLCache] 캐시 적중: {url}")
+            # 호출 측에서 수정할 수 있으므로 매번 새 객체로 반환
+            return content, OGMetadata(**og) if og else None
+
+    content, og_metadata = await _fetch_url_content(url, max_length, progress_callback)
+
+    failed = content is None or (og_metadata is not None and og_metadata.fetch_failed)
+    ttl = settings.URL_NEGATIVE_CACHE_TTL if failed else settings.URL_CACHE_TTL
+    if ttl > 0:
+        og = asdict(og_metadata) if og_metadata else None
+        await asyncio.to_thread(url_cache.store, key, content, og, ttl)
+
+    return content, og_metadata
+
+
+def clear_url_cache() -> None:
+    """fetch_url_content 결과 캐시 전체 삭제 (관리용)"""
+    url_cache.clear()
+
+
+async def _fetch_url_content(
+    url: str,
+    max_length: int,
+    progress_callback: ProgressCallback = None,
+) -> tuple[Optional[str], Optional[OGMetadata]]:
+    """
+    URL에서 콘텐츠와 OG 메타데이터 가져오기 (캐시 없이)
 
     처리 순서:
     1. YouTube → 별도 스크래퍼 필요 메시지
@@ -515,8 +906,10 @@ async def fetch_url_content(
     Returns:
         (추출된 텍스트 콘텐츠, OG 메타데이터) 튜플
     """
+    kind = classify_url(url)
+
     # 1. YouTube는 별도 스크래퍼 필요
-    if is_inaccessible_url(url):
+    if kind == "youtube":
         logger.info(f"Inaccessible URL (별도 스크래퍼 필요): {url}")
         return None, OGMetadata(
             fetch_failed=True,
@@ -524,20 +917,19 @@ async def fetch_url_content(
         )
 
     # 2. Twitter/X URL은 Playwright로 직접 처리
-    if is_twitter_url(url):
+    if kind == "twitter":
         logger.info(f"Twitter URL 감지, Playwright로 처리: {url}")
         return await _fetch_twitter_content(url, max_length)
 
     # 3. 네이버 블로그 URL은 전용 스크래퍼로 처리
-    if is_naver_blog_url(url):
+    if kind == "naver_blog":
         logger.info(f"네이버 블로그 URL 감지, 전용 스크래퍼로 처리: {url}")
         return await _fetch_naver_blog_content(url, max_length)
 
     # 4. GitHub blob URL은 raw URL로 변환
-    github_raw_url = convert_github_blob_to_raw(url)
-    if github_raw_url:
+    if kind == "github_blob":
         logger.info(f"GitHub blob → raw 변환: {url}")
-        return await _fetch_raw_text(url, github_raw_url, max_length)
+        return await _fetch_raw_text(url, convert_github_blob_to_raw(url), max_length)
 
     # 5. 일반 URL 처리 (Cloudflare 감지 포함)
     return await _fetch_html_content(url, max_length, progress_callback)
@@ -611,9 +1003,8 @@ async def _fetch_naver_blog_content(
             scraper_html, scraper_success = await fetch_with_scraper_api(url, None)
 
             if scraper_success and scraper_html:
-                # trafilatura로 본문 추출
-                content = trafilatura.extract(scraper_html, include_comments=False)
-                og_metadata = extract_og_metadata(scraper_html, url)
+                # 본문 + OG 메타데이터 추출 (큰 HTML은 프로세스 풀에서 처리)
+                content, og_metadata = await _extract_page(scraper_html, url)
 
                 if content and len(content) > MIN_CONTENT_LENGTH:
                     if len(content) > max_length:
@@ -673,34 +1064,42 @@ async def _fetch_raw_text(
     Raw 텍스트 URL에서 콘텐츠 가져오기 (GitHub raw 등)
     """
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            # raw 텍스트 가져오기
-            response = await client.get(
+        client = get_http_client()
+        # raw 텍스트와 OG 메타데이터(원본 URL)를 동시에 요청 (둘 다 필요한 만큼만 수신)
+        # raw 텍스트는 max_length자를 넘는지 알 수 있을 만큼만 받음 (UTF-8 최대 4 bytes/자)
+        raw_result, og_result = await asyncio.gather(
+            _get_text_capped(
+                client,
                 raw_url,
+                (max_length + 1) * RAW_BYTES_PER_CHAR,
                 headers={"User-Agent": "Mozilla/5.0 MyRottenApple/1.0"},
                 follow_redirects=True,
-            )
-            response.raise_for_status()
-            content = response.text
-
-            # OG 메타데이터는 원본 URL에서 가져옴
-            og_metadata = None
-            try:
-                og_response = await client.get(original_url, follow_redirects=True)
-                if og_response.status_code == 200:
-                    og_metadata = extract_og_metadata(og_response.text, original_url)
-            except Exception as e:
-                logger.warning(f"OG 메타데이터 가져오기 실패: {e}")
+                timeout=FETCH_HTTP_TIMEOUT,
+            ),
+            _get_text_capped(client, original_url, _html_byte_limit(max_length), timeout=FETCH_HTTP_TIMEOUT),
+            return_exceptions=True,
+        )
+        if isinstance(raw_result, BaseException):
+            raise raw_result
+        response, content = raw_result
+        response.raise_for_status()
+
+        # OG 메타데이터는 실패해도 본문은 그대로 사용
+        og_metadata = None
+        if isinstance(og_result, BaseException):
+            logger.warning(f"OG 메타데이터 가져오기 실패: {og_result}")
+        elif og_result[0].status_code == 200:
+            og_metadata = extract_og_metadata(og_result[1], original_url)
 
-            # 콘텐츠 길이 제한
-            if content and len(content) > max_length:
-                content = content[:max_length] + "..."
+        # 콘텐츠 길이 제한
+        if content and len(content) > max_length:
+            content = content[:max_length] + "..."
 
-            logger.info(
-                f"Raw 텍스트 추출 완료: {original_url}, "
-                f"length={len(content) if content else 0}"
-            )
-            return content, og_metadata
+        logger.info(
+            f"Raw 텍스트 추출 완료: {original_url}, "
+            f"length={len(content) if content else 0}"
+        )
+        return content, og_metadata
 
     except Exception as e:
         logger.error(f"Raw 텍스트 가져오기 실패: {original_url}, error={e}")
@@ -728,39 +1127,55 @@ async def _fetch_html_content(
 
     try:
         # 1단계: 일반 HTTP 요청
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    ),
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-                },
-                follow_redirects=True,
+        # 본문은 필요한 만큼만 받고 연결을 끊음 (큰 페이지 전체를 메모리에 올리지 않음)
+        client = get_http_client()
+        response, html = await _get_text_capped(
+            client,
+            url,
+            _html_byte_limit(max_length),
+            text_only=True,
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            },
+            follow_redirects=True,
+            timeout=FETCH_HTTP_TIMEOUT,
+        )
+        status_code = response.status_code
+        final_url = str(response.url)
+
+        # PDF/이미지/압축 파일 등은 본문 추출도 브라우저 렌더링도 불가능하므로 바로 종료
+        if status_code < 400 and not _is_text_response(response):
+            content_type = response.headers.get("content-type", "")
+            logger.info(f"HTML이 아닌 응답, 추출 생략: {final_url} ({content_type})")
+            return None, OGMetadata(
+                fetch_failed=True,
+                fetch_message=(
+                    "웹 페이지가 아닌 파일 링크라 내용을 가져올 수 없습니다. "
+                    "내용을 직접 복사해서 메모에 붙여넣어 주세요."
+                ),
             )
-            status_code = response.status_code
-            html = response.text
-            final_url = str(response.url)
-
-            # 리디렉션 추적 로깅
-            if response.history:
-                redirect_detected = True
-                redirect_chain = " -> ".join(
-                    [str(r.url) for r in response.history] + [final_url]
-                )
-                logger.info(f"[Redirect] 리디렉션 체인: {redirect_chain}")
 
-                # 최종 URL이 원래 URL과 다른 도메인이면 알림
-                original_domain = urlparse(url).netloc.lower()
-                final_domain = urlparse(final_url).netloc.lower()
-                if original_domain != final_domain:
-                    logger.info(
-                        f"[Redirect] 도메인 변경: {original_domain} -> {final_domain}"
-                    )
+        # 리디렉션 추적 로깅
+        if response.history:
+            redirect_detected = True
+            redirect_chain = " -> ".join(
+                [str(r.url) for r in response.history] + [final_url]
+            )
+            logger.info(f"[Redirect] 리디렉션 체인: {redirect_chain}")
+
+            # 최종 URL이 원래 URL과 다른 도메인이면 알림
+            original_domain = url_netloc(url)
+            final_domain = url_netloc(final_url)
+            if original_domain != final_domain:
+                logger.info(
+                    f"[Redirect] 도메인 변경: {original_domain} -> {final_domain}"
+                )
 
         # 리디렉션 감지 시 Playwright로 처리 (JS 렌더링 필요한 경우가 많음)
         if redirect_detected:
@@ -849,11 +1264,8 @@ async def _fetch_html_content(
                         ),
                     )
 
-        # OG 메타데이터 추출 (리디렉션 시 최종 URL 사용)
-        og_metadata = extract_og_metadata(html, final_url)
-
-        # 2단계: 정적 HTML에서 본문 추출 시도
-        content = extract_text_from_html(html)
+        # 2단계: 정적 HTML에서 본문 + OG 메타데이터 추출 (리디렉션 시 최종 URL 사용)
+        content, og_metadata = await _extract_page(html, final_url)
         used_playwright = redirect_detected  # 리디렉션으로 이미 Playwright 사용한 경우
 
         # 3단계: 결과 부실 시 Playwright로 재시도 (Cloudflare 우회 또는 리디렉션 Playwright 사용한 경우 스킵)
@@ -890,12 +1302,12 @@ async def _fetch_html_content(
                             ),
                         )
 
-                rendered_content = extract_text_from_html(rendered_html)
+                rendered_content, rendered_og = await _extract_page(rendered_html, final_url)
                 if rendered_content and len(rendered_content) > len(content or ""):
                     content = rendered_content
                     used_playwright = True
-                    # 렌더링된 HTML에서 OG 재추출
-                    og_metadata = extract_og_metadata(rendered_html, final_url) or og_metadata
+                    # 렌더링된 HTML의 OG 사용
+                    og_metadata = rendered_og or og_metadata
 
         # 콘텐츠가 없거나 너무 짧은 경우
         if not content or len(content) < MIN_CONTENT_LENGTH:
@@ -949,8 +1361,7 @@ async def _fetch_html_content(
                 url, progress_callback
             )
             if scraper_success and scraper_html:
-                og_metadata = extract_og_metadata(scraper_html, url)
-                content = extract_text_from_html(scraper_html)
+                content, og_metadata = await _extract_page(scraper_html, url)
                 if content and len(content) > max_length:
                     content = content[:max_length] + "..."
                 logger.info(f"[ScraperAPI] HTTP 에러 우회 성공: {url}")
@@ -974,8 +1385,7 @@ async def _fetch_html_content(
                 )
 
                 if success and bypassed_html:
-                    og_metadata = extract_og_metadata(bypassed_html, url)
-                    content = extract_text_from_html(bypassed_html)
+                    content, og_metadata = await _extract_page(bypassed_html, url)
                     if content and len(content) > max_length:
                         content = content[:max_length] + "..."
                     logger.info(f"[Cloudflare] 우회 후 추출 완료: {url}")
@@ -1028,8 +1438,7 @@ async def _fetch_html_content(
                 url, progress_callback
             )
             if scraper_success and scraper_html:
-                og_metadata = extract_og_metadata(scraper_html, url)
-                content = extract_text_from_html(scraper_html)
+                content, og_metadata = await _extract_page(scraper_html, url)
                 if content and len(content) > max_length:
                     content = content[:max_length] + "..."
                 logger.info(f"[ScraperAPI] 타임아웃 복구 성공: {url}")
@@ -1054,8 +1463,7 @@ async def _fetch_html_content(
                 url, progress_callback
             )
             if scraper_success and scraper_html:
-                og_metadata = extract_og_metadata(scraper_html, url)
-                content = extract_text_from_html(scraper_html)
+                content, og_metadata = await _extract_page(scraper_html, url)
                 if content and len(content) > max_length:
                     content = content[:max_length] + "..."
                 logger.info(f"[ScraperAPI] 에러 복구 성공: {url}")
@@ -4,6 +4,7 @@ YouTube 스크래핑 서비스
 YouTube URL에서 자막(transcript)과 메타데이터를 추출합니다:
 1. oEmbed API로 메타데이터 추출 (제목, 채널명, 썸네일)
 2. youtube-transcript-api로 자막 추출
+(두 요청은 동시에 실행)
 
 - 한국어 자막 우선
 - 자막 없으면 영어 자막 시도
@@ -11,18 +12,46 @@ YouTube URL에서 자막(transcript)과 메타데이터를 추출합니다:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
-import httpx
+import orjson
 
-from app.utils import DEFAULT_USER_AGENT
+from app.services.http_client import get_http_client
+from app.utils import DEFAULT_USER_AGENT, url_netloc
 
 logger = logging.getLogger(__name__)
 
+# youtube-transcript-api 미설치 환경에서도 모듈 import는 가능하도록 처리 (모듈 로드 시 한 번만 확인)
+try:
+    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api._errors import (
+        NoTranscriptFound,
+        TranscriptsDisabled,
+        VideoUnavailable,
+    )
+except ImportError:
+    YouTubeTranscriptApi = None
+
+# YouTube 도메인
+YOUTUBE_DOMAINS = frozenset([
+    "youtube.com",
+    "www.youtube.com",
+    "m.youtube.com",
+    "youtu.be",
+    "www.youtu.be",
+])
+
+# oEmbed 요청 타임아웃 (초)
+OEMBED_TIMEOUT = 10.0
+
+# /embed/VIDEO_ID, /v/VIDEO_ID, /shorts/VIDEO_ID 경로 패턴
+_VIDEO_PATH_RE = re.compile(r"^/(?:embed|v|shorts)/([a-zA-Z0-9_-]+)")
+
 
 @dataclass
 class YouTubeScrapingResult:
@@ -54,17 +83,7 @@ class YouTubeScraper:
         Returns:
             YouTube URL이면 True
         """
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.lower() in [
-                "youtube.com",
-                "www.youtube.com",
-                "m.youtube.com",
-                "youtu.be",
-                "www.youtu.be",
-            ]
-        except Exception:
-            return False
+        return url_netloc(url) in YOUTUBE_DOMAINS
 
     def _extract_video_id(self, url: str) -> Optional[str]:
         """
@@ -103,15 +122,9 @@ class YouTubeScraper:
                         return video_ids[0]
 
                 # /embed/VIDEO_ID, /v/VIDEO_ID, /shorts/VIDEO_ID 형식
-                patterns = [
-                    r"^/embed/([a-zA-Z0-9_-]+)",
-                    r"^/v/([a-zA-Z0-9_-]+)",
-                    r"^/shorts/([a-zA-Z0-9_-]+)",
-                ]
-                for pattern in patterns:
-                    match = re.match(pattern, parsed.path)
-                    if match:
-                        return match.group(1)
+                match = _VIDEO_PATH_RE.match(parsed.path)
+                if match:
+                    return match.group(1)
 
             return None
 
@@ -137,33 +150,34 @@ class YouTubeScraper:
                 f"url=https://www.youtube.com/watch?v={video_id}&format=json"
             )
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    oembed_url,
-                    headers={"User-Agent": self.user_agent},
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    metadata["title"] = data.get("title")
-                    metadata["author_name"] = data.get("author_name")
-                    metadata["thumbnail_url"] = data.get("thumbnail_url")
+            # 공유 클라이언트 재사용 (TLS 핸드셰이크/커넥션 생성 생략)
+            response = await get_http_client().get(
+                oembed_url,
+                headers={"User-Agent": self.user_agent},
+                timeout=OEMBED_TIMEOUT,
+            )
 
-                    # 고해상도 썸네일 URL 생성
-                    if video_id:
-                        metadata["thumbnail_url"] = (
-                            f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                        )
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                metadata["title"] = data.get("title")
+                metadata["author_name"] = data.get("author_name")
+                metadata["thumbnail_url"] = data.get("thumbnail_url")
 
-                    logger.info(
-                        f"[YouTubeScraper] oEmbed 메타데이터 추출 성공: "
-                        f"title={metadata.get('title')}"
-                    )
-                else:
-                    logger.warning(
-                        f"[YouTubeScraper] oEmbed API 실패: status={response.status_code}"
+                # 고해상도 썸네일 URL 생성
+                if video_id:
+                    metadata["thumbnail_url"] = (
+                        f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
                     )
 
+                logger.info(
+                    f"[YouTubeScraper] oEmbed 메타데이터 추출 성공: "
+                    f"title={metadata.get('title')}"
+                )
+            else:
+                logger.warning(
+                    f"[YouTubeScraper] oEmbed API 실패: status={response.status_code}"
+                )
+
         except Exception as e:
             logger.error(f"[YouTubeScraper] 메타데이터 추출 실패: {e}")
 
@@ -173,20 +187,34 @@ class YouTubeScraper:
         """
         youtube-transcript-api로 자막 추출
 
+        youtube-transcript-api는 동기 HTTP 요청을 사용하므로
+        이벤트 루프를 막지 않도록 워커 스레드에서 실행
+
         Args:
             video_id: YouTube 비디오 ID
 
         Returns:
             (자막 텍스트, 언어 코드) 튜플
         """
-        try:
-            from youtube_transcript_api import YouTubeTranscriptApi
-            from youtube_transcript_api._errors import (
-                NoTranscriptFound,
-                TranscriptsDisabled,
-                VideoUnavailable,
+        if YouTubeTranscriptApi is None:
+            logger.error(
+                "[YouTubeScraper] youtube-transcript-api 패키지가 설치되지 않았습니다"
             )
+            return None, None
+
+        return await asyncio.to_thread(self._fetch_transcript, video_id)
+
+    def _fetch_transcript(self, video_id: str) -> tuple[Optional[str], Optional[str]]:
+        """
+        자막 추출 (동기, 워커 스레드에서 호출)
 
+        Args:
+            video_id: YouTube 비디오 ID
+
+        Returns:
+            (자막 텍스트, 언어 코드) 튜플
+        """
+        try:
             # 한국어 자막 우선 시도
             preferred_languages = ["ko", "en", "en-US", "en-GB"]
 
@@ -283,12 +311,6 @@ class YouTubeScraper:
                 logger.warning("[YouTubeScraper] 사용 가능한 자막이 없습니다")
                 return None, None
 
-        except ImportError:
-            logger.error(
-                "[YouTubeScraper] youtube-transcript-api 패키지가 설치되지 않았습니다"
-            )
-            return None, None
-
         except Exception as e:
             logger.error(f"[YouTubeScraper] 자막 추출 실패: {e}", exc_info=True)
             return None, None
@@ -317,14 +339,15 @@ class YouTubeScraper:
         result.video_id = video_id
         logger.info(f"[YouTubeScraper] 스크래핑 시작: video_id={video_id}")
 
-        # 메타데이터 추출
-        metadata = await self._get_metadata(video_id)
+        # 메타데이터와 자막은 서로 독립적이므로 동시에 추출
+        metadata, (transcript, language) = await asyncio.gather(
+            self._get_metadata(video_id),
+            self._get_transcript(video_id),
+        )
         result.og_title = metadata.get("title")
         result.og_description = metadata.get("author_name")  # 채널명
         result.og_image = metadata.get("thumbnail_url")
 
-        # 자막 추출
-        transcript, language = await self._get_transcript(video_id)
         if transcript:
             result.content = transcript
             result.language = language
@@ -5,10 +5,12 @@
 - 시간 유틸리티
 - 공통 상수
 - 백그라운드 비동기 작업 유틸리티
+- URL 호스트(netloc) 추출
 """
 
 import asyncio
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Callable, Coroutine
 
 from ulid import ULID
@@ -39,12 +41,64 @@ DEFAULT_USER_AGENT = (
 )
 
 
+# urlparse가 URL 앞에서 제거하는 문자 (C0 제어 문자 + 공백)
+_URL_LEADING_JUNK = "".join(chr(c) for c in range(0x21))
+
+# URL 스킴에 허용되는 문자 (첫 글자는 영문자)
+_SCHEME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-.")
+
+# netloc 추출 결과 캐시 크기 (같은 URL이 YouTube/네이버/리디렉션 판별 등에서 반복 조회됨)
+URL_NETLOC_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=URL_NETLOC_CACHE_SIZE)
+def url_netloc(url: str) -> str:
+    """
+    URL의 netloc을 소문자로 반환 (urlparse(url).netloc.lower()와 같은 결과)
+
+    ParseResult를 만들지 않고 문자열 탐색만으로 잘라내는 빠른 버전
+    도메인 목록 비교처럼 netloc만 필요한 곳에서 사용 (결과는 URL별로 캐시)
+
+    Args:
+        url: URL 문자열
+
+    Returns:
+        소문자 netloc (없으면 빈 문자열)
+    """
+    url = url.lstrip(_URL_LEADING_JUNK)
+    start = url.find("//")
+    if start < 0:
+        return ""
+    if start > 0:
+        # "//" 앞은 "scheme:" 형태여야 함
+        scheme = url[: start - 1]
+        if (
+            url[start - 1] != ":"
+            or not scheme
+            or not scheme[0].isascii()
+            or not scheme[0].isalpha()
+            or not _SCHEME_CHARS.issuperset(scheme)
+        ):
+            return ""
+
+    start += 2
+    end = len(url)
+    for sep in "/?#":
+        pos = url.find(sep, start, end)
+        if pos >= 0:
+            end = pos
+    host = url[start:end]
+    # 대부분 이미 소문자이므로 복사본 생성 생략
+    return host if host.islower() else host.lower()
+
+
 def run_async_in_thread(async_func: Callable[[], Coroutine[Any, Any, Any]]) -> None:
     """
     백그라운드 스레드에서 비동기 함수 실행
 
     FastAPI BackgroundTasks는 별도 스레드에서 실행되므로,
     새 이벤트 루프를 생성하여 비동기 함수를 실행합니다.
+    루프를 닫기 전에 해당 루프의 공유 HTTP 클라이언트와 브라우저 풀을 정리합니다.
 
     Args:
         async_func: 실행할 비동기 함수 (인자 없는 코루틴 반환 함수)
@@ -54,4 +108,10 @@ def run_async_in_thread(async_func: Callable[[], Coroutine[Any, Any, Any]]) -> N
     try:
         loop.run_until_complete(async_func())
     finally:
+        # 순환 import 방지를 위해 지연 import
+        from app.services.browser_pool import close_browser_pool
+        from app.services.http_client import close_http_client
+
+        loop.run_until_complete(close_browser_pool())
+        loop.run_until_complete(close_http_client())
         loop.close()
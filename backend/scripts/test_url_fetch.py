@@ -45,13 +45,13 @@ def extract_text_from_html(html: str) -> Tuple[Optional[str], str]:
         return content, "trafilatura"
 
     try:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
-            tag.decompose()
-        fallback = soup.get_text(separator="\n", strip=True)
+        from lxml import etree
+        from lxml import html as lxml_html
+        tree = lxml_html.fromstring(html)
+        etree.strip_elements(tree, "script", "style", "nav", "footer", "header", "aside", with_tail=False)
+        fallback = "\n".join(text for text in (t.strip() for t in tree.itertext()) if text)
         if fallback and len(fallback) >= MIN_CONTENT_LENGTH:
-            return fallback, "beautifulsoup"
+            return fallback, "lxml"
     except Exception:
         pass
 
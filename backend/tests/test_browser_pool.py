@@ -0,0 +1,99 @@
+"""
+공유 브라우저 풀 테스트 (실제 Chromium 대신 가짜 객체 사용)
+"""
+
+from app.services import browser_pool
+from app.services.browser_pool import _BrowserPool
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        return FakeContext()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+async def test_reuses_browser_and_closes_context():
+    """같은 종류는 브라우저 하나를 재사용하고 반납 시 컨텍스트만 닫음"""
+    pool = _BrowserPool(playwright=FakePlaywright())
+
+    first = await pool.acquire()
+    await pool.release(first)
+    second = await pool.acquire()
+    await pool.release(second)
+
+    launched = pool.playwright.chromium.launched
+    assert len(launched) == 1
+    assert first.closed and second.closed
+    assert not launched[0].closed
+
+
+async def test_recycles_browser_after_limit(monkeypatch):
+    """발급 상한에 도달한 브라우저는 마지막 컨텍스트 반납 후 교체"""
+    monkeypatch.setattr(browser_pool, "BROWSER_POOL_RECYCLE_AFTER", 2)
+    pool = _BrowserPool(playwright=FakePlaywright())
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    third = await pool.acquire()
+
+    launched = pool.playwright.chromium.launched
+    assert len(launched) == 2
+    assert not launched[0].closed  # 아직 반납 안 된 컨텍스트가 있음
+
+    await pool.release(first)
+    await pool.release(second)
+    assert launched[0].closed
+    assert not launched[1].closed
+
+    await pool.release(third)
+    playwright = pool.playwright
+    await pool.close()
+    assert launched[1].closed
+    assert playwright.stopped
+
+
+async def test_prewarm_launches_browser(monkeypatch):
+    """예열하면 첫 요청 전에 브라우저를 실행해 둠"""
+    pool = _BrowserPool(playwright=FakePlaywright())
+    monkeypatch.setattr(browser_pool, "get_browser_pool", lambda: pool)
+
+    await browser_pool.prewarm_browser_pool()
+    context = await pool.acquire()
+    await pool.release(context)
+
+    assert len(pool.playwright.chromium.launched) == 1
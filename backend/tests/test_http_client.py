@@ -0,0 +1,102 @@
+"""
+공유 HTTP 클라이언트 테스트
+"""
+
+import asyncio
+
+import httpx
+
+from app.services import http_client
+from app.services.http_client import close_http_client, get_http_client, get_with_retry
+
+
+async def test_get_http_client_reused_in_same_loop():
+    """같은 이벤트 루프에서는 같은 클라이언트 재사용"""
+    client = get_http_client()
+    assert get_http_client() is client
+
+    await close_http_client()
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_client()
+
+
+def test_get_http_client_per_loop():
+    """이벤트 루프마다 별도 클라이언트 생성"""
+
+    async def get_and_close():
+        client = get_http_client()
+        await close_http_client()
+        return client
+
+    first = asyncio.run(get_and_close())
+    second = asyncio.run(get_and_close())
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+async def test_get_with_retry_retries_transient_status(monkeypatch):
+    """5xx 응답은 재시도 후 성공 응답 반환"""
+    monkeypatch.setattr(http_client, "_retry_delay", lambda attempt, response=None: 0)
+    statuses = iter([503, 502, 200])
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await get_with_retry(client, "https://example.com")
+
+    assert response.status_code == 200
+
+
+async def test_get_with_retry_gives_up(monkeypatch):
+    """최대 시도 횟수를 넘으면 마지막 응답 반환"""
+    monkeypatch.setattr(http_client, "_retry_delay", lambda attempt, response=None: 0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response = await get_with_retry(client, "https://example.com", max_attempts=3)
+
+    assert response.status_code == 500
+    assert len(calls) == 3
+
+
+async def test_get_with_retry_no_retry_on_client_error():
+    """4xx(429 제외)는 재시도하지 않음"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response = await get_with_retry(client, "https://example.com")
+
+    assert response.status_code == 404
+    assert len(calls) == 1
+
+
+def test_retry_delay_honors_retry_after():
+    """Retry-After가 짧으면 그대로, 길면 재시도 안 함"""
+    assert http_client._retry_delay(0, httpx.Response(429, headers={"Retry-After": "1"})) == 1.0
+    assert http_client._retry_delay(0, httpx.Response(429, headers={"Retry-After": "60"})) is None
+
+
+async def test_get_with_retry_retries_transport_error(monkeypatch):
+    """연결이 끊기는 등 전송 오류도 재시도"""
+    monkeypatch.setattr(http_client, "_retry_delay", lambda attempt, response=None: 0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.RemoteProtocolError("connection closed", request=request)
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response = await get_with_retry(client, "https://example.com")
+
+    assert response.status_code == 200
+    assert len(calls) == 2
@@ -0,0 +1,171 @@
+"""
+Playwright 워커 로그인 흐름 테스트 (브라우저 없이 가짜 페이지/컨텍스트 사용)
+"""
+
+import orjson
+
+from app.services import playwright_worker
+
+
+class FakeContext:
+    def __init__(self, cookies=None):
+        self._cookies = list(cookies or [])
+
+    def cookies(self):
+        return self._cookies
+
+    def storage_state(self, path):
+        with open(path, "wb") as f:
+            f.write(orjson.dumps({"cookies": self._cookies, "origins": []}))
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.visited = []
+
+    def goto(self, url, **kwargs):
+        self.visited.append(url)
+
+
+def test_ensure_logged_in_skips_login_with_session_cookie(monkeypatch):
+    """auth_token 쿠키가 있으면 홈/로그인 페이지로 이동하지 않음"""
+    monkeypatch.setenv("TWITTER_USERNAME", "user")
+    monkeypatch.setenv("TWITTER_PASSWORD", "pass")
+    context = FakeContext([{"name": "auth_token", "value": "t"}])
+    page = FakePage(context)
+
+    assert playwright_worker._ensure_logged_in(context, page) is False
+    assert page.visited == []
+
+
+def test_ensure_logged_in_logs_in_without_session_cookie(monkeypatch):
+    """세션 쿠키가 없고 계정 정보가 있으면 로그인"""
+    monkeypatch.setenv("TWITTER_USERNAME", "user")
+    monkeypatch.setenv("TWITTER_PASSWORD", "pass")
+    logins = []
+    monkeypatch.setattr(playwright_worker, "_login", lambda page, u, p: logins.append((u, p)) or True)
+    context = FakeContext()
+
+    assert playwright_worker._ensure_logged_in(context, FakePage(context)) is True
+    assert logins == [("user", "pass")]
+
+
+def test_ensure_logged_in_saves_storage_state_after_login(tmp_path, monkeypatch):
+    """로그인에 성공하면 storage_state를 세션 파일로 저장 (임시 파일은 남기지 않음)"""
+    monkeypatch.setenv("TWITTER_USERNAME", "user")
+    monkeypatch.setenv("TWITTER_PASSWORD", "pass")
+    context = FakeContext()
+
+    def fake_login(page, username, password):
+        context._cookies.append({"name": "auth_token", "value": "t"})
+        return True
+
+    monkeypatch.setattr(playwright_worker, "_login", fake_login)
+    state_path = tmp_path / "twitter_state.json"
+
+    assert playwright_worker._ensure_logged_in(context, FakePage(context), str(state_path)) is True
+    assert orjson.loads(state_path.read_bytes())["cookies"] == [{"name": "auth_token", "value": "t"}]
+    assert [p.name for p in tmp_path.iterdir()] == ["twitter_state.json"]
+
+
+def test_ensure_logged_in_skips_without_credentials(monkeypatch):
+    """계정 정보가 없으면 로그인하지 않고 공개 콘텐츠만 추출"""
+    monkeypatch.delenv("TWITTER_USERNAME", raising=False)
+    monkeypatch.delenv("TWITTER_PASSWORD", raising=False)
+
+    def fail_login(*args):
+        raise AssertionError("로그인하면 안 됨")
+
+    monkeypatch.setattr(playwright_worker, "_login", fail_login)
+    context = FakeContext()
+
+    assert playwright_worker._ensure_logged_in(context, FakePage(context)) is False
+
+
+class SelectorPage:
+    """셀렉터별로 미리 정한 요소를 돌려주는 가짜 페이지"""
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.queries = []
+
+    def query_selector(self, selector):
+        self.queries.append(selector)
+        return self.elements.get(selector)
+
+
+def test_find_button_prefers_testid_then_button_over_wrapper_div():
+    """data-testid → button → div[role=button] 순서로 찾고 첫 일치에서 멈춤"""
+    page = SelectorPage({
+        'button[data-testid="LoginForm_Login_Button"]': "testid",
+        'button:has-text("Log in")': "button",
+        'div[role="button"]:has-text("Log in")': "wrapper",
+    })
+    assert playwright_worker._find_button(page, ["Log in"], data_testid="LoginForm_Login_Button") == "testid"
+    assert len(page.queries) == 1
+
+    page = SelectorPage({
+        'button:has-text("다음")': "button",
+        'div[role="button"]:has-text("Next")': "wrapper",
+    })
+    assert playwright_worker._find_button(page, ["Next", "다음"]) == "wrapper"
+
+    page = SelectorPage({
+        'button:has-text("Next")': "button",
+        'div[role="button"]:has-text("Next")': "wrapper",
+    })
+    assert playwright_worker._find_button(page, ["Next", "다음"]) == "button"
+    assert playwright_worker._find_button(SelectorPage({}), ["Next"]) is None
+
+
+class FakeInput:
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+
+    def fill(self, value):
+        self.calls.append(("fill", self.name, value))
+
+    def press(self, key):
+        self.calls.append(("press", self.name, key))
+
+
+class LoginPage(FakePage):
+    """로그인 흐름 호출을 기록하는 가짜 페이지 (제출하면 세션 쿠키가 생김)"""
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.calls = []
+
+    def wait_for_selector(self, selector, **kwargs):
+        self.calls.append(("wait_for_selector", selector))
+        return FakeInput(self.calls, "password" if "password" in selector else "username")
+
+    def query_selector(self, selector):
+        return None
+
+    def wait_for_url(self, pattern, **kwargs):
+        self.calls.append(("wait_for_url", pattern.pattern))
+        self.context._cookies.append({"name": "auth_token", "value": "t"})
+
+    def wait_for_timeout(self, ms):
+        raise AssertionError("고정 sleep 사용")
+
+
+def test_login_waits_for_events_instead_of_sleeping():
+    """입력 필드와 홈 URL을 기다리고 고정 sleep은 쓰지 않음"""
+    context = FakeContext()
+    page = LoginPage(context)
+
+    assert playwright_worker._login(page, "user", "pass") is True
+    assert page.visited == [playwright_worker.LOGIN_URL]
+    assert page.calls == [
+        ("wait_for_selector", 'input[autocomplete="username"]'),
+        ("fill", "username", "user"),
+        ("press", "username", "Enter"),
+        ("wait_for_selector", 'input[type="password"]'),
+        ("fill", "password", "pass"),
+        ("press", "password", "Enter"),
+        ("wait_for_url", playwright_worker.HOME_URL_RE.pattern),
+    ]
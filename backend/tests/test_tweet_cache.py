@@ -0,0 +1,45 @@
+"""
+트윗 디스크 캐시 테스트
+"""
+
+import time
+
+import pytest
+
+from app.services import tweet_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_db(tmp_path, monkeypatch):
+    """임시 디렉토리의 캐시 DB 사용"""
+    monkeypatch.setattr(tweet_cache, "CACHE_DB_PATH", tmp_path / "tweet_cache.db")
+    monkeypatch.setattr(tweet_cache, "_conn", None)
+    yield
+    if tweet_cache._conn is not None:
+        tweet_cache._conn.close()
+
+
+def test_store_and_load():
+    """저장한 결과와 만료 시각 조회"""
+    tweet_cache.store("123", {"content": "안녕하세요", "success": True}, ttl=60)
+    expires_at, payload = tweet_cache.load("123")
+    assert payload == {"content": "안녕하세요", "success": True}
+    assert time.time() < expires_at <= time.time() + 60
+
+
+def test_load_missing():
+    """없는 트윗은 None"""
+    assert tweet_cache.load("404") is None
+
+
+def test_load_expired():
+    """만료된 결과는 None"""
+    tweet_cache.store("123", {"content": "old"}, ttl=-1)
+    assert tweet_cache.load("123") is None
+
+
+def test_store_overwrites():
+    """같은 tweet_id는 덮어쓰기"""
+    tweet_cache.store("123", {"content": "old"}, ttl=60)
+    tweet_cache.store("123", {"content": "new"}, ttl=60)
+    assert tweet_cache.load("123")[1] == {"content": "new"}
@@ -0,0 +1,322 @@
+"""
+Twitter 스크래핑 오케스트레이션 테스트
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.config import settings
+from app.services import tweet_cache
+from app.services import twitter_scraper as twitter_scraper_module
+from app.services.twitter_playwright import PlaywrightResult
+from app.services.twitter_scraper import TwitterScraper, TwitterScrapingResult
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache(tmp_path, monkeypatch):
+    """테스트마다 빈 결과 캐시(메모리 + 임시 디스크 DB) 사용"""
+    monkeypatch.setattr(twitter_scraper_module, "_result_cache", {})
+    monkeypatch.setattr(tweet_cache, "CACHE_DB_PATH", tmp_path / "tweet_cache.db")
+    monkeypatch.setattr(tweet_cache, "_conn", None)
+    yield
+    if tweet_cache._conn is not None:
+        tweet_cache._conn.close()
+
+
+async def test_scrape_deduplicates_concurrent_requests(monkeypatch):
+    """같은 트윗 동시 요청은 한 번만 스크래핑"""
+    calls = []
+
+    async def fake_scrape(self, url, tweet_id):
+        calls.append(url)
+        await asyncio.sleep(0.05)
+        return TwitterScrapingResult(content="본문", success=True)
+
+    monkeypatch.setattr(TwitterScraper, "_scrape", fake_scrape)
+    scraper = TwitterScraper()
+
+    first, second = await asyncio.gather(
+        scraper.scrape("https://x.com/user/status/123"),
+        scraper.scrape("https://twitter.com/user/status/123?s=20"),
+    )
+
+    assert len(calls) == 1
+    assert first.content == second.content == "본문"
+    assert first is not second
+
+
+async def test_cancelled_waiter_does_not_cancel_owner(monkeypatch):
+    """대기 중인 요청이 취소돼도 실행 중인 스크래핑은 결과를 반환"""
+
+    async def fake_scrape(self, url, tweet_id):
+        await asyncio.sleep(0.05)
+        return TwitterScrapingResult(content="본문", success=True)
+
+    monkeypatch.setattr(TwitterScraper, "_scrape", fake_scrape)
+    scraper = TwitterScraper()
+
+    owner = asyncio.create_task(scraper.scrape("https://x.com/user/status/123"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(scraper.scrape("https://x.com/user/status/123"))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+
+    assert (await owner).content == "본문"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+async def test_cancelled_owner_lets_waiter_retry(monkeypatch):
+    """실행 측 요청이 취소되면 대기자는 CancelledError 대신 직접 다시 실행"""
+    calls = []
+
+    async def fake_scrape(self, url, tweet_id):
+        calls.append(url)
+        await asyncio.sleep(0.05)
+        return TwitterScrapingResult(content="본문", success=True)
+
+    monkeypatch.setattr(TwitterScraper, "_scrape", fake_scrape)
+    scraper = TwitterScraper()
+
+    owner = asyncio.create_task(scraper.scrape("https://x.com/user/status/123"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(scraper.scrape("https://x.com/user/status/123"))
+    await asyncio.sleep(0.01)
+    owner.cancel()
+
+    assert (await waiter).content == "본문"
+    assert len(calls) == 2
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+
+async def test_scrape_uses_result_cache(monkeypatch):
+    """완료된 결과는 캐시에서 반환"""
+    calls = []
+
+    async def fake_scrape(self, url, tweet_id):
+        calls.append(url)
+        return TwitterScrapingResult(content="본문", success=True)
+
+    monkeypatch.setattr(TwitterScraper, "_scrape", fake_scrape)
+    scraper = TwitterScraper()
+
+    first = await scraper.scrape("https://x.com/user/status/123")
+    second = await scraper.scrape("https://x.com/user/status/123")
+
+    assert len(calls) == 1
+    assert second.content == "본문"
+    assert first is not second
+
+
+def test_result_cache_evicts_least_recently_used(monkeypatch):
+    """최대 크기 초과 시 최근에 조회한 항목은 남기고 가장 오래 안 쓴 항목부터 제거"""
+    monkeypatch.setattr(twitter_scraper_module, "RESULT_CACHE_MAX_SIZE", 2)
+    twitter_scraper_module._set_cached_result("1", TwitterScrapingResult(content="a"), 60)
+    twitter_scraper_module._set_cached_result("2", TwitterScrapingResult(content="b"), 60)
+
+    assert twitter_scraper_module._get_cached_result("1").content == "a"
+    twitter_scraper_module._set_cached_result("3", TwitterScrapingResult(content="c"), 60)
+
+    assert list(twitter_scraper_module._result_cache) == ["1", "3"]
+
+
+async def test_scrape_uses_disk_cache_after_memory_miss(monkeypatch):
+    """메모리 캐시가 비어도(재시작) 디스크 캐시에서 반환하고 메모리에 다시 올림"""
+    calls = []
+
+    async def fake_scrape(self, url, tweet_id):
+        calls.append(url)
+        return TwitterScrapingResult(content="본문", success=True, tweet_id="123")
+
+    monkeypatch.setattr(TwitterScraper, "_scrape", fake_scrape)
+    scraper = TwitterScraper()
+
+    await scraper.scrape("https://x.com/user/status/123")
+    twitter_scraper_module._result_cache.clear()
+    cached = await scraper.scrape("https://x.com/user/status/123")
+
+    assert len(calls) == 1
+    assert cached == TwitterScrapingResult(content="본문", success=True, tweet_id="123")
+    assert "123" in twitter_scraper_module._result_cache
+
+
+async def test_scrape_runs_again_when_cache_disabled(monkeypatch):
+    """TTL이 0이면 매번 스크래핑"""
+    calls = []
+
+    async def fake_scrape(self, url, tweet_id):
+        calls.append(url)
+        return TwitterScrapingResult(success=False)
+
+    monkeypatch.setattr(TwitterScraper, "_scrape", fake_scrape)
+    monkeypatch.setattr(settings, "TWITTER_NEGATIVE_CACHE_TTL", 0)
+    scraper = TwitterScraper()
+
+    await scraper.scrape("https://x.com/user/status/123")
+    await scraper.scrape("https://x.com/user/status/123")
+
+    assert len(calls) == 2
+
+
+async def test_scrape_strict_tweet_only_skips_non_status_url(monkeypatch):
+    """strict_tweet_only이면 트윗 ID 없는 URL은 스크래핑하지 않음"""
+    calls = []
+
+    async def fake_scrape(self, url, tweet_id):
+        calls.append(url)
+        return TwitterScrapingResult(success=True)
+
+    monkeypatch.setattr(TwitterScraper, "_scrape", fake_scrape)
+    scraper = TwitterScraper(strict_tweet_only=True)
+
+    result = await scraper.scrape("https://x.com/user")
+
+    assert calls == []
+    assert result.success is False
+    assert result.error
+
+
+async def test_scrape_without_tweet_id_skips_syndication(monkeypatch):
+    """트윗 ID가 없는 URL은 Syndication 없이 바로 Playwright"""
+
+    async def fail_syndication(url, tweet_id=None):
+        raise AssertionError("Syndication 호출되면 안 됨")
+
+    async def fake_playwright(self, url):
+        return PlaywrightResult(content="article", success=True)
+
+    monkeypatch.setattr(twitter_scraper_module, "fetch_tweet_metadata", fail_syndication)
+    monkeypatch.setattr(TwitterScraper, "_scrape_with_playwright", fake_playwright)
+
+    result = await TwitterScraper().scrape("https://x.com/i/article/abc")
+
+    assert result.success is True
+    assert result.content == "article"
+
+
+def test_limit_applies_across_event_loops(monkeypatch):
+    """BackgroundTasks처럼 스레드마다 다른 이벤트 루프여도 동시 실행 수 제한 공유"""
+    monkeypatch.setitem(twitter_scraper_module._semaphores, "playwright", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(twitter_scraper_module, "SEMAPHORE_POLL_INTERVAL", 0.001)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def work():
+        nonlocal running, peak
+        async with twitter_scraper_module._limit("playwright"):
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=asyncio.run, args=(work(),)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 1
+
+
+def test_limit_isolates_syndication_from_playwright(monkeypatch):
+    """다른 이벤트 루프에서 Playwright 자리가 모두 차 있어도 Syndication은 바로 진행 (bulkhead)"""
+    monkeypatch.setitem(twitter_scraper_module._semaphores, "playwright", threading.BoundedSemaphore(1))
+    monkeypatch.setitem(twitter_scraper_module._semaphores, "syndication", threading.BoundedSemaphore(1))
+    entered = threading.Event()
+    release = threading.Event()
+
+    async def hold_playwright():
+        async with twitter_scraper_module._limit("playwright"):
+            entered.set()
+            await asyncio.to_thread(release.wait)
+
+    async def syndication():
+        async with twitter_scraper_module._limit("syndication"):
+            return True
+
+    holder = threading.Thread(target=asyncio.run, args=(hold_playwright(),))
+    holder.start()
+    try:
+        assert entered.wait(1)
+        assert asyncio.run(asyncio.wait_for(syndication(), timeout=1))
+    finally:
+        release.set()
+        holder.join()
+
+
+async def test_limit_releases_slot_when_cancelled(monkeypatch):
+    """자리를 기다리던 요청이 취소돼도 자리가 새지 않음"""
+    semaphore = threading.BoundedSemaphore(1)
+    monkeypatch.setitem(twitter_scraper_module._semaphores, "playwright", semaphore)
+    monkeypatch.setattr(twitter_scraper_module, "SEMAPHORE_POLL_INTERVAL", 0.001)
+
+    async with twitter_scraper_module._limit("playwright"):
+        waiter = asyncio.create_task(twitter_scraper_module._limit("playwright").__aenter__())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    assert semaphore.acquire(blocking=False)
+
+
+async def test_playwright_circuit_breaker_opens_after_failures(monkeypatch):
+    """Playwright가 연속 실패하면 쿨다운 동안 호출하지 않음"""
+    calls = []
+
+    async def failing_scrape(url):
+        calls.append(url)
+        return PlaywrightResult(error="boom")
+
+    scraper = TwitterScraper()
+    monkeypatch.setattr(scraper.playwright_scraper, "scrape", failing_scrape)
+
+    for _ in range(scraper._pw_breaker.threshold + 2):
+        await scraper._scrape_with_playwright("https://x.com/i/article/1")
+
+    assert len(calls) == scraper._pw_breaker.threshold
+    assert not scraper._pw_breaker.allow_request()
+
+
+async def test_playwright_circuit_breaker_ignores_content_failures(monkeypatch):
+    """삭제/비공개 트윗(4xx) 실패는 장애로 세지 않고, 5xx/429만 셈"""
+    scraper = TwitterScraper()
+
+    async def not_found(url):
+        return PlaywrightResult(error="no content", status=404)
+
+    monkeypatch.setattr(scraper.playwright_scraper, "scrape", not_found)
+    for _ in range(scraper._pw_breaker.threshold + 1):
+        await scraper._scrape_with_playwright("https://x.com/user/status/1")
+    assert scraper._pw_breaker.failures == 0
+
+    async def rate_limited(url):
+        return PlaywrightResult(error="HTTP 429", status=429)
+
+    monkeypatch.setattr(scraper.playwright_scraper, "scrape", rate_limited)
+    await scraper._scrape_with_playwright("https://x.com/user/status/1")
+    assert scraper._pw_breaker.failures == 1
+
+
+def test_circuit_breaker_allows_single_probe_after_cooldown():
+    """cooldown이 지나면 시험 호출 하나만 통과, 결과가 나오기 전 다른 요청은 차단"""
+    breaker = twitter_scraper_module._CircuitBreaker("test", threshold=1, cooldown=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.allow_request()
+    assert breaker.allow_request()
@@ -0,0 +1,69 @@
+"""
+Twitter Syndication API 클라이언트 테스트
+"""
+
+import time
+
+import httpx
+
+from app.services.twitter_syndication import (
+    DEFAULT_RATE_LIMIT_BACKOFF_SECONDS,
+    MAX_RATE_LIMIT_BACKOFF_SECONDS,
+    _find_tco_urls,
+    _parse_retry_after,
+    _rate_limit_delay,
+    _resolve_tco_link,
+)
+
+
+def test_parse_retry_after_seconds():
+    """초 단위 Retry-After"""
+    assert _parse_retry_after("30") == 30.0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("invalid") is None
+
+
+def test_rate_limit_delay_429():
+    """429 응답은 Retry-After 또는 기본값만큼 대기"""
+    assert _rate_limit_delay(httpx.Response(429, headers={"Retry-After": "12"})) == 12.0
+    assert _rate_limit_delay(httpx.Response(429)) == DEFAULT_RATE_LIMIT_BACKOFF_SECONDS
+
+
+def test_rate_limit_delay_remaining_zero():
+    """남은 호출 수가 0이면 reset 시각까지 대기 (최대값 제한)"""
+    reset = str(int(time.time()) + 10_000)
+    response = httpx.Response(200, headers={"x-rate-limit-remaining": "0", "x-rate-limit-reset": reset})
+    assert _rate_limit_delay(response) == MAX_RATE_LIMIT_BACKOFF_SECONDS
+
+
+def test_rate_limit_delay_none():
+    """정상 응답은 대기 없음"""
+    assert _rate_limit_delay(httpx.Response(200, headers={"x-rate-limit-remaining": "5"})) is None
+
+
+def test_find_tco_urls():
+    """t.co 링크를 등장 순서대로 추출"""
+    text = "글 https://t.co/abc_1 그리고 https://t.co/XYZ. 끝 https://t.co/ 없음"
+    assert _find_tco_urls(text) == ["https://t.co/abc_1", "https://t.co/XYZ"]
+    assert _find_tco_urls("링크 없음") == []
+
+
+async def test_resolve_tco_link_follows_redirects():
+    """리다이렉트가 끝난 최종 URL 반환"""
+    def handler(request):
+        if request.url.host == "t.co":
+            return httpx.Response(301, headers={"location": "https://example.com/post"})
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert await _resolve_tco_link(client, "https://t.co/abc") == "https://example.com/post"
+
+
+async def test_resolve_tco_link_gives_up_after_max_hops():
+    """최대 횟수 안에 리다이렉트가 끝나지 않으면 중간 URL 대신 None (캐시되지 않음)"""
+    def handler(request):
+        hop = int(request.url.params.get("hop", 0))
+        return httpx.Response(302, headers={"location": f"https://example.com/loop?hop={hop + 1}"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert await _resolve_tco_link(client, "https://t.co/loop") is None
@@ -0,0 +1,73 @@
+"""
+Twitter URL 파싱 유틸리티 테스트
+"""
+
+import pytest
+
+from app.services.twitter_url_parser import build_tweet_url, extract_tweet_id, is_twitter_url
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://x.com/user/status/123",
+        "https://twitter.com/user/status/123",
+        "http://www.x.com/user",
+        "https://mobile.twitter.com/user/status/123",
+        "HTTPS://X.COM/user/status/123",
+        "https://Mobile.Twitter.com/user/status/123",
+        "https://x.com:443/user/status/123",
+        "http://twitter.com:8080",
+    ],
+)
+def test_is_twitter_url_true(url):
+    """Twitter/X 도메인 URL 인식"""
+    assert is_twitter_url(url) is True
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/x.com/status/123",
+        "https://notx.com/user/status/123",
+        "x.com/user/status/123",
+        "ftp://x.com/user",
+        "https://x.com:evil.com/user",
+        "",
+    ],
+)
+def test_is_twitter_url_false(url):
+    """Twitter/X가 아닌 URL 거부"""
+    assert is_twitter_url(url) is False
+
+
+def test_extract_tweet_id():
+    """트윗 ID 추출"""
+    assert extract_tweet_id("https://x.com/user/status/1234567890") == "1234567890"
+    assert extract_tweet_id("https://x.com/user/status/1234567890?s=20") == "1234567890"
+    assert extract_tweet_id("https://x.com/user/status/1234567890/photo/1") == "1234567890"
+
+
+def test_extract_tweet_id_missing():
+    """트윗 ID 없는 URL"""
+    assert extract_tweet_id("https://x.com/user") is None
+    assert extract_tweet_id("https://x.com/user/status/") is None
+    assert extract_tweet_id("https://x.com/i/article/abc") is None
+
+
+def test_build_tweet_url():
+    """정규 트윗 URL 생성"""
+    assert build_tweet_url("user", "123") == "https://x.com/user/status/123"
+
+
+def test_extract_tweet_id_skips_empty_status():
+    """숫자 없는 /status/ 뒤의 트윗 ID도 추출"""
+    assert extract_tweet_id("https://x.com/status/abc/user/status/42") == "42"
+
+
+def test_is_twitter_url_cached():
+    """같은 URL 반복 확인은 캐시에서 반환"""
+    is_twitter_url.cache_clear()
+    is_twitter_url("https://x.com/user/status/1")
+    is_twitter_url("https://x.com/user/status/1")
+    assert is_twitter_url.cache_info().hits == 1
@@ -0,0 +1,75 @@
+"""
+URL 콘텐츠 캐시 테스트
+"""
+
+import pytest
+
+from app.services import url_cache
+from app.services.url_fetcher import clear_url_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_db(tmp_path, monkeypatch):
+    """임시 디렉토리의 빈 캐시 DB + 빈 메모리 캐시 사용"""
+    monkeypatch.setattr(url_cache, "CACHE_DB_PATH", tmp_path / "url_cache.db")
+    monkeypatch.setattr(url_cache, "_conn", None)
+    clear_url_cache()
+    yield
+    clear_url_cache()
+    if url_cache._conn is not None:
+        url_cache._conn.close()
+
+
+def test_normalize_url_strips_tracking_params():
+    """추적용 쿼리 제거, 쿼리 정렬, host 소문자, fragment 제거"""
+    assert url_cache.normalize_url(
+        "https://Example.COM/Post?b=2&utm_source=x&a=1&fbclid=abc#top"
+    ) == "https://example.com/Post?a=1&b=2"
+
+
+def test_cache_key_includes_max_length():
+    """같은 URL이라도 max_length가 다르면 다른 키"""
+    url = "https://example.com/post"
+    assert url_cache.cache_key(url, 100) == url_cache.cache_key(url + "?utm_medium=social", 100)
+    assert url_cache.cache_key(url, 100) != url_cache.cache_key(url, 200)
+
+
+def test_store_and_load_both_tiers():
+    """메모리에서 빠져도 디스크에서 조회 후 메모리에 다시 올림"""
+    og = {"title": "제목", "image": None, "description": None, "fetch_failed": False, "fetch_message": None}
+    url_cache.store("k", "본문", og, ttl=60)
+    assert url_cache.load_memory("k")[1:] == ("본문", og)
+
+    url_cache._memory.clear()
+    assert url_cache.load_memory("k") is None
+    assert url_cache.load_disk("k")[1:] == ("본문", og)
+    assert url_cache.load_memory("k")[1:] == ("본문", og)
+
+
+def test_expired_entry_not_returned():
+    """만료된 항목은 두 단계 모두 None"""
+    url_cache.store("k", "본문", None, ttl=-1)
+    assert url_cache.load_memory("k") is None
+    assert url_cache.load_disk("k") is None
+
+
+def test_memory_cache_evicts_least_recently_used(monkeypatch):
+    """최대 크기를 넘으면 가장 오래 안 쓴 항목부터 제거"""
+    monkeypatch.setattr(url_cache, "MEMORY_CACHE_MAX_SIZE", 2)
+    url_cache.store("a", "A", None, ttl=60)
+    url_cache.store("b", "B", None, ttl=60)
+    url_cache.load_memory("a")
+    url_cache.store("c", "C", None, ttl=60)
+
+    assert url_cache.load_memory("b") is None
+    assert url_cache.load_memory("a") is not None
+    assert url_cache.load_memory("c") is not None
+
+
+def test_clear_removes_both_tiers():
+    """clear_url_cache()로 메모리/디스크 모두 비움"""
+    url_cache.store("k", "본문", None, ttl=60)
+    clear_url_cache()
+
+    assert url_cache.load_memory("k") is None
+    assert url_cache.load_disk("k") is None
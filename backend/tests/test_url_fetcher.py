@@ -0,0 +1,181 @@
+"""
+URL 콘텐츠 가져오기 테스트
+"""
+
+import httpx
+import pytest
+
+from app.services import url_fetcher
+from app.services.og_metadata import OGMetadata
+
+
+async def test_fetch_raw_text_reads_only_needed_bytes(monkeypatch):
+    """raw 텍스트는 max_length를 넘는지 알 만큼만 받고 잘라냄"""
+    body = "가" * 10_000
+    sent = {}
+
+    async def stream_body():
+        data = body.encode()
+        for i in range(0, len(data), 1000):
+            sent["bytes"] = i + 1000
+            yield data[i : i + 1000]
+
+    def handler(request):
+        if request.url.host == "raw.githubusercontent.com":
+            return httpx.Response(200, content=stream_body(), headers={"content-type": "text/plain; charset=utf-8"})
+        return httpx.Response(200, text='<meta property="og:title" content="repo">')
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(url_fetcher, "get_http_client", lambda: client)
+
+    content, og = await url_fetcher._fetch_raw_text(
+        "https://github.com/o/r/blob/main/a.md",
+        "https://raw.githubusercontent.com/o/r/main/a.md",
+        max_length=100,
+    )
+    await client.aclose()
+
+    assert content == "가" * 100 + "..."
+    assert og.title == "repo"
+    assert sent["bytes"] < len(body.encode())
+
+
+async def test_fetch_raw_text_keeps_short_connect_timeout(monkeypatch):
+    """요청 단위 타임아웃은 읽기만 늘리고 연결/풀 대기는 공유 클라이언트 설정 유지"""
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, text="본문")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(url_fetcher, "get_http_client", lambda: client)
+
+    await url_fetcher._fetch_raw_text(
+        "https://github.com/o/r/blob/main/a.md",
+        "https://raw.githubusercontent.com/o/r/main/a.md",
+        max_length=100,
+    )
+    await client.aclose()
+
+    assert len(timeouts) == 2
+    for timeout in timeouts:
+        assert timeout["read"] == url_fetcher.FETCH_TIMEOUT
+        assert timeout["connect"] == url_fetcher.settings.HTTP_CONNECT_TIMEOUT
+        assert timeout["pool"] == url_fetcher.settings.HTTP_POOL_TIMEOUT
+
+
+async def test_fetch_html_content_skips_binary(monkeypatch):
+    """PDF 등 텍스트가 아닌 응답은 본문을 받지 않고 바로 실패 처리 (Playwright 재시도 없음)"""
+    read = []
+
+    async def pdf_body():
+        read.append(True)
+        yield b"%PDF-1.7"
+
+    def handler(request):
+        return httpx.Response(200, content=pdf_body(), headers={"content-type": "application/pdf"})
+
+    async def no_playwright(*args, **kwargs):
+        raise AssertionError("Playwright should not run")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(url_fetcher, "get_http_client", lambda: client)
+    monkeypatch.setattr(url_fetcher, "fetch_with_playwright", no_playwright)
+
+    content, og = await url_fetcher._fetch_html_content("https://example.com/paper.pdf", 10000)
+    await client.aclose()
+
+    assert content is None
+    assert og.fetch_failed
+    assert not read
+
+
+@pytest.mark.parametrize(
+    ("content_type", "is_text"),
+    [
+        ("text/html; charset=utf-8", True),
+        ("text/markdown", True),
+        ("text/csv", True),
+        ("application/json", True),
+        ("application/rss+xml", True),
+        ("application/atom+xml", True),
+        ("application/ld+json", True),
+        ("", True),
+        ("application/pdf", False),
+        ("image/png", False),
+        ("application/octet-stream", False),
+        ("application/vnd.openxmlformats-officedocument.wordprocessingml.document", False),
+    ],
+)
+def test_is_text_response(content_type, is_text):
+    """text/*, +xml/+json, 모르는 타입은 텍스트, 알려진 바이너리만 제외"""
+    headers = {"content-type": content_type} if content_type else {}
+    assert url_fetcher._is_text_response(httpx.Response(200, headers=headers)) is is_text
+
+
+async def test_get_text_capped_retries_connection_errors(monkeypatch):
+    """연결 오류는 재시도, 연결/읽기 타임아웃은 바로 전파"""
+    monkeypatch.setattr(url_fetcher, "backoff_delay", lambda attempt: 0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("reset", request=request)
+        if request.url.path == "/slow":
+            raise httpx.ReadTimeout("slow", request=request)
+        if request.url.path == "/unreachable":
+            raise httpx.ConnectTimeout("unreachable", request=request)
+        return httpx.Response(200, text="ok")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response, text = await url_fetcher._get_text_capped(client, "https://example.com/", 1000)
+        assert (response.status_code, text, len(calls)) == (200, "ok", 2)
+
+        with pytest.raises(httpx.ReadTimeout):
+            await url_fetcher._get_text_capped(client, "https://example.com/slow", 1000)
+        assert len(calls) == 3
+
+        with pytest.raises(httpx.ConnectTimeout):
+            await url_fetcher._get_text_capped(client, "https://example.com/unreachable", 1000)
+        assert len(calls) == 4
+
+
+@pytest.mark.parametrize(
+    ("url", "kind"),
+    [
+        ("https://www.youtube.com/watch?v=abc", "youtube"),
+        ("https://youtu.be/abc", "youtube"),
+        ("https://x.com/user/status/1", "twitter"),
+        ("https://mobile.twitter.com/user", "twitter"),
+        ("https://X.com:443/user/status/1", "twitter"),
+        ("https://m.blog.naver.com/user/1", "naver_blog"),
+        ("https://github.com/owner/repo/blob/main/README.md", "github_blob"),
+        ("https://github.com/owner/repo", "generic"),
+        ("https://example.com/x.com", "generic"),
+        ("https://x.com.example.com/", "generic"),
+    ],
+)
+def test_classify_url(url, kind):
+    """정규식 한 번으로 처리 경로 분류"""
+    assert url_fetcher.classify_url(url) == kind
+
+
+async def test_fetch_url_content_skips_url_cache_for_tweets(monkeypatch):
+    """트윗은 URL 캐시에 저장하지 않음 (TwitterScraper 결과 캐시만 사용)"""
+    calls = []
+
+    async def fake_fetch(url, max_length, progress_callback=None):
+        calls.append(url)
+        return "본문", OGMetadata(title="t")
+
+    def fail_store(*args):
+        raise AssertionError("url_cache.store called")
+
+    monkeypatch.setattr(url_fetcher, "_fetch_url_content", fake_fetch)
+    monkeypatch.setattr(url_fetcher.url_cache, "store", fail_store)
+
+    for _ in range(2):
+        assert (await url_fetcher.fetch_url_content("https://x.com/user/status/1"))[0] == "본문"
+    assert len(calls) == 2
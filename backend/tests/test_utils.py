@@ -0,0 +1,28 @@
+"""
+공통 유틸리티 테스트
+"""
+
+from urllib.parse import urlparse
+
+import pytest
+
+from app.utils import url_netloc
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://Blog.Naver.com/user/1",
+        "http://youtu.be?v=1",
+        "https://user@x.com:443/path#frag",
+        "  https://m.youtube.com",
+        "//example.com/path",
+        "example.com/path",
+        "1http://example.com",
+        "mailto:someone@example.com",
+        "",
+    ],
+)
+def test_url_netloc_matches_urlparse(url):
+    """urlparse(url).netloc.lower()와 같은 결과"""
+    assert url_netloc(url) == urlparse(url).netloc.lower()
@@ -0,0 +1,39 @@
+"""
+YouTube 스크래퍼 테스트 (네트워크 요청 없이 가짜 함수 사용)
+"""
+
+import asyncio
+import threading
+import time
+
+from app.services import youtube_scraper as youtube_module
+from app.services.youtube_scraper import YouTubeScraper
+
+
+async def test_scrape_fetches_metadata_and_transcript_concurrently(monkeypatch):
+    """메타데이터와 자막을 동시에 가져오고, 자막은 워커 스레드에서 추출"""
+    scraper = YouTubeScraper()
+    main_thread = threading.get_ident()
+    transcript_threads = []
+
+    async def fake_metadata(video_id):
+        await asyncio.sleep(0.2)
+        return {"title": "제목", "author_name": "채널", "thumbnail_url": "thumb"}
+
+    def fake_transcript(video_id):
+        transcript_threads.append(threading.get_ident())
+        time.sleep(0.2)
+        return "자막", "ko"
+
+    monkeypatch.setattr(youtube_module, "YouTubeTranscriptApi", object())
+    monkeypatch.setattr(scraper, "_get_metadata", fake_metadata)
+    monkeypatch.setattr(scraper, "_fetch_transcript", fake_transcript)
+
+    started = time.perf_counter()
+    result = await scraper.scrape("https://youtu.be/abc123")
+    elapsed = time.perf_counter() - started
+
+    assert result.success
+    assert (result.og_title, result.content, result.language) == ("제목", "자막", "ko")
+    assert transcript_threads and transcript_threads[0] != main_thread
+    assert elapsed < 0.35